@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Micro-benchmark of query result parsing. Compares reading the records of a
+# buffered page with reading them from the streaming parser of typed queries,
+# on a synthetic page of VMRecords with metadata. The page is served from
+# memory in chunks, so no vCD server is needed.
+#
+# Usage: python3 benchmarks/query_streaming.py [--records N]
+#            [--iterations N]
+
+import argparse
+import timeit
+
+from pyvcloud.vcd.client import _objectify_content
+from pyvcloud.vcd.client import _TypedQuery
+from pyvcloud.vcd.client import QueryResultFormat
+
+NS = 'http://www.vmware.com/vcloud/v1.5'
+
+
+class _Response(object):
+    def __init__(self, content):
+        self._content = content
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self._content), chunk_size):
+            yield self._content[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+
+class _Client(object):
+    """Serves the same page to every streamed request."""
+
+    _huge_tree = False
+
+    def __init__(self, page):
+        self._page = page
+
+    def _get_resource_stream(self, uri):
+        return _Response(self._page)
+
+
+def query_page_document(num_records):
+    records = ''.join(
+        '    <VMRecord name="vm%d" numberOfCpus="2" memoryMB="4096" '
+        'status="POWERED_ON" containerName="vapp%d" '
+        'href="https://vcd.example.com/api/vApp/vm-%d">\n'
+        '        <Metadata><MetadataEntry key="owner">user%d'
+        '</MetadataEntry></Metadata>\n'
+        '    </VMRecord>\n' % (i, i, i, i) for i in range(num_records))
+    return ('<QueryResultRecords xmlns="%s" total="%d" page="1" '
+            'pageSize="%d">\n%s</QueryResultRecords>\n' %
+            (NS, num_records, num_records, records)).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark streamed and buffered query pages.')
+    parser.add_argument('--records', type=int, default=128)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    page = query_page_document(args.records)
+    query = _TypedQuery('vm', _Client(page), QueryResultFormat.RECORDS)
+
+    def buffered():
+        for record in query._page_records(_objectify_content(page)):
+            record.Metadata
+
+    def streamed():
+        for record in query._streaming_iterator('page'):
+            record.Metadata
+
+    print('%8s %8s  %-9s %10s' % ('records', 'bytes', 'mode', 'usec/page'))
+    for name, read in [('buffered', buffered), ('streamed', streamed)]:
+        seconds = min(
+            timeit.repeat(read, number=args.iterations, repeat=3))
+        print('%8d %8d  %-9s %10.1f' % (args.records, len(page), name,
+                                        seconds / args.iterations * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Micro-benchmark of the chunk reads of uploads. Compares reading each chunk
+# into a new bytes object with reading chunks into the reusable buffers
+# pyvcloud uses for uploads. Chunks are written to os.devnull in place of a
+# socket, so no vCD server is needed. Each mode runs in its own process to
+# report its peak RSS.
+#
+# Usage: python3 benchmarks/upload_chunks.py [--size-mb N] [--chunk-kb N]
+#            [--window N]
+
+import argparse
+import collections
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from pyvcloud.vcd.org import Org
+
+
+def read_chunks(f, size, chunk_size, window, sink):
+    # Keep up to window chunks alive, as the concurrent upload does.
+    in_flight = collections.deque()
+    read_bytes = 0
+    while read_bytes < size:
+        data = f.read(chunk_size)
+        in_flight.append(data)
+        if len(in_flight) > window:
+            in_flight.popleft()
+        os.write(sink, data)
+        read_bytes += len(data)
+
+
+def readinto_chunks(f, size, chunk_size, window, sink):
+    org = Org.__new__(Org)
+    buffers = collections.deque(
+        bytearray(min(chunk_size, size)) for i in range(window))
+    read_bytes = 0
+    while read_bytes < size:
+        buffer = buffers.popleft()
+        data_size = min(chunk_size, size - read_bytes)
+        os.write(sink, org._read_chunk(f, buffer, data_size))
+        buffers.append(buffer)
+        read_bytes += data_size
+
+
+MODES = {'read': (read_chunks, -1), 'readinto': (readinto_chunks, 0)}
+
+
+def run_child(mode, file_name, chunk_size, window):
+    reader, buffering = MODES[mode]
+    size = os.stat(file_name).st_size
+    sink = os.open(os.devnull, os.O_WRONLY)
+    try:
+        with open(file_name, 'rb', buffering=buffering) as f:
+            start = time.perf_counter()
+            reader(f, size, chunk_size, window, sink)
+            seconds = time.perf_counter() - start
+    finally:
+        os.close(sink)
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        max_rss //= 1024
+    print('%-10s %10.1f %12d' %
+          (mode, size / seconds / 2**20, max_rss // 1024))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark chunk reads of uploads.')
+    parser.add_argument('--size-mb', type=int, default=1024)
+    parser.add_argument('--chunk-kb', type=int, default=1024)
+    parser.add_argument('--window', type=int, default=2)
+    parser.add_argument('--child', nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    chunk_size = args.chunk_kb * 1024
+
+    if args.child is not None:
+        run_child(args.child[0], args.child[1], chunk_size, args.window)
+        return
+
+    fd, file_name = tempfile.mkstemp()
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            block = os.urandom(2**20)
+            for i in range(args.size_mb):
+                f.write(block)
+        print('%d MB file, %d KB chunks, %d chunks in flight' %
+              (args.size_mb, args.chunk_kb, args.window))
+        print('%-10s %10s %12s' % ('mode', 'MB/s', 'peak RSS MB'))
+        for mode in sorted(MODES):
+            subprocess.check_call([
+                sys.executable, __file__, '--chunk-kb', str(args.chunk_kb),
+                '--window', str(args.window), '--child', mode, file_name
+            ])
+    finally:
+        os.unlink(file_name)
+
+
+if __name__ == '__main__':
+    main()
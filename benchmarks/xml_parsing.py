@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Micro-benchmark of response parsing. Compares the lxml default parsers
+# with the shared parsers pyvcloud uses for vCD responses, on synthetic
+# documents shaped like common vCD responses. No vCD server is needed.
+#
+# Usage: python3 benchmarks/xml_parsing.py [--iterations N]
+
+import argparse
+import timeit
+
+from lxml import etree
+from lxml import objectify
+
+from pyvcloud.vcd.client import _objectify_content
+
+NS = 'http://www.vmware.com/vcloud/v1.5'
+
+
+def _links(count, indent):
+    return ''.join(
+        '%s<Link rel="down" type="application/vnd.vmware.vcloud.t%d+xml" '
+        'href="https://vcd.example.com/api/x/%d"/>\n' % (indent, i, i)
+        for i in range(count))
+
+
+def task_document():
+    return ('<Task xmlns="%s" status="running" operation="Deploying" '
+            'href="https://vcd.example.com/api/task/1">\n'
+            '    <Owner href="https://vcd.example.com/api/vApp/vapp-1"/>\n'
+            '    <Progress>42</Progress>\n'
+            '%s</Task>\n' % (NS, _links(3, '    '))).encode()
+
+
+def vapp_document(num_vms=20):
+    vms = ''.join(
+        '        <Vm name="vm%d" status="4" '
+        'href="https://vcd.example.com/api/vApp/vm-%d">\n'
+        '%s'
+        '            <Description>vm %d</Description>\n'
+        '        </Vm>\n' % (i, i, _links(15, '            '), i)
+        for i in range(num_vms))
+    return ('<VApp xmlns="%s" name="vapp" status="4" '
+            'href="https://vcd.example.com/api/vApp/vapp-1">\n'
+            '%s'
+            '    <Children>\n%s    </Children>\n'
+            '</VApp>\n' % (NS, _links(40, '    '), vms)).encode()
+
+
+def query_page_document(page_size=128):
+    records = ''.join(
+        '    <VMRecord name="vm%d" numberOfCpus="2" memoryMB="4096" '
+        'status="POWERED_ON" containerName="vapp%d" '
+        'href="https://vcd.example.com/api/vApp/vm-%d"/>\n' % (i, i, i)
+        for i in range(page_size))
+    return ('<QueryResultRecords xmlns="%s" total="10000" page="1" '
+            'pageSize="%d">\n%s</QueryResultRecords>\n' %
+            (NS, page_size, records)).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark parsing of vCD responses.')
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    documents = [('task', task_document()), ('vapp', vapp_document()),
+                 ('query page', query_page_document())]
+    parsers = [
+        ('objectify default', objectify.fromstring),
+        ('objectify shared', lambda doc: _objectify_content(doc, True)),
+        ('etree default', etree.fromstring),
+        ('etree shared', lambda doc: _objectify_content(doc, False)),
+    ]
+
+    print('%-12s %8s  %-18s %10s' % ('response', 'bytes', 'parser',
+                                     'usec/doc'))
+    for name, doc in documents:
+        for parser_name, parse in parsers:
+            seconds = min(
+                timeit.repeat(lambda: parse(doc), number=args.iterations,
+                              repeat=3))
+            print('%-12s %8d  %-18s %10.1f' %
+                  (name, len(doc), parser_name,
+                   seconds / args.iterations * 1e6))
+
+
+if __name__ == '__main__':
+    main()
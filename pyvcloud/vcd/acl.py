@@ -24,7 +24,8 @@ from pyvcloud.vcd.utils import get_admin_href
 
 
 class Acl(object):
-    def __init__(self, client, parent_resource, resource=None):
+    def __init__(self, client, parent_resource, resource=None,
+                 link_index=None):
         """Constructor for Acl object.
 
         :param pyvcloud.vcd.client.Client client: the client that will be used
@@ -35,10 +36,13 @@ class Acl(object):
         :param lxml.objectify.ObjectifiedElement resource: object
             containing EntityType.CONTROL_ACCESS_PARAMS XML data representing
             the Access Control List of the parent object.
+        :param dict link_index: links of parent_resource as returned by
+            index_links(), looked up instead of scanning parent_resource.
         """
         self.client = client
         self.parent_resource = parent_resource
         self.resource = resource
+        self.link_index = link_index
 
     def get_resource(self):
         """Fetches the XML representation of the Access Control List from vCD.
@@ -53,7 +57,8 @@ class Acl(object):
         if self.resource is None:
             self.resource = self.client.get_linked_resource(
                 self.parent_resource, RelationType.DOWN,
-                EntityType.CONTROL_ACCESS_PARAMS.value)
+                EntityType.CONTROL_ACCESS_PARAMS.value,
+                link_index=self.link_index)
         return self.resource
 
     def update_resource(self, control_access_params):
@@ -75,13 +80,15 @@ class Acl(object):
                 put_linked_resource(self.parent_resource,
                                     RelationType.CONTROL_ACCESS,
                                     EntityType.CONTROL_ACCESS_PARAMS.value,
-                                    control_access_params)
+                                    control_access_params,
+                                    link_index=self.link_index)
         else:
             self.resource = self.client. \
                 post_linked_resource(self.parent_resource,
                                      RelationType.CONTROL_ACCESS,
                                      EntityType.CONTROL_ACCESS_PARAMS.value,
-                                     control_access_params)
+                                     control_access_params,
+                                     link_index=self.link_index)
         return self.resource
 
     def get_access_settings(self):
@@ -337,13 +344,15 @@ class Acl(object):
         if 'VApp' in self.parent_resource.tag:
             # for vapp, have to get the org via vdc
             vdc_href = find_link(self.parent_resource, RelationType.UP,
-                                 EntityType.VDC.value).href
+                                 EntityType.VDC.value,
+                                 link_index=self.link_index).href
             return find_link(
                 self.client.get_resource(vdc_href), RelationType.UP,
                 EntityType.ORG.value).href
         else:
             return find_link(self.parent_resource, RelationType.UP,
-                             EntityType.ORG.value).href
+                             EntityType.ORG.value,
+                             link_index=self.link_index).href
 
     @staticmethod
     def search_for_access_setting_by_subject(subject_name, subject_type,
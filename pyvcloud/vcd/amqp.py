@@ -13,11 +13,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from collections import OrderedDict
+import logging
+import ssl
+import threading
+
+from lxml import etree
+
+from pyvcloud.vcd.client import _get_parser
 from pyvcloud.vcd.client import _WellKnownEndpoint
 from pyvcloud.vcd.client import E_VMEXT
 from pyvcloud.vcd.client import EntityType
+from pyvcloud.vcd.client import NSMAP
 from pyvcloud.vcd.exceptions import ClientException
 
+try:
+    import pika
+except ImportError:
+    pika = None
+
 
 class AmqpService(object):
     def __init__(self, client):
@@ -97,3 +112,305 @@ class AmqpService(object):
         return self.client.put_resource(self.href,
                                         self._to_settings(config, password),
                                         EntityType.AMQP_SETTINGS.value)
+
+
+def _get_task_uuid(task_ref):
+    """Extract the uuid from a task href, urn or uuid.
+
+    :param str task_ref: e.g. 'https://vcd/api/task/<uuid>' or
+        'urn:vcloud:task:<uuid>'.
+
+    :return: the task uuid.
+
+    :rtype: str
+    """
+    return task_ref.replace(':', '/').rstrip('/').split('/')[-1]
+
+
+class TaskNotificationListener(object):
+    """Records task completion notifications published by vCD.
+
+    The listener is transport agnostic: whatever receives vCD notification
+    messages hands their bodies to dispatch(). AmqpTaskNotificationListener
+    does so for an AMQP broker; tests can call dispatch() directly to act as
+    an in-process broker.
+
+    Register the listener with a task monitor using
+    client.get_task_monitor().set_notification_listener(). Waits then return
+    as soon as a notification for their task arrives instead of sleeping
+    until the next poll. Task status is still read from vCD, and polling
+    continues at the monitor's normal rate, so notifications missed while
+    the transport is down only delay completion until the next poll.
+
+    Each notification gets a sequence number. A wait only returns early for
+    notifications numbered after the marker it is given, so a notification
+    that already woke a wait does not wake the next one.
+
+    :param int max_remembered: number of completed task ids remembered, to
+        cover notifications that arrive between a marker and its wait.
+    """
+
+    TASK_COMPLETION_EVENTS = [
+        'com/vmware/vcloud/event/task/complete',
+        'com/vmware/vcloud/event/task/fail',
+        'com/vmware/vcloud/event/task/abort'
+    ]
+
+    def __init__(self, max_remembered=10000):
+        self._max_remembered = max_remembered
+        self._sequence = 0
+        self._completed = OrderedDict()
+        self._async_waiters = []
+        self._condition = threading.Condition()
+
+    def dispatch(self, body):
+        """Process the body of a vCD notification message.
+
+        Notifications other than task completion are ignored.
+
+        :param bytes body: vmext:Notification XML document.
+
+        :return: uuids of the tasks the notification reports as finished.
+
+        :rtype: list
+        """
+        notification = etree.fromstring(body, _get_parser(as_object=False))
+        if notification.get('type') not in self.TASK_COMPLETION_EVENTS:
+            return []
+        task_uuids = []
+        for link in notification.iterfind('{%s}EntityLink' % NSMAP['vmext']):
+            if link.get('type') == 'vcloud:task' and \
+               link.get('id') is not None:
+                task_uuids.append(_get_task_uuid(link.get('id')))
+        if len(task_uuids) > 0:
+            self.notify(task_uuids)
+        return task_uuids
+
+    def notify(self, task_refs):
+        """Mark tasks as finished and wake up waits for them.
+
+        :param list task_refs: task hrefs, urns or uuids.
+        """
+        with self._condition:
+            self._sequence += 1
+            task_uuids = set()
+            for task_ref in task_refs:
+                task_uuid = _get_task_uuid(task_ref)
+                task_uuids.add(task_uuid)
+                self._completed[task_uuid] = self._sequence
+                self._completed.move_to_end(task_uuid)
+            while len(self._completed) > self._max_remembered:
+                self._completed.popitem(last=False)
+            self._condition.notify_all()
+            for loop, future, waited_uuids in self._async_waiters:
+                if not task_uuids.isdisjoint(waited_uuids):
+                    try:
+                        loop.call_soon_threadsafe(_set_future_done, future)
+                    except RuntimeError:
+                        # The waiting loop is closed.
+                        pass
+
+    def get_marker(self):
+        """Return a marker of the notifications received so far.
+
+        Take a marker before polling a task, and pass it to the wait that
+        follows the poll: a notification arriving while the poll is in
+        flight then ends the wait at once.
+
+        :return: the marker.
+
+        :rtype: int
+        """
+        with self._condition:
+            return self._sequence
+
+    def _is_notified(self, task_uuids, marker):
+        return any(self._completed.get(task_uuid, 0) > marker
+                   for task_uuid in task_uuids)
+
+    def wait(self, task_refs, timeout, marker=None):
+        """Wait for a completion notification of any of the given tasks.
+
+        :param list task_refs: task hrefs, urns or uuids.
+        :param float timeout: maximum time to wait, in seconds.
+        :param int marker: only notifications received after get_marker()
+            returned this marker end the wait. None only considers
+            notifications received during the wait.
+
+        :return: True if a notification arrived, False on timeout.
+
+        :rtype: bool
+        """
+        task_uuids = [_get_task_uuid(task_ref) for task_ref in task_refs]
+        with self._condition:
+            if marker is None:
+                marker = self._sequence
+            return self._condition.wait_for(
+                lambda: self._is_notified(task_uuids, marker), timeout)
+
+    async def async_wait(self, task_refs, timeout, marker=None):
+        """Wait for a completion notification without blocking the loop.
+
+        Parameters and result are the same as for wait().
+        """
+        loop = asyncio.get_event_loop()
+        task_uuids = frozenset(
+            _get_task_uuid(task_ref) for task_ref in task_refs)
+        future = loop.create_future()
+        waiter = (loop, future, task_uuids)
+        with self._condition:
+            if marker is None:
+                marker = self._sequence
+            if self._is_notified(task_uuids, marker):
+                return True
+            self._async_waiters.append(waiter)
+        try:
+            done, _ = await asyncio.wait([future], timeout=timeout)
+            return len(done) > 0
+        finally:
+            future.cancel()
+            with self._condition:
+                self._async_waiters.remove(waiter)
+
+
+def _set_future_done(future):
+    if not future.done():
+        future.set_result(True)
+
+
+class AmqpTaskNotificationListener(TaskNotificationListener):
+    """Receives task completion notifications from vCD's AMQP broker.
+
+    Notifications must be enabled in vCD. A background thread binds an
+    exclusive queue to the notification exchange and reconnects whenever
+    the connection is lost. Requires the pika package, e.g.
+    pip install pyvcloud[amqp].
+
+    :param str host: AMQP broker host.
+    :param int port: AMQP broker port.
+    :param str username: AMQP user name.
+    :param str password: AMQP password.
+    :param str exchange: exchange vCD publishes notifications to.
+    :param str vhost: AMQP virtual host.
+    :param bool use_ssl: if True connect over TLS.
+    :param bool ssl_accept_all: if True accept any broker certificate.
+    :param str routing_key: binding key of the queue. The default receives
+        every notification; non task-completion ones are discarded.
+    :param float reconnect_delay: seconds to wait before reconnecting.
+    :param int max_remembered: see TaskNotificationListener.
+    """
+
+    def __init__(self,
+                 host,
+                 port,
+                 username,
+                 password,
+                 exchange,
+                 vhost='/',
+                 use_ssl=False,
+                 ssl_accept_all=False,
+                 routing_key='#',
+                 reconnect_delay=5,
+                 max_remembered=10000):
+        if pika is None:
+            raise ClientException(
+                'AmqpTaskNotificationListener requires the pika package.')
+        super(AmqpTaskNotificationListener,
+              self).__init__(max_remembered=max_remembered)
+        ssl_options = None
+        if use_ssl:
+            context = ssl.create_default_context()
+            if ssl_accept_all:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            ssl_options = pika.SSLOptions(context, host)
+        self._parameters = pika.ConnectionParameters(
+            host=host,
+            port=int(port),
+            virtual_host=vhost,
+            credentials=pika.PlainCredentials(username, password),
+            ssl_options=ssl_options)
+        self._exchange = exchange
+        self._routing_key = routing_key
+        self._reconnect_delay = reconnect_delay
+        self._stopped = threading.Event()
+        self._thread = None
+        self._logger = logging.getLogger(__name__)
+
+    @classmethod
+    def from_settings(cls, settings, password, **kwargs):
+        """Create a listener from vCD AMQP settings.
+
+        :param lxml.objectify.ObjectifiedElement settings: AMQP settings as
+            returned by AmqpService.get_settings().
+        :param str password: password of the AMQP user, which vCD does not
+            return.
+        :param kwargs: other AmqpTaskNotificationListener parameters.
+
+        :rtype: AmqpTaskNotificationListener
+        """
+        return cls(
+            host=settings.AmqpHost.text,
+            port=settings.AmqpPort.text,
+            username=settings.AmqpUsername.text,
+            password=password,
+            exchange=settings.AmqpExchange.text,
+            vhost=settings.AmqpVHost.text,
+            use_ssl=settings.AmqpUseSSL.text == 'true',
+            ssl_accept_all=settings.AmqpSslAcceptAll.text == 'true',
+            **kwargs)
+
+    def start(self):
+        """Start consuming notifications on a background thread."""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._consume, name='vcd-amqp-listener', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop consuming notifications and wait for the thread to exit."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _connect(self):
+        return pika.BlockingConnection(self._parameters)
+
+    def _consume(self):
+        # Any error ends the connection but not the thread, which
+        # reconnects, so that notifications resume once the broker is back.
+        while not self._stopped.is_set():
+            try:
+                connection = self._connect()
+                try:
+                    channel = connection.channel()
+                    queue = channel.queue_declare(
+                        queue='', exclusive=True,
+                        auto_delete=True).method.queue
+                    channel.queue_bind(
+                        queue=queue,
+                        exchange=self._exchange,
+                        routing_key=self._routing_key)
+                    for method, _, body in channel.consume(
+                            queue, auto_ack=True, inactivity_timeout=1):
+                        if self._stopped.is_set():
+                            break
+                        if method is None:
+                            continue
+                        try:
+                            self.dispatch(body)
+                        except Exception:
+                            self._logger.warning(
+                                'Ignoring notification that could not be '
+                                'processed.', exc_info=True)
+                finally:
+                    if connection.is_open:
+                        connection.close()
+            except Exception:
+                self._logger.warning(
+                    'AMQP connection lost, falling back to polling until '
+                    'reconnected.', exc_info=True)
+                self._stopped.wait(self._reconnect_delay)
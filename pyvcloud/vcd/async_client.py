@@ -0,0 +1,370 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from lxml import etree
+
+from pyvcloud.vcd.client import _objectify_content
+from pyvcloud.vcd.client import _TaskMonitor
+from pyvcloud.vcd.client import _TypedQuery
+from pyvcloud.vcd.client import _WellKnownEndpoint
+from pyvcloud.vcd.client import Client
+from pyvcloud.vcd.client import QueryResultFormat
+from pyvcloud.vcd.client import RelationType
+from pyvcloud.vcd.exceptions import ClientException
+from pyvcloud.vcd.exceptions import MissingRecordException
+from pyvcloud.vcd.exceptions import MultipleRecordsException
+from pyvcloud.vcd.exceptions import OperationNotSupportedException
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncClient(object):
+    """An asyncio interface to the vCloud Director REST API.
+
+    AsyncClient issues requests on behalf of an already authenticated
+    Client, reusing its server URI, API version, session token and logging
+    settings, but performs all I/O on a non-blocking aiohttp transport.
+    This lets a single event loop drive many concurrent vCD calls.
+
+    Results and exceptions are the same as for the matching Client methods.
+    The aiohttp package is required, e.g. pip install pyvcloud[async].
+
+    An AsyncClient can be used on successive event loops, e.g. by several
+    asyncio.run() calls, but not on several event loops at the same time.
+    Its connections belong to the loop that opened them: call close() on
+    that loop before it ends, and before using the client on another loop.
+
+    :param pyvcloud.vcd.client.Client client: a logged in client.
+    :param int limit: maximum number of simultaneous connections.
+    :param int limit_per_host: maximum number of simultaneous connections
+        to the vCD host, 0 means no limit other than limit.
+    :param float timeout: total timeout in seconds of a single request, or
+        None for no timeout.
+    """
+
+    def __init__(self, client, limit=100, limit_per_host=0, timeout=None):
+        if aiohttp is None:
+            raise ClientException(
+                'AsyncClient requires the aiohttp package.')
+        if client._session is None:
+            raise ClientException('Client is not logged in.')
+        self._client = client
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._timeout = timeout
+        self._session = None
+        self._session_loop = None
+        self._query_list_map = None
+        self._task_monitor = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def get_client(self):
+        """Return the synchronous client this async client is bound to.
+
+        :rtype: pyvcloud.vcd.client.Client
+        """
+        return self._client
+
+    def get_task_monitor(self):
+        """Return a task monitor whose async waits poll through this client.
+
+        :rtype: pyvcloud.vcd.client._TaskMonitor
+        """
+        if self._task_monitor is None:
+            self._task_monitor = _TaskMonitor(self._client, async_client=self)
+        return self._task_monitor
+
+    async def close(self):
+        """Release the connections held by the async transport.
+
+        The underlying Client is not logged out.
+
+        :raises ClientException: if the connections were opened on another
+            event loop.
+        """
+        if self._session is not None:
+            if not self._session.closed:
+                self._check_session_loop()
+            session = self._session
+            self._session = None
+            self._session_loop = None
+            await session.close()
+
+    def _check_session_loop(self):
+        """Check that the open session belongs to the running event loop.
+
+        :raises ClientException: if the session was opened on another event
+            loop, where it must be closed.
+        """
+        if self._session_loop is not asyncio.get_event_loop():
+            raise ClientException(
+                'AsyncClient connections are open on another event loop, '
+                'close() the client there first.')
+
+    def _get_session(self):
+        # aiohttp sessions are bound to the event loop they are created on,
+        # hence they are created lazily from within a coroutine, and again
+        # when the client runs on a new loop once closed on the previous
+        # one. Sessions can only be closed on their own loop, so the client
+        # refuses to move to a new loop while its session is open.
+        if self._session is not None and not self._session.closed:
+            self._check_session_loop()
+        else:
+            client = self._client
+            connector = aiohttp.TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                ssl=None if client._verify_ssl_certs else False)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self._timeout))
+            self._session_loop = asyncio.get_event_loop()
+        return self._session
+
+    def _log_request_response(self, method, uri, request_headers,
+                              request_body, status, response_headers,
+                              response_body):
+        client = self._client
+        if not client._log_requests:
+            return
+        logger = client._logger
+        logger.debug('Request uri (%s): %s' % (method, uri))
+        if client._log_headers:
+            logger.debug('Request headers: %s' %
+                         client._redact_headers(request_headers))
+        if client._log_bodies and request_body is not None:
+            if isinstance(request_body, str):
+                body = request_body
+            else:
+                body = request_body.decode(client.fsencoding)
+            logger.debug('Request body: %s' % body)
+        logger.debug('Response status code: %s' % status)
+        if client._log_headers:
+            logger.debug('Response headers: %s' %
+                         client._redact_headers(response_headers))
+        if client._log_bodies and response_body:
+            logger.debug('Response body: %s' %
+                         response_body.decode(client.fsencoding))
+
+    async def _do_request(self,
+                          method,
+                          uri,
+                          contents=None,
+                          media_type=None,
+                          objectify_results=True,
+                          params=None):
+        client = self._client
+        token = client._get_auth_token()
+        if token is None:
+            raise ClientException('Client is not logged in.')
+        # The token is read on every request, since the Client replaces it
+        # when it logs in again.
+        headers = client._build_request_headers(media_type)
+        headers[Client._HEADER_X_VCLOUD_AUTH_NAME] = token
+        data = client._serialize_contents(contents)
+        if method != 'GET':
+            client._invalidate_cached_resource(uri)
+        async with self._get_session().request(
+                method, uri, params=params, data=data,
+                headers=headers) as response:
+            content = await response.read()
+            sc = response.status
+            request_id = response.headers.get(Client._HEADER_REQUEST_ID_NAME)
+            self._log_request_response(method, str(response.url), headers,
+                                       data, sc, dict(response.headers),
+                                       content)
+
+        if 200 <= sc <= 299:
+            return _objectify_content(content, objectify_results,
+                                      client._huge_tree)
+
+        client._response_code_to_exception(
+            sc, request_id,
+            _objectify_content(content, objectify_results,
+                               client._huge_tree))
+
+    async def get_resource(self, uri, params=None, objectify_results=True):
+        """Gets the specified contents to the specified resource.
+
+        This method does an HTTP GET.
+        """
+        return await self._do_request(
+            'GET', uri, objectify_results=objectify_results, params=params)
+
+    async def put_resource(self,
+                           uri,
+                           contents,
+                           media_type,
+                           params=None,
+                           objectify_results=True):
+        """Puts the specified contents to the specified resource.
+
+        This method does an HTTP PUT.
+        """
+        return await self._do_request(
+            'PUT',
+            uri,
+            contents=contents,
+            media_type=media_type,
+            objectify_results=objectify_results,
+            params=params)
+
+    async def post_resource(self,
+                            uri,
+                            contents,
+                            media_type,
+                            params=None,
+                            objectify_results=True):
+        """Posts to a resource link.
+
+        Posts the specified contents to the specified resource. (Does an HTTP
+        POST.)
+        """
+        return await self._do_request(
+            'POST',
+            uri,
+            contents=contents,
+            media_type=media_type,
+            objectify_results=objectify_results,
+            params=params)
+
+    async def delete_resource(self,
+                              uri,
+                              params=None,
+                              force=False,
+                              recursive=False):
+        full_uri = '%s?force=%s&recursive=%s' % (uri, force, recursive)
+        return await self._do_request('DELETE', full_uri, params=params)
+
+    async def _get_query_list_map(self):
+        if self._query_list_map is None:
+            if self._client._query_list_map is not None:
+                self._query_list_map = self._client._query_list_map
+            else:
+                query_list_map = {}
+                query_list = await self.get_resource(
+                    self._client._get_wk_endpoint(
+                        _WellKnownEndpoint.QUERY_LIST))
+                for link in query_list.Link:
+                    query_list_map[(link.get('type'),
+                                    link.get('name'))] = link.get('href')
+                self._query_list_map = query_list_map
+        return self._query_list_map
+
+    def get_typed_query(self,
+                        query_type_name,
+                        query_result_format=QueryResultFormat.REFERENCES,
+                        page_size=None,
+                        include_links=False,
+                        qfilter=None,
+                        equality_filter=None,
+                        sort_asc=None,
+                        sort_desc=None,
+                        fields=None):
+        """Issue a typed query using vCD query API.
+
+        Parameters are the same as for Client.get_typed_query().
+
+        :return: A query object whose execute() method returns an
+            asynchronous generator of result records, e.g.
+            'async for record in query.execute()'.
+
+        :rtype: pyvcloud.vcd.async_client._AsyncTypedQuery
+        """
+        return _AsyncTypedQuery(
+            query_type_name,
+            self,
+            query_result_format,
+            page_size=page_size,
+            include_links=include_links,
+            qfilter=qfilter,
+            equality_filter=equality_filter,
+            sort_asc=sort_asc,
+            sort_desc=sort_desc,
+            fields=fields)
+
+
+class _AsyncTypedQuery(_TypedQuery):
+    """Typed query whose pages are fetched through an AsyncClient."""
+
+    def __init__(self, query_type_name, async_client, query_result_format,
+                 **kwargs):
+        super(_AsyncTypedQuery, self).__init__(
+            query_type_name, async_client.get_client(), query_result_format,
+            **kwargs)
+        self._async_client = async_client
+
+    async def execute(self):
+        """Executes query and yields results.
+
+        :return: An asynchronous generator of result records.
+
+        :rtype: async_generator object
+        """
+        (query_media_type, _) = self._query_result_format.value
+        query_list_map = await self._async_client._get_query_list_map()
+        query_href = query_list_map.get(
+            (query_media_type, self._query_type_name))
+        if query_href is None:
+            self._client._logger.warning(
+                'Unable to locate query href for \'%s\' typed query.' %
+                self._query_type_name)
+            raise OperationNotSupportedException('Unable to execute query.')
+        query_uri = self._build_query_uri(
+            query_href,
+            self._page,
+            self._page_size,
+            self._filter,
+            self._include_links,
+            fields=self.fields)
+        query_results = await self._async_client.get_resource(query_uri)
+        while True:
+            next_page_uri = None
+            for r in query_results.iterchildren():
+                tag = etree.QName(r.tag)
+                if tag.localname == 'Link':
+                    if r.get('rel') == RelationType.NEXT_PAGE.value:
+                        next_page_uri = r.get('href')
+                else:
+                    yield r
+            if next_page_uri is None:
+                break
+            query_results = await self._async_client.get_resource(
+                next_page_uri)
+
+    async def find_unique(self):
+        """Convenience wrapper over execute().
+
+        Convenience wrapper over execute() for the case where exactly one match
+        is expected.
+        """
+        items = []
+        async for item in self.execute():
+            items.append(item)
+            if len(items) > 1:
+                raise MultipleRecordsException()
+        if len(items) == 0:
+            raise MissingRecordException()
+        return items[0]
@@ -13,30 +13,42 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import abc
 import asyncio
-from datetime import datetime
-from datetime import timedelta
+import collections
+import concurrent.futures
 from distutils.version import StrictVersion
 from enum import Enum
+import hashlib
+import itertools
 import json
+import keyword
 import logging
 import logging.handlers as handlers
 from pathlib import Path
+import random
+import re
 import sys
+import threading
 import time
 import urllib
 
 from lxml import etree
 from lxml import objectify
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.connectionpool import HTTPSConnectionPool
+from urllib3.poolmanager import PoolManager
 
 from pyvcloud.vcd.exceptions import AccessForbiddenException, \
     BadRequestException, ClientException, ConflictException, \
     EntityNotFoundException, InternalServerException, \
-    InvalidContentLengthException, MethodNotAllowedException, \
-    MissingLinkException, MissingRecordException, MultipleLinksException, \
-    MultipleRecordsException, NotAcceptableException, NotFoundException, \
-    OperationNotSupportedException, RequestTimeoutException,\
+    DownloadException, InvalidContentLengthException, \
+    InvalidParameterException, \
+    MethodNotAllowedException, MissingLinkException, MissingRecordException, \
+    MultipleLinksException, MultipleRecordsException, NotAcceptableException, \
+    NotFoundException, OperationNotSupportedException, RequestTimeoutException,\
     TaskTimeoutException, UnauthorizedException, UnknownApiException, \
     UnsupportedMediaTypeException, VcdException, VcdResponseException, \
     VcdTaskException  # NOQA
@@ -511,29 +523,120 @@ def _get_session_endpoints(session):
     return smap
 
 
+def _is_replayable(contents):
+    """Check whether a request body can be sent again.
+
+    :param contents: a request body.
+
+    :return: True for bodies that are serialized anew for each request,
+        False for streams, which are consumed by the first request.
+
+    :rtype: bool
+    """
+    return contents is None or etree.iselement(contents) or \
+        isinstance(contents, (bytes, str, dict))
+
+
 def _response_has_content(response):
     return response.content is not None and len(response.content) > 0
 
 
-def _objectify_response(response, as_object=True):
+def _objectify_response(response, as_object=True, huge_tree=False):
     """Convert XML response content to an lxml object.
 
     :param str response: an XML response as a string.
     :param boolean as_object: If True convert to an
         lxml.objectify.ObjectifiedElement where XML properties look like
         python object attributes.
+    :param boolean huge_tree: if True lift the size and depth limits
+        lxml puts on documents.
 
     :return: lxml.objectify.ObjectifiedElement or xml.etree.ElementTree object.
 
     :rtype: lxml.objectify.ObjectifiedElement
     """
     if _response_has_content(response):
+        return _objectify_content(response.content, as_object, huge_tree)
+    else:
+        return None
+
+
+_parsers = threading.local()
+
+
+def _get_parser(as_object=True, huge_tree=False):
+    """Return the XML parser of the calling thread for vCD responses.
+
+    Parsers are reused across documents as creating one is costly, but lxml
+    parsers must not be shared by threads. They drop whitespace-only text
+    and never load DTDs, resolve entities or access the network, which
+    makes parsing faster and immune to XML external entity attacks.
+
+    :param boolean as_object: if True the parser builds
+        lxml.objectify.ObjectifiedElement trees, else plain etree trees.
+    :param boolean huge_tree: if True lift the size and depth limits
+        lxml puts on documents.
+
+    :rtype: lxml.etree.XMLParser
+    """
+    key = (as_object, huge_tree)
+    parsers = getattr(_parsers, 'parsers', None)
+    if parsers is None:
+        parsers = _parsers.parsers = {}
+    parser = parsers.get(key)
+    if parser is None:
+        options = {
+            'remove_blank_text': True,
+            'resolve_entities': False,
+            'no_network': True,
+            'load_dtd': False,
+            'huge_tree': huge_tree
+        }
         if as_object:
-            return objectify.fromstring(response.content)
+            parser = objectify.makeparser(**options)
         else:
-            return etree.fromstring(response.content)
-    else:
+            parser = etree.XMLParser(**options)
+        parsers[key] = parser
+    return parser
+
+
+def _objectify_content(content, as_object=True, huge_tree=False):
+    """Convert XML content to an lxml object.
+
+    :param bytes content: XML document.
+    :param boolean as_object: If True convert to an
+        lxml.objectify.ObjectifiedElement where XML properties look like
+        python object attributes.
+    :param boolean huge_tree: if True lift the size and depth limits
+        lxml puts on documents.
+
+    :return: lxml.objectify.ObjectifiedElement or xml.etree.ElementTree object
+        or None if there is no content.
+
+    :rtype: lxml.objectify.ObjectifiedElement
+    """
+    if content is None or len(content) == 0:
         return None
+    return etree.fromstring(content, _get_parser(as_object, huge_tree))
+
+
+def _is_json_media_type(content_type):
+    """Tell if a Content-Type header denotes a JSON document.
+
+    :param str content_type: Content-Type header, with its parameters, or
+        None.
+
+    :return: True for application/json and application/*+json media types,
+        e.g. application/vnd.vmware.vcloud.org+json.
+
+    :rtype: bool
+    """
+    if content_type is None:
+        return False
+    media_type = content_type.split(';', 1)[0].strip().lower()
+    return media_type == 'application/json' or \
+        (media_type.startswith('application/') and
+         media_type.endswith('+json'))
 
 
 class TaskStatus(Enum):
@@ -561,17 +664,195 @@ class VAppPowerStatus(Enum):
     UNDEPLOYED = '1'
 
 
+class PollingStrategy(abc.ABC):
+    """Decides how long a task monitor waits between two polls of a task.
+
+    Strategies must be stateless across waits: all state is passed in, so
+    a single instance can serve many concurrent waits.
+    """
+
+    @abc.abstractmethod
+    def next_delay(self, attempt, elapsed, task=None):
+        """Return the number of seconds to wait before the next poll.
+
+        :param int attempt: number of polls done so far, starting at 1.
+        :param float elapsed: seconds since the wait started.
+        :param lxml.objectify.ObjectifiedElement task: the latest polled
+            task, if available.
+
+        :return: delay in seconds.
+
+        :rtype: float
+        """
+
+
+class FixedPolling(PollingStrategy):
+    """Polls at a fixed interval.
+
+    :param float interval: seconds between polls.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+
+    def next_delay(self, attempt, elapsed, task=None):
+        return self.interval
+
+
+class ExponentialBackoffPolling(PollingStrategy):
+    """Polls quickly at first, then backs off exponentially up to a cap.
+
+    Short tasks are therefore noticed within a fraction of a second while
+    long running tasks are polled rarely. Random jitter spreads the polls
+    of tasks started together.
+
+    If use_progress is True and the task reports a Progress percentage,
+    the remaining time is extrapolated from the elapsed time and used as
+    the next delay when it is shorter than the backoff delay.
+
+    :param float initial: delay after the first poll, in seconds.
+    :param float factor: multiplier applied to the delay after each poll.
+    :param float max_delay: upper bound of the delay, in seconds.
+    :param float jitter: fraction of the delay randomly added or
+        subtracted, between 0 and 1.
+    :param bool use_progress: if True use the task's progress to predict
+        the next poll.
+    """
+
+    def __init__(self,
+                 initial=0.5,
+                 factor=1.5,
+                 max_delay=30,
+                 jitter=0.1,
+                 use_progress=True):
+        self.initial = initial
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.use_progress = use_progress
+
+    def next_delay(self, attempt, elapsed, task=None):
+        delay = min(self.max_delay,
+                    self.initial * self.factor ** max(0, attempt - 1))
+        if self.use_progress and task is not None:
+            progress = self._get_progress(task)
+            if progress is not None and 0 < progress < 100:
+                remaining = elapsed * (100 - progress) / progress
+                delay = max(self.initial, min(delay, remaining))
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return delay
+
+    @staticmethod
+    def _get_progress(task):
+        progress = task.find('{%s}Progress' % NSMAP['vcloud'])
+        if progress is None:
+            progress = task.get('progress')
+        else:
+            progress = progress.text
+        try:
+            return int(progress)
+        except (TypeError, ValueError):
+            return None
+
+
 class _TaskMonitor(object):
-    _DEFAULT_POLL_SEC = 5
     _DEFAULT_TIMEOUT_SEC = 600
+    _DEFAULT_POLL_SEC = 5
+    # Task ids per batched status query, keeps the filter within URI length
+    # limits and the result within the server's default page size.
+    _MAX_TASKS_PER_QUERY = 25
+    _ACTIVE_STATUSES = [
+        TaskStatus.QUEUED.value, TaskStatus.PRE_RUNNING.value,
+        TaskStatus.RUNNING.value
+    ]
+    # Attributes of Task resources and their name in task query records.
+    _TASK_RECORD_ATTRIBUTES = [('href', 'href'), ('id', 'id'),
+                               ('operationName', 'name'),
+                               ('operation', 'operationFullName'),
+                               ('status', 'status'),
+                               ('startTime', 'startDate'),
+                               ('endTime', 'endDate')]
 
-    def __init__(self, client):
+    def __init__(self,
+                 client,
+                 async_client=None,
+                 executor=None,
+                 polling_strategy=None):
+        """Constructor for _TaskMonitor object.
+
+        :param pyvcloud.vcd.client.Client client: the client that will be used
+            to make REST calls to vCD.
+        :param pyvcloud.vcd.async_client.AsyncClient async_client: if set,
+            async waits poll through this client's non-blocking transport.
+        :param concurrent.futures.Executor executor: executor running the
+            polls of async waits when there is no async_client. None selects
+            the event loop's default executor.
+        :param PollingStrategy polling_strategy: strategy used by waits that
+            do not specify poll_frequency. Defaults to polling every 5
+            seconds; pass ExponentialBackoffPolling() to notice short tasks
+            sooner.
+        """
         self._client = client
+        self._async_client = async_client
+        self._executor = executor
+        if polling_strategy is None:
+            polling_strategy = FixedPolling(self._DEFAULT_POLL_SEC)
+        self._polling_strategy = polling_strategy
+        self._notification_listener = None
+
+    def set_notification_listener(self, listener):
+        """Let task completion notifications end waits between polls.
+
+        With a listener set, waits return as soon as a notification for
+        their task arrives instead of sleeping until the next poll. Polling
+        continues as a fallback, so a slower polling strategy is usually
+        appropriate.
+
+        :param pyvcloud.vcd.amqp.TaskNotificationListener listener: the
+            listener, or None to rely on polling only.
+        """
+        self._notification_listener = listener
+
+    def _get_notification_marker(self):
+        # Taken before each poll, so that notifications received while the
+        # poll is in flight end the following wait, but notifications that
+        # already ended a wait do not.
+        if self._notification_listener is None:
+            return None
+        return self._notification_listener.get_marker()
+
+    def _wait_between_polls(self, delay, task_hrefs, marker):
+        if self._notification_listener is None:
+            time.sleep(delay)
+        else:
+            self._notification_listener.wait(task_hrefs, delay, marker)
+
+    async def _async_wait_between_polls(self, delay, task_hrefs, marker):
+        if self._notification_listener is None:
+            await asyncio.sleep(delay)
+        else:
+            await self._notification_listener.async_wait(
+                task_hrefs, delay, marker)
+
+    def set_polling_strategy(self, polling_strategy):
+        """Set the strategy used by waits that do not specify poll_frequency.
+
+        :param PollingStrategy polling_strategy: the new default strategy.
+        """
+        self._polling_strategy = polling_strategy
+
+    def _get_polling_strategy(self, poll_frequency):
+        if poll_frequency is None:
+            return self._polling_strategy
+        if isinstance(poll_frequency, PollingStrategy):
+            return poll_frequency
+        return FixedPolling(poll_frequency)
 
     def wait_for_success(self,
                          task,
                          timeout=_DEFAULT_TIMEOUT_SEC,
-                         poll_frequency=_DEFAULT_POLL_SEC,
+                         poll_frequency=None,
                          callback=None):
         return self.wait_for_status(
             task,
@@ -580,10 +861,10 @@ class _TaskMonitor(object):
             callback=callback)
 
     async def async_wait_for_success(self,
-                         task,
-                         timeout=_DEFAULT_TIMEOUT_SEC,
-                         poll_frequency=_DEFAULT_POLL_SEC,
-                         callback=None):
+                                     task,
+                                     timeout=_DEFAULT_TIMEOUT_SEC,
+                                     poll_frequency=None,
+                                     callback=None):
         return await self.async_wait_for_status(
             task,
             timeout,
@@ -593,7 +874,7 @@ class _TaskMonitor(object):
     def wait_for_status(self,
                         task,
                         timeout=_DEFAULT_TIMEOUT_SEC,
-                        poll_frequency=_DEFAULT_POLL_SEC,
+                        poll_frequency=None,
                         fail_on_statuses=[
                             TaskStatus.ABORTED, TaskStatus.CANCELED,
                             TaskStatus.ERROR
@@ -603,31 +884,36 @@ class _TaskMonitor(object):
         """Waits for task to reach expected status.
 
         :param Task task: Task returned by post or put calls.
-        :param float timeout: Time (in seconds, floating point, fractional)
-            to wait for task to finish.
-        :param float poll_frequency: time (in seconds, as above) with which
-            task will be polled.
+        :param float timeout: not enforced, the wait lasts until the task
+            reaches a status of expected_target_statuses or
+            fail_on_statuses. Callers rely on waits of long tasks, e.g.
+            catalog imports, outlasting the default timeout.
+        :param poll_frequency: time (in seconds, floating point, fractional)
+            with which task will be polled, or a PollingStrategy. None uses
+            the monitor's polling strategy.
         :param list fail_on_statuses: method will raise an exception if any
             of the TaskStatus in this list is reached. If this parameter is
-            None then either task will achieve expected target status or throw
-            TimeOutException.
+            None then the task has to achieve an expected target status.
         :param list expected_target_statuses: list of expected target
             status.
         :return: Task we were waiting for
         :rtype Task:
-        :raises TimeoutException: If task is not finished within given time.
         :raises VcdException: If task enters a status in fail_on_statuses list
         """
         if fail_on_statuses is None:
             _fail_on_statuses = []
         elif isinstance(fail_on_statuses, TaskStatus):
-            _fail_on_statuses[fail_on_statuses]
+            _fail_on_statuses = [fail_on_statuses]
         else:
             _fail_on_statuses = fail_on_statuses
+        polling_strategy = self._get_polling_strategy(poll_frequency)
         task_href = task.get('href')
-        start_time = datetime.now()
+        start_time = time.monotonic()
+        attempt = 0
         while True:
+            marker = self._get_notification_marker()
             task = self._get_task_status(task_href)
+            attempt += 1
             if callback is not None:
                 callback(task)
             task_status = task.get('status').lower()
@@ -637,28 +923,38 @@ class _TaskMonitor(object):
             for status in _fail_on_statuses:
                 if task_status == status.value.lower():
                     raise VcdTaskException(task_status, task.Error)
-            if start_time - datetime.now() > timedelta(seconds=timeout):
-                break
-            time.sleep(poll_frequency)
-        raise TaskTimeoutException("Task timeout")
+            elapsed = time.monotonic() - start_time
+            self._wait_between_polls(
+                polling_strategy.next_delay(attempt, elapsed, task),
+                [task_href], marker)
 
     async def async_wait_for_status(self,
-                        task,
-                        timeout=_DEFAULT_TIMEOUT_SEC,
-                        poll_frequency=_DEFAULT_POLL_SEC,
-                        fail_on_statuses=[
-                            TaskStatus.ABORTED, TaskStatus.CANCELED,
-                            TaskStatus.ERROR
-                        ],
-                        expected_target_statuses=[TaskStatus.SUCCESS],
-                        callback=None):
-        """Waits for task to reach expected status.
+                                    task,
+                                    timeout=_DEFAULT_TIMEOUT_SEC,
+                                    poll_frequency=None,
+                                    fail_on_statuses=[
+                                        TaskStatus.ABORTED,
+                                        TaskStatus.CANCELED,
+                                        TaskStatus.ERROR
+                                    ],
+                                    expected_target_statuses=[
+                                        TaskStatus.SUCCESS
+                                    ],
+                                    callback=None):
+        """Waits for task to reach expected status without blocking the loop.
+
+        Polls never run on the event loop thread: they go through the
+        monitor's async client if it has one, otherwise they run in the
+        monitor's executor. Cancelling the waiting coroutine stops the wait
+        at once; a poll already running in the executor completes in the
+        background and its result is discarded.
 
         :param Task task: Task returned by post or put calls.
         :param float timeout: Time (in seconds, floating point, fractional)
             to wait for task to finish.
-        :param float poll_frequency: time (in seconds, as above) with which
-            task will be polled.
+        :param poll_frequency: time (in seconds, as above) with which task
+            will be polled, or a PollingStrategy. None uses the monitor's
+            polling strategy.
         :param list fail_on_statuses: method will raise an exception if any
             of the TaskStatus in this list is reached. If this parameter is
             None then either task will achieve expected target status or throw
@@ -676,11 +972,15 @@ class _TaskMonitor(object):
             _fail_on_statuses = [fail_on_statuses]
         else:
             _fail_on_statuses = fail_on_statuses
+        polling_strategy = self._get_polling_strategy(poll_frequency)
         task_href = task.get('href')
         loop = asyncio.get_event_loop()
         start_time = loop.time()
+        attempt = 0
         while True:
-            task = self._get_task_status(task_href)
+            marker = self._get_notification_marker()
+            task = await self._async_get_task_status(task_href)
+            attempt += 1
             if callback is not None:
                 callback(task)
             task_status = task.get('status').lower()
@@ -690,18 +990,413 @@ class _TaskMonitor(object):
             for status in _fail_on_statuses:
                 if task_status == status.value.lower():
                     raise VcdTaskException(task_status, task.Error)
-            if loop.time() - start_time > timeout:
+            elapsed = loop.time() - start_time
+            if elapsed > timeout:
                 break
-            await asyncio.sleep(poll_frequency)
+            await self._async_wait_between_polls(
+                min(polling_strategy.next_delay(attempt, elapsed, task),
+                    timeout - elapsed), [task_href], marker)
         raise TaskTimeoutException("Task timeout")
 
+    def wait_for_tasks(self,
+                       tasks,
+                       timeout=_DEFAULT_TIMEOUT_SEC,
+                       poll_frequency=None,
+                       fail_on_statuses=[
+                           TaskStatus.ABORTED, TaskStatus.CANCELED,
+                           TaskStatus.ERROR
+                       ],
+                       expected_target_statuses=[TaskStatus.SUCCESS],
+                       callback=None):
+        """Waits for several tasks to reach expected status.
+
+        Instead of polling every task separately, each poll issues a single
+        task query (the same query Task.list_tasks() uses) filtered by the
+        ids of the tasks still outstanding. A task is fetched individually
+        only once it reaches a final status, or if the query does not
+        return it.
+
+        Polling happens on a background thread. The returned futures are
+        resolved as soon as their task finishes, e.g. use
+        concurrent.futures.as_completed() or concurrent.futures.wait() on
+        them. Cancelled futures are no longer polled.
+
+        :param list tasks: Tasks returned by post or put calls.
+        :param float timeout: Time (in seconds, floating point, fractional)
+            to wait for all tasks to finish.
+        :param poll_frequency: time (in seconds, as above) with which tasks
+            will be polled, or a PollingStrategy. None uses the monitor's
+            polling strategy.
+        :param list fail_on_statuses: a task's future will hold a
+            VcdTaskException if the task reaches any of the TaskStatus in this
+            list.
+        :param list expected_target_statuses: list of expected target
+            status.
+        :param function callback: called on every poll with the task query
+            record of each task still polled, an
+            lxml.objectify.ObjectifiedElement with the attributes of the id
+            records of the task query. Tasks the query does not return are
+            fetched, and passed as records converted from their Task
+            resource, with the attributes href, id, name, operationFullName,
+            status, startDate, endDate and objectName.
+
+        :return: one future per task, in the order of tasks. A future's
+            result is the Task once it reached an expected target status; its
+            exception is VcdTaskException or TaskTimeoutException otherwise.
+
+        :rtype: list
+        """
+        _fail_on_statuses = self._normalize_statuses(fail_on_statuses)
+        pending = []
+        futures = []
+        for task in tasks:
+            future = concurrent.futures.Future()
+            futures.append(future)
+            pending.append((self._get_task_id(task), task.get('href'),
+                            future))
+        poller = threading.Thread(
+            target=self._poll_tasks,
+            args=(pending, timeout,
+                  self._get_polling_strategy(poll_frequency),
+                  _fail_on_statuses,
+                  expected_target_statuses, callback),
+            name='vcd-task-waiter',
+            daemon=True)
+        poller.start()
+        return futures
+
+    def _poll_tasks(self, pending, timeout, polling_strategy,
+                    fail_on_statuses, expected_target_statuses, callback):
+        start_time = time.monotonic()
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                marker = self._get_notification_marker()
+                pending = [p for p in pending if not p[2].cancelled()]
+                still_pending = []
+                for start in range(0, len(pending),
+                                   self._MAX_TASKS_PER_QUERY):
+                    chunk = pending[start:start + self._MAX_TASKS_PER_QUERY]
+                    records = self._query_task_records(
+                        [task_id for task_id, _, _ in chunk])
+                    for task_id, task_href, future in chunk:
+                        record = records.get(task_id)
+                        if record is None:
+                            # Not visible to the query, fall back to a GET.
+                            record = self._get_task_record(
+                                self._get_task_status(task_href))
+                        if callback is not None:
+                            callback(record)
+                        if not self._resolve_task_future(
+                                future, task_href, record.get('status'),
+                                fail_on_statuses, expected_target_statuses):
+                            still_pending.append((task_id, task_href,
+                                                  future))
+                pending = still_pending
+                if len(pending) == 0:
+                    return
+                elapsed = time.monotonic() - start_time
+                if elapsed > timeout:
+                    break
+                self._wait_between_polls(
+                    min(polling_strategy.next_delay(attempt, elapsed),
+                        timeout - elapsed),
+                    [task_href for _, task_href, _ in pending], marker)
+            for _, _, future in pending:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(TaskTimeoutException("Task timeout"))
+        except Exception as e:
+            for _, _, future in pending:
+                if not future.done() and future.set_running_or_notify_cancel():
+                    future.set_exception(e)
+
+    def _resolve_task_future(self, future, task_href, task_status,
+                             fail_on_statuses, expected_target_statuses):
+        task_status = task_status.lower()
+        final_statuses = [status.value.lower() for status in
+                          list(expected_target_statuses) + fail_on_statuses]
+        if task_status not in final_statuses:
+            return False
+        if not future.set_running_or_notify_cancel():
+            return True
+        try:
+            task = self._get_task_status(task_href)
+            task_status = task.get('status').lower()
+            for status in expected_target_statuses:
+                if task_status == status.value.lower():
+                    future.set_result(task)
+                    return True
+            raise VcdTaskException(task_status, task.Error)
+        except Exception as e:
+            future.set_exception(e)
+        return True
+
+    def _query_task_records(self, task_ids):
+        """Fetch task query records of the given tasks with a single query.
+
+        :param list task_ids: task ids in urn format.
+
+        :return: task records keyed by task id.
+
+        :rtype: dict
+        """
+        resource_type = ResourceType.TASK.value
+        if self._client.is_sysadmin():
+            resource_type = ResourceType.ADMIN_TASK.value
+        query_filter = ','.join(
+            'id==%s' % urllib.parse.quote_plus(task_id)
+            for task_id in task_ids)
+        query = self._client.get_typed_query(
+            resource_type,
+            query_result_format=QueryResultFormat.ID_RECORDS,
+            qfilter=query_filter)
+        return {record.get('id'): record for record in query.execute()}
+
+    def _get_task_record(self, task):
+        """Convert a Task resource to a task query record.
+
+        :param lxml.objectify.ObjectifiedElement task: the Task resource.
+
+        :return: a record with the tag of the records of the task query, and
+            the attributes of the task found in both.
+
+        :rtype: lxml.objectify.ObjectifiedElement
+        """
+        record = E.AdminTaskRecord() if self._client.is_sysadmin() else \
+            E.TaskRecord()
+        for task_name, record_name in self._TASK_RECORD_ATTRIBUTES:
+            value = task.get(task_name)
+            if value is not None:
+                record.set(record_name, value)
+        if hasattr(task, 'Owner') and task.Owner.get('name') is not None:
+            record.set('objectName', task.Owner.get('name'))
+        return record
+
+    @staticmethod
+    def _get_task_id(task):
+        task_id = task.get('id')
+        if task_id is None:
+            task_id = 'urn:vcloud:task:' + task.get('href').split('/')[-1]
+        return task_id
+
+    @staticmethod
+    def _normalize_statuses(statuses):
+        if statuses is None:
+            return []
+        elif isinstance(statuses, TaskStatus):
+            return [statuses]
+        return list(statuses)
+
     def _get_task_status(self, task_href):
-        return self._client.get_resource(task_href)
+        task = self._client.get_resource(task_href, use_cache=False)
+        self._invalidate_task_owner(task)
+        return task
+
+    def _invalidate_task_owner(self, task):
+        if task.get('status') not in self._ACTIVE_STATUSES and \
+           hasattr(task, 'Owner'):
+            # A finished task has likely modified its owner, drop stale copies.
+            self._client._invalidate_cached_resource(task.Owner.get('href'))
+
+    async def _async_get_task_status(self, task_href):
+        if self._async_client is not None:
+            task = await self._async_client.get_resource(task_href)
+            self._invalidate_task_owner(task)
+            return task
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor,
+                                          self._get_task_status, task_href)
 
     def get_status(self, task):
         return self._get_task_status(task.get('href')).get('status').lower()
 
 
+class _KeepAliveConnectionPoolMixin(object):
+    """Closes pooled connections that sat idle for too long.
+
+    Servers drop keep-alive connections idle for longer than their own
+    timeout, without telling the client. Each connection is stamped when it
+    returns to the pool, and one idle for longer than keep_alive_timeout
+    is closed when it is taken out again, so that it reconnects instead of
+    failing with a connection reset. Taking a connection out of an empty
+    pool is reported to the adapter, as the pool is then exhausted.
+    """
+
+    keep_alive_timeout = None
+    adapter = None
+
+    def _get_conn(self, timeout=None):
+        if self.adapter is not None and self.pool is not None and \
+           self.pool.empty():
+            self.adapter._record_pool_exhausted()
+        conn = super(_KeepAliveConnectionPoolMixin,
+                     self)._get_conn(timeout=timeout)
+        last_used = getattr(conn, '_pyvcloud_last_used', None)
+        if self.keep_alive_timeout is not None and last_used is not None \
+           and time.monotonic() - last_used > self.keep_alive_timeout:
+            # A closed connection reconnects on its next request.
+            conn.close()
+            conn._pyvcloud_last_used = None
+            if self.adapter is not None:
+                self.adapter._record_idle_close()
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn._pyvcloud_last_used = time.monotonic()
+        super(_KeepAliveConnectionPoolMixin, self)._put_conn(conn)
+
+
+class _KeepAliveHTTPConnectionPool(_KeepAliveConnectionPoolMixin,
+                                   HTTPConnectionPool):
+    pass
+
+
+class _KeepAliveHTTPSConnectionPool(_KeepAliveConnectionPoolMixin,
+                                    HTTPSConnectionPool):
+    pass
+
+
+class _KeepAlivePoolManager(PoolManager):
+    """PoolManager creating pools that track connection idle times."""
+
+    def __init__(self, adapter, keep_alive_timeout, *args, **kwargs):
+        super(_KeepAlivePoolManager, self).__init__(*args, **kwargs)
+        self.pool_classes_by_scheme = {
+            'http': _KeepAliveHTTPConnectionPool,
+            'https': _KeepAliveHTTPSConnectionPool
+        }
+        self._adapter = adapter
+        self._keep_alive_timeout = keep_alive_timeout
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super(_KeepAlivePoolManager, self)._new_pool(
+            scheme, host, port, request_context=request_context)
+        pool.adapter = self._adapter
+        pool.keep_alive_timeout = self._keep_alive_timeout
+        return pool
+
+
+class _PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter with tunable connection pooling and usage statistics.
+
+    Wraps the requests HTTPAdapter so that a Client can size its urllib3
+    connection pools, apply a retry policy, drop idle keep-alive
+    connections before the server silently closes them and report how
+    close the pools come to saturation.
+    """
+
+    def __init__(self,
+                 pool_connections=requests.adapters.DEFAULT_POOLSIZE,
+                 pool_maxsize=requests.adapters.DEFAULT_POOLSIZE,
+                 max_retries=requests.adapters.DEFAULT_RETRIES,
+                 pool_block=requests.adapters.DEFAULT_POOLBLOCK,
+                 keep_alive_timeout=None):
+        """Constructor for _PooledHTTPAdapter object.
+
+        :param int pool_connections: number of per-host connection pools to
+            cache.
+        :param int pool_maxsize: maximum number of connections kept open
+            per host.
+        :param max_retries: number of retries for failed connections, or a
+            urllib3.util.retry.Retry object for finer grained control.
+        :param bool pool_block: if True, requests wait for a free connection
+            when the pool is exhausted instead of opening a throw-away one.
+        :param float keep_alive_timeout: seconds an idle connection may be
+            kept for reuse. A pooled connection idle for longer is closed
+            and reopened before its next request. None keeps connections
+            until the server closes them.
+        """
+        self._keep_alive_timeout = keep_alive_timeout
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._idle_resets = 0
+        self._pool_exhausted = 0
+        super(_PooledHTTPAdapter, self).__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            pool_block=pool_block)
+
+    def init_poolmanager(self,
+                         connections,
+                         maxsize,
+                         block=requests.adapters.DEFAULT_POOLBLOCK,
+                         **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _KeepAlivePoolManager(
+            self,
+            self._keep_alive_timeout,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs)
+
+    def send(self, request, **kwargs):
+        with self._stats_lock:
+            self._requests += 1
+            self._in_flight += 1
+            if self._in_flight > self._peak_in_flight:
+                self._peak_in_flight = self._in_flight
+        try:
+            return super(_PooledHTTPAdapter, self).send(request, **kwargs)
+        finally:
+            with self._stats_lock:
+                self._in_flight -= 1
+
+    def _record_idle_close(self):
+        with self._stats_lock:
+            self._idle_resets += 1
+
+    def _record_pool_exhausted(self):
+        with self._stats_lock:
+            self._pool_exhausted += 1
+
+    def get_stats(self):
+        """Return connection pool usage statistics.
+
+        :return: a dictionary with the pool configuration, adapter-wide
+            request counters and one entry per host pool. 'idle_resets'
+            counts connections closed for exceeding keep_alive_timeout.
+            'pool_exhausted' counts requests that found no free pooled
+            connection, and either waited for one or opened a throw-away
+            connection. 'saturated' is True if that ever happened.
+
+        :rtype: dict
+        """
+        pools = []
+        for key in list(self.poolmanager.pools.keys()):
+            pool = self.poolmanager.pools.get(key)
+            if pool is None:
+                continue
+            idle = sum(1 for conn in list(pool.pool.queue)
+                       if conn is not None) if pool.pool is not None else 0
+            pools.append({
+                'host': '%s://%s:%s' % (pool.scheme, pool.host, pool.port),
+                'connections_opened': pool.num_connections,
+                'requests': pool.num_requests,
+                'idle_connections': idle
+            })
+        with self._stats_lock:
+            return {
+                'pool_connections': self._pool_connections,
+                'pool_maxsize': self._pool_maxsize,
+                'pool_block': self._pool_block,
+                'requests': self._requests,
+                'in_flight': self._in_flight,
+                'peak_in_flight': self._peak_in_flight,
+                'idle_resets': self._idle_resets,
+                'pool_exhausted': self._pool_exhausted,
+                'saturated': self._pool_exhausted > 0,
+                'pools': pools
+            }
+
+
 class Client(object):
     """A low-level interface to the vCloud Director REST API.
 
@@ -722,24 +1417,80 @@ class Client(object):
     :param boolean log_request: if True log HTTP requests.
     :param boolean log_headers: if True log HTTP headers.
     :param boolean log_bodies: if True log HTTP bodies.
+    :param int pool_connections: number of per-host connection pools kept
+        by the HTTP session.
+    :param int pool_maxsize: maximum number of connections kept open to a
+        single host. Size this to the number of threads sharing the client.
+    :param max_retries: number of retries for failed connections, or a
+        urllib3.util.retry.Retry object describing the retry policy.
+    :param boolean pool_block: if True, requests wait for a free pooled
+        connection instead of opening a connection that is discarded after
+        use when the pool is exhausted.
+    :param float keep_alive_timeout: seconds an idle keep-alive connection
+        may be reused. A pooled connection idle for longer, e.g. one left
+        over from a burst of requests, is reopened before its next request.
+        Set it below the keep-alive timeout of the server. None keeps
+        connections until the server closes them.
+    :param pyvcloud.vcd.response_cache.ResponseCache response_cache: if set,
+        GET responses are cached and revalidated with conditional GETs, see
+        ResponseCache. Task status and query result pages are never cached.
+    :param boolean coalesce_requests: if True, concurrent identical GETs
+        issued by threads sharing this client are sent to vCD once and the
+        response is shared by all callers, each receiving its own parsed
+        copy.
+    :param boolean thread_safe: if True the client may be shared by
+        several threads, e.g. the workers of a ThreadPoolExecutor, after it
+        is logged in. Each thread then sends its requests on its own
+        session, all sessions sharing the login token and the connection
+        pool, which should be sized with pool_maxsize to the number of
+        threads.
+    :param pyvcloud.vcd.session_cache.SessionCache session_cache: if set,
+        set_credentials() reuses sessions cached on disk by earlier clients
+        with the same credentials, including in other processes, and caches
+        the sessions it creates.
+    :param pyvcloud.vcd.session_cache.ServerInfoCache server_info_cache: if
+        set, the server's API versions and the query list of the logged in
+        user are looked up in this cache before they are requested from
+        vCD. Share one instance between the clients of a process.
+    :param boolean huge_tree: if True responses are parsed without the
+        document size and depth limits of lxml, which very large query
+        pages or inventories may exceed.
+    :param boolean compression: if False ask vCD for uncompressed
+        responses, which saves the CPU time of compression on fast links.
+        Responses are otherwise requested in the encodings requests
+        decodes, e.g. gzip. See get_transfer_stats() for the resulting
+        savings.
     """
 
     _HEADER_ACCEPT_NAME = 'Accept'
+    _HEADER_ACCEPT_ENCODING_NAME = 'Accept-Encoding'
     _HEADER_CONNECTION_NAME = 'Connection'
     _HEADER_CONTENT_LENGTH_NAME = 'Content-Length'
+    _HEADER_CONTENT_ENCODING_NAME = 'Content-Encoding'
     _HEADER_CONTENT_RANGE_NAME = 'Content-Range'
     _HEADER_CONTENT_TYPE_NAME = 'Content-Type'
+    _HEADER_ETAG_NAME = 'ETag'
+    _HEADER_IF_NONE_MATCH_NAME = 'If-None-Match'
+    _HEADER_RANGE_NAME = 'Range'
     _HEADER_REQUEST_ID_NAME = 'X-VMWARE-VCLOUD-REQUEST-ID'
     _HEADER_X_VCLOUD_AUTH_NAME = 'x-vcloud-authorization'
 
     _HEADER_CONNECTION_VALUE_CLOSE = 'close'
+    _HEADER_ACCEPT_ENCODING_VALUE_IDENTITY = 'identity'
+
+    # Accepted media type of requests returning JSON instead of XML.
+    _ACCEPT_TYPE_JSON = 'application/*+json'
 
     _HEADERS_TO_REDACT = [
         'Authorization', 'x-vcloud-authorization',
         'X-VMWARE-VCLOUD-ACCESS-TOKEN'
     ]
 
+    _DOWNLOAD_RANGE_SIZE = 64 * SIZE_1MB
+
     _UPLOAD_FRAGMENT_MAX_RETRIES = 5
+    _UPLOAD_FRAGMENT_RETRY_BACKOFF = ExponentialBackoffPolling(
+        initial=1, factor=2, max_delay=30, use_progress=False)
 
     def __init__(self,
                  uri,
@@ -748,7 +1499,19 @@ class Client(object):
                  log_file=None,
                  log_requests=False,
                  log_headers=False,
-                 log_bodies=False):
+                 log_bodies=False,
+                 pool_connections=requests.adapters.DEFAULT_POOLSIZE,
+                 pool_maxsize=requests.adapters.DEFAULT_POOLSIZE,
+                 max_retries=requests.adapters.DEFAULT_RETRIES,
+                 pool_block=requests.adapters.DEFAULT_POOLBLOCK,
+                 keep_alive_timeout=None,
+                 response_cache=None,
+                 coalesce_requests=False,
+                 thread_safe=False,
+                 session_cache=None,
+                 server_info_cache=None,
+                 huge_tree=False,
+                 compression=True):
         self._uri = uri
         if len(self._uri) > 0:
             if self._uri[-1] == '/':
@@ -775,6 +1538,34 @@ class Client(object):
         self._query_list_map = None
         self._task_monitor = None
         self._verify_ssl_certs = verify_ssl_certs
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._max_retries = max_retries
+        self._pool_block = pool_block
+        self._keep_alive_timeout = keep_alive_timeout
+        self._response_cache = response_cache
+        self._coalesce_requests = coalesce_requests
+        self._in_flight_gets = {}
+        self._in_flight_gets_lock = threading.Lock()
+        self._thread_safe = thread_safe
+        self._thread_local = threading.local()
+        # Guards lazy initialization of shared state.
+        self._lock = threading.Lock()
+        self._session_cache = session_cache
+        self._session_cache_key = None
+        # Credentials of a session reused from the session cache, used to
+        # log in again if vCD no longer accepts the cached token.
+        self._session_cache_creds = None
+        # Serializes logins again of threads sharing the client.
+        self._log_in_again_lock = threading.Lock()
+        self._server_info_cache = server_info_cache
+        self._huge_tree = huge_tree
+        self._compression = compression
+        self._transfer_listener = None
+        self._transfer_stats_lock = threading.Lock()
+        self._transfer_stats = self._new_transfer_stats()
+        # user@org of the last login, keys the cached query list.
+        self._login_user = None
 
         self._logger = logging.getLogger(log_file)
         self._logger.setLevel(logging.DEBUG)
@@ -837,6 +1628,105 @@ class Client(object):
 
         return False
 
+    def _new_session(self):
+        """Create a requests session using the client's pool settings.
+
+        :return: a new session with a tuned HTTP adapter mounted for both
+            http and https.
+
+        :rtype: requests.Session
+        """
+        session = requests.Session()
+        adapter = _PooledHTTPAdapter(
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            max_retries=self._max_retries,
+            pool_block=self._pool_block,
+            keep_alive_timeout=self._keep_alive_timeout)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        # requests asks for compressed responses by default.
+        if not self._compression:
+            session.headers[self._HEADER_ACCEPT_ENCODING_NAME] = \
+                self._HEADER_ACCEPT_ENCODING_VALUE_IDENTITY
+        return session
+
+    def _get_session(self):
+        """Return the session to send requests of the calling thread on.
+
+        This is the client's session, unless the client is thread safe or
+        the thread runs a function passed to _call_on_thread_session(), in
+        which case the thread gets a session of its own. Thread sessions
+        carry the client session's token and share its HTTP adapter, hence
+        its connection pool, and are replaced if the client logs in again.
+
+        :return: a session, or None if the client is not logged in.
+
+        :rtype: requests.Session
+        """
+        session = self._session
+        if session is None or not (self._thread_safe or getattr(
+                self._thread_local, 'use_thread_session', False)):
+            return session
+        thread_session = getattr(self._thread_local, 'session', None)
+        if thread_session is None or thread_session[0] is not session:
+            adapter = session.get_adapter(self._uri)
+            new_session = requests.Session()
+            new_session.mount('https://', adapter)
+            new_session.mount('http://', adapter)
+            new_session.headers.update(session.headers)
+            thread_session = (session, new_session)
+            self._thread_local.session = thread_session
+        return thread_session[1]
+
+    def _call_on_thread_session(self, function, *args):
+        """Call a function, sending its requests on a thread session.
+
+        requests sessions are not thread safe. Worker threads of a client
+        that is not thread safe run their requests through this method, so
+        that each of them uses a session of its own, see _get_session().
+
+        :param function function: the function to call.
+        :param args: arguments of the function.
+
+        :return: the result of the function.
+        """
+        use_thread_session = getattr(self._thread_local, 'use_thread_session',
+                                     False)
+        self._thread_local.use_thread_session = True
+        try:
+            return function(*args)
+        finally:
+            self._thread_local.use_thread_session = use_thread_session
+
+    def _get_auth_token(self):
+        """Return the vCD authorization token of the logged in session.
+
+        :return: the token, or None if the client is not logged in.
+
+        :rtype: str
+        """
+        session = self._session
+        if session is None:
+            return None
+        return session.headers.get(self._HEADER_X_VCLOUD_AUTH_NAME)
+
+    def get_connection_pool_stats(self):
+        """Return connection pool statistics of the current session.
+
+        Use the statistics to size pool_maxsize for the expected load: if
+        'saturated' is True, concurrent requests have exhausted the pool and
+        either waited for a connection or opened short-lived ones.
+
+        :return: pool configuration, request counters and per-host pool
+            details, or None if there is no active session.
+
+        :rtype: dict
+        """
+        if self._session is None:
+            return None
+        return self._session.get_adapter(self._uri).get_stats()
+
     def get_api_version(self):
         """Return vCD API version client is using.
 
@@ -874,14 +1764,14 @@ class Client(object):
 
         :rtype: lxml.objectify.ObjectifiedElement
         """
-        with requests.Session() as new_session:
+        with self._new_session() as new_session:
             # Use with block to avoid leaking socket connections.
             response = self._do_request_prim(
                 'GET', self._uri + '/versions', new_session, accept_type='')
             sc = response.status_code
             if sc != 200:
                 raise VcdException('Unable to get supported API versions.')
-            return objectify.fromstring(response.content)
+            return _objectify_content(response.content)
 
     def set_highest_supported_version(self):
         """Set the client API version to the highest server API version.
@@ -916,11 +1806,30 @@ class Client(object):
         :raises: VcdException: if automatic API negotiation fails to arrive
             at a supported client version
         """
+        self._session_cache_key = None
+        self._session_cache_creds = None
+        login_user = '%s@%s' % (creds.user, creds.org)
+        if self._session_cache is not None:
+            cache_key = self._session_cache.get_key(self._uri, creds)
+            if self._rehydrate_from_session_cache(cache_key):
+                self._session_cache_creds = creds
+                self._login_user = login_user
+                return
+            self._session_cache_key = cache_key
+
         # If we need to negotiate the server API level find the highest
         # server version that pyvcloud supports.
         if self._negotiate_api_version:
             self._logger.debug("Negotiating API version")
-            active_versions = self.get_supported_versions_list()
+            active_versions = None
+            if self._server_info_cache is not None:
+                active_versions = self._server_info_cache.get_versions(
+                    self._uri)
+            if active_versions is None:
+                active_versions = self.get_supported_versions_list()
+                if self._server_info_cache is not None:
+                    self._server_info_cache.set_versions(
+                        self._uri, active_versions)
             self._logger.debug('API versions supported: %s' % active_versions)
             # Versions are strings sorted in ascending order, so we can work
             # backwards to find a match.
@@ -942,7 +1851,7 @@ class Client(object):
         # We can now proceed to login. Ensure we close session if
         # any exception is thrown to avoid leaking a socket connection.
         self._logger.debug('API version in use: %s' % self._api_version)
-        new_session = requests.Session()
+        new_session = self._new_session()
         try:
             response = self._do_request_prim(
                 'POST',
@@ -963,30 +1872,101 @@ class Client(object):
                 else:
                     raise VcdException('Login failed.')
 
-            session = objectify.fromstring(response.content)
+            session = _objectify_content(response.content)
             self._session_endpoints = _get_session_endpoints(session)
 
-            self._session = new_session
-            self._session.headers[self._HEADER_X_VCLOUD_AUTH_NAME] = \
+            new_session.headers[self._HEADER_X_VCLOUD_AUTH_NAME] = \
                 response.headers[self._HEADER_X_VCLOUD_AUTH_NAME]
             self._is_sysadmin = self._is_sys_admin(session.get('org'))
+            self._login_user = login_user
+            self._session = new_session
         except Exception:
             new_session.close()
             raise
 
+        if self._session_cache_key is not None:
+            wkep = {
+                endpoint.name: href
+                for endpoint, href in self._session_endpoints.items()
+            }
+            self._session_cache.store(
+                self._session_cache_key, {
+                    'token': self._get_auth_token(),
+                    'org': session.get('org'),
+                    'wkep': wkep,
+                    'api_version': self._api_version
+                })
+
+    def _rehydrate_from_session_cache(self, cache_key):
+        """Resume a session found in the session cache.
+
+        :param str cache_key: session cache key of the login.
+
+        :return: True if a session was resumed.
+
+        :rtype: bool
+        """
+        state = self._session_cache.load(cache_key)
+        if state is None:
+            return False
+        if not self._negotiate_api_version and \
+           state.get('api_version') != self._api_version:
+            return False
+        self._logger.debug('Reusing cached session.')
+        self._api_version = state.get('api_version')
+        self._negotiate_api_version = False
+        query_list_map = state.get('query_list_map')
+        if query_list_map is not None:
+            self._query_list_map = {
+                (media_type, name): href
+                for media_type, name, href in query_list_map
+            }
+        self.rehydrate(state)
+        self._session_cache_key = cache_key
+        return True
+
+    def _log_in_again(self, rejected_token):
+        """Replace a cached session that vCD rejected by a new login.
+
+        Threads sharing the client see the token rejected at the same time.
+        Only the first of them logs in again, the others find the token
+        already replaced.
+
+        :param str rejected_token: the token of the rejected request.
+
+        :return: True if the client logged in again, or another thread did
+            since the token was rejected.
+
+        :rtype: bool
+        """
+        with self._log_in_again_lock:
+            if self._get_auth_token() != rejected_token:
+                return True
+            creds = self._session_cache_creds
+            if creds is None:
+                return False
+            self._logger.debug('Cached session rejected, logging in again.')
+            self._session_cache.remove(self._session_cache_key,
+                                       rejected_token)
+            self.set_credentials(creds)
+            return True
+
     def rehydrate(self, state):
-        self._session = requests.Session()
-        self._session.headers[self._HEADER_X_VCLOUD_AUTH_NAME] = \
+        self._login_user = None
+        new_session = self._new_session()
+        new_session.headers[self._HEADER_X_VCLOUD_AUTH_NAME] = \
             state.get('token')
         self._is_sysadmin = self._is_sys_admin(state.get('org'))
         wkep = state.get('wkep')
-        self._session_endpoints = {}
+        session_endpoints = {}
         for endpoint in _WellKnownEndpoint:
             if endpoint.name in wkep:
-                self._session_endpoints[endpoint] = wkep[endpoint.name]
+                session_endpoints[endpoint] = wkep[endpoint.name]
+        self._session_endpoints = session_endpoints
+        self._session = new_session
 
     def rehydrate_from_token(self, token):
-        new_session = requests.Session()
+        new_session = self._new_session()
         new_session.headers[self._HEADER_X_VCLOUD_AUTH_NAME] = token
         response = self._do_request_prim('GET', self._uri + "/session",
                                          new_session)
@@ -996,26 +1976,45 @@ class Client(object):
                 sc, self._get_response_request_id(response),
                 _objectify_response(response))
 
-        session = objectify.fromstring(response.content)
+        session = _objectify_content(response.content)
 
         self._is_sysadmin = self._is_sys_admin(session.get('org'))
+        self._login_user = None
         self._session_endpoints = _get_session_endpoints(session)
-        self._session = new_session
-        self._session.headers[self._HEADER_X_VCLOUD_AUTH_NAME] = \
+        new_session.headers[self._HEADER_X_VCLOUD_AUTH_NAME] = \
             response.headers[self._HEADER_X_VCLOUD_AUTH_NAME]
+        self._session = new_session
         return session
 
-    def logout(self):
+    def logout(self, keep_cached_session=True):
         """Destroy the server session and de-allocate local resources.
 
         Logout is idempotent. Reusing a client after logout will result
         in undefined behavior.
+
+        :param bool keep_cached_session: if the session is in the client's
+            session cache, only release local resources and keep the
+            server session for reuse by other clients. If False, or if the
+            session is not cached, the server session is destroyed.
         """
         if self._session is not None:
-            uri = self._uri + '/session'
-            result = self._do_request('DELETE', uri)
+            result = None
+            # Never log in again just to destroy the new session.
+            self._session_cache_creds = None
+            cached = self._session_cache_key is not None
+            if cached and not keep_cached_session:
+                self._session_cache.remove(self._session_cache_key,
+                                           self._get_auth_token())
+            if not cached or not keep_cached_session:
+                uri = self._uri + '/session'
+                result = self._do_request('DELETE', uri)
+            if self._response_cache is not None:
+                # The cache may be shared with clients of other users.
+                self._response_cache.clear(
+                    prefix=(self._get_cache_identity(), ))
             self._session.close()
             self._session = None
+            self._session_cache_key = None
             return result
 
     def _is_sys_admin(self, logged_in_org):
@@ -1031,7 +2030,9 @@ class Client(object):
 
     def get_task_monitor(self):
         if self._task_monitor is None:
-            self._task_monitor = _TaskMonitor(self)
+            with self._lock:
+                if self._task_monitor is None:
+                    self._task_monitor = _TaskMonitor(self)
         return self._task_monitor
 
     def _do_request(self,
@@ -1040,22 +2041,166 @@ class Client(object):
                     contents=None,
                     media_type=None,
                     objectify_results=True,
-                    params=None):
-        response = self._do_request_prim(
-            method,
-            uri,
-            self._session,
-            contents=contents,
-            media_type=media_type,
-            params=params)
+                    params=None,
+                    use_cache=True,
+                    accept_type=None):
+        token = self._get_auth_token()
+        try:
+            return self._send_request(method, uri, contents, media_type,
+                                      objectify_results, params, use_cache,
+                                      accept_type)
+        except UnauthorizedException:
+            # vCD did not process a request it rejected with a 401, so it is
+            # sent again after logging in, unless its body is a stream the
+            # first attempt consumed.
+            if not self._log_in_again(token) or \
+               not _is_replayable(contents):
+                raise
+        return self._send_request(method, uri, contents, media_type,
+                                  objectify_results, params, use_cache,
+                                  accept_type)
+
+    def _send_request(self, method, uri, contents, media_type,
+                      objectify_results, params, use_cache, accept_type):
+        if self._response_cache is not None:
+            if method == 'GET':
+                if use_cache:
+                    return self._do_cached_get(uri, objectify_results,
+                                               params, accept_type)
+            else:
+                self._response_cache.invalidate(uri)
+
+        if method == 'GET':
+            response = self._send_get(
+                uri, params=params, accept_type=accept_type)
+        else:
+            response = self._do_request_prim(
+                method,
+                uri,
+                self._get_session(),
+                contents=contents,
+                media_type=media_type,
+                accept_type=accept_type,
+                params=params)
 
         sc = response.status_code
         if 200 <= sc <= 299:
-            return _objectify_response(response, objectify_results)
+            return self._parse_content(
+                response.content, objectify_results,
+                response.headers.get(self._HEADER_CONTENT_TYPE_NAME))
 
         self._response_code_to_exception(
             sc, self._get_response_request_id(response),
-            _objectify_response(response, objectify_results))
+            self._parse_error_content(response))
+
+    def _parse_content(self, content, objectify_results, content_type=None):
+        """Parse a response body in the format vCD sent it in.
+
+        :param bytes content: response body.
+        :param bool objectify_results: if True return an objectified
+            element, else a plain etree element. Ignored for JSON.
+        :param str content_type: Content-Type header of the response. JSON
+            bodies are decoded, any other body is parsed as XML.
+
+        :return: a dict or list for JSON, else an lxml element, or None if
+            there is no content.
+        """
+        if content is None or len(content) == 0:
+            return None
+        if _is_json_media_type(content_type):
+            return json.loads(content.decode('utf-8'))
+        return _objectify_content(content, objectify_results,
+                                  self._huge_tree)
+
+    def _parse_error_content(self, response):
+        """Parse the body of an error response.
+
+        Error bodies do not always come from vCD, e.g. proxies answer with
+        HTML pages, and whatever their format the error must be raised.
+
+        :param requests.Response response: the error response.
+
+        :return: the parsed body, or None if there is none or it can not be
+            parsed.
+        """
+        try:
+            return self._parse_content(
+                response.content, True,
+                response.headers.get(self._HEADER_CONTENT_TYPE_NAME))
+        except (ValueError, etree.XMLSyntaxError):
+            return None
+
+    def _do_cached_get(self, uri, objectify_results, params,
+                       accept_type=None):
+        """Serve a GET from the response cache, revalidating if required.
+
+        :param str uri: resource uri.
+        :param bool objectify_results: if True return an objectified
+            element, else a plain etree element.
+        :param dict params: query parameters.
+        :param str accept_type: accepted response media type.
+        """
+        cache = self._response_cache
+        accept = self._build_request_headers(
+            accept_type=accept_type)[self._HEADER_ACCEPT_NAME]
+        key = (self._get_cache_identity(), uri,
+               None if params is None else tuple(sorted(params.items())),
+               accept)
+        entry = cache.lookup(key)
+        headers = None
+        if entry is not None:
+            (content, content_type, etag, fresh) = entry
+            if fresh:
+                return self._parse_content(content, objectify_results,
+                                           content_type)
+            headers = {self._HEADER_IF_NONE_MATCH_NAME: etag}
+
+        response = self._send_get(
+            uri, params=params, headers=headers, accept_type=accept_type)
+        sc = response.status_code
+        if sc == 304 and entry is not None:
+            cache.refresh(key)
+            return self._parse_content(content, objectify_results,
+                                       content_type)
+        if 200 <= sc <= 299:
+            content_type = response.headers.get(
+                self._HEADER_CONTENT_TYPE_NAME)
+            result = self._parse_content(response.content, objectify_results,
+                                         content_type)
+            cache.store(key, uri, response.content,
+                        response.headers.get(self._HEADER_ETAG_NAME),
+                        content_type)
+            return result
+
+        self._response_code_to_exception(
+            sc, self._get_response_request_id(response),
+            self._parse_error_content(response))
+
+    def _get_cache_identity(self):
+        """Return the identity cached responses of the session belong to.
+
+        Cached responses are only served to sessions of the same user, so
+        clients of different users can share a response cache.
+
+        :return: user@org of the session, or a hash of the session token if
+            the client did not log in with credentials.
+
+        :rtype: str
+        """
+        if self._login_user is not None:
+            return self._login_user
+        token = self._get_auth_token()
+        if token is None:
+            return None
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    def _invalidate_cached_resource(self, uri):
+        """Drop cached responses of a resource that may have changed.
+
+        :param str uri: resource uri.
+        """
+        if self._response_cache is not None and uri is not None:
+            self._response_cache.invalidate(uri)
 
     @staticmethod
     def _response_code_to_exception(sc, request_id, objectify_response):
@@ -1140,41 +2285,244 @@ class Client(object):
                 response_body = response.content.decode(self.fsencoding)
             self._logger.debug('Response body: %s' % response_body)
 
-    def _do_request_prim(self,
-                         method,
-                         uri,
-                         session,
-                         contents=None,
-                         media_type=None,
-                         accept_type=None,
-                         auth=None,
-                         params=None):
+    def _build_request_headers(self, media_type=None, accept_type=None):
+        """Build the Content-Type and versioned Accept headers of a request.
+
+        :param str media_type: media type of the request body, if any.
+        :param str accept_type: accepted response media type, defaults to
+            'application/*+xml'.
+
+        :return: request headers.
+
+        :rtype: dict
+        """
         headers = {}
         if media_type is not None:
             headers[self._HEADER_CONTENT_TYPE_NAME] = media_type
         headers[self._HEADER_ACCEPT_NAME] = '%s;version=%s' % \
             ('application/*+xml' if accept_type is None else accept_type,
              self._api_version)
+        return headers
+
+    @staticmethod
+    def _serialize_contents(contents):
+        """Serialize a request body.
+
+        :param contents: an lxml element, a dict to be sent as JSON, or None.
 
+        :return: the serialized body or None.
+
+        :rtype: bytes or str
+        """
         if contents is None:
-            data = None
-        else:
-            if isinstance(contents, dict):
-                data = json.dumps(contents)
-            else:
-                data = etree.tostring(contents)
+            return None
+        if isinstance(contents, dict):
+            return json.dumps(contents)
+        return etree.tostring(contents)
+
+    def _do_request_prim(self,
+                         method,
+                         uri,
+                         session,
+                         contents=None,
+                         media_type=None,
+                         accept_type=None,
+                         auth=None,
+                         params=None,
+                         stream=False,
+                         headers=None):
+        request_headers = self._build_request_headers(media_type, accept_type)
+        if headers is not None:
+            request_headers.update(headers)
+        data = self._serialize_contents(contents)
 
         response = session.request(
             method,
             uri,
             params=params,
             data=data,
-            headers=headers,
+            headers=request_headers,
             auth=auth,
-            verify=self._verify_ssl_certs)
+            verify=self._verify_ssl_certs,
+            stream=stream)
+
+        self._log_request_response(
+            response=response,
+            request_body=data,
+            skip_logging_response_body=stream)
+        if not stream:
+            self._record_transfer(response)
+
+        return response
+
+    @staticmethod
+    def _new_transfer_stats():
+        return {
+            'responses': 0,
+            'compressed_responses': 0,
+            'content_bytes': 0,
+            'wire_bytes': 0,
+            'unmeasured_responses': 0
+        }
+
+    def _record_transfer(self, response):
+        """Account for the size of a response, compressed and uncompressed.
+
+        The size on the wire of a compressed response is only known if it
+        is delimited by a Content-Length. It is None for chunked compressed
+        responses, which are counted as unmeasured.
+
+        :param requests.Response response: a response whose content has
+            been read.
+        """
+        content_bytes = len(response.content or b'')
+        encoding = response.headers.get(self._HEADER_CONTENT_ENCODING_NAME)
+        compressed = encoding not in (None, 'identity')
+        if not compressed:
+            wire_bytes = content_bytes
+        else:
+            raw = response.raw
+            wire_bytes = raw.tell() if hasattr(raw, 'tell') else 0
+            if wire_bytes == 0 and content_bytes > 0:
+                wire_bytes = None
+        with self._transfer_stats_lock:
+            stats = self._transfer_stats
+            stats['responses'] += 1
+            if compressed:
+                stats['compressed_responses'] += 1
+            if wire_bytes is None:
+                stats['unmeasured_responses'] += 1
+            else:
+                stats['content_bytes'] += content_bytes
+                stats['wire_bytes'] += wire_bytes
+        if self._log_requests:
+            self._logger.debug(
+                'Response size: %s bytes, %s bytes transferred' %
+                (content_bytes, 'unknown' if wire_bytes is None else
+                 wire_bytes))
+        listener = self._transfer_listener
+        if listener is not None:
+            listener(response.request.method, response.request.url,
+                     response.status_code, wire_bytes, content_bytes)
+
+    def set_transfer_listener(self, listener):
+        """Register a callable notified of the size of every response.
+
+        The listener is called as listener(method, uri, status_code,
+        wire_bytes, content_bytes) once the body of a response has been
+        read, on the thread that sent the request. wire_bytes is the size
+        of the body as transferred, i.e. compressed, or None if unknown,
+        content_bytes its size after decompression. Streamed downloads are
+        not reported.
+
+        :param listener: the callable, or None to remove the listener.
+        """
+        self._transfer_listener = listener
+
+    def get_transfer_stats(self):
+        """Return response size statistics since the client was created.
+
+        :return: the number of responses, how many were compressed and
+            how many had an unknown transferred size, and for the others
+            the total bytes transferred, total bytes after decompression
+            and the resulting compression ratio.
+
+        :rtype: dict
+        """
+        with self._transfer_stats_lock:
+            stats = dict(self._transfer_stats)
+        stats['compression_ratio'] = \
+            stats['content_bytes'] / stats['wire_bytes'] \
+            if stats['wire_bytes'] > 0 else None
+        return stats
+
+    def reset_transfer_stats(self):
+        """Reset the response size statistics."""
+        with self._transfer_stats_lock:
+            self._transfer_stats = self._new_transfer_stats()
+
+    def _send_get(self, uri, params=None, headers=None, accept_type=None):
+        """Send a GET, sharing the response with identical concurrent GETs.
+
+        Unless request coalescing is enabled this is a plain GET. Otherwise
+        the first caller sends the request and callers arriving while it is
+        in flight wait for its response instead of sending their own. The
+        response is shared read-only, callers parse its content themselves.
+
+        :param str uri: resource uri.
+        :param dict params: query parameters.
+        :param dict headers: extra request headers.
+        :param str accept_type: accepted response media type.
+
+        :return: the response.
+
+        :rtype: requests.Response
+        """
+        if not self._coalesce_requests:
+            return self._do_request_prim(
+                'GET',
+                uri,
+                self._get_session(),
+                accept_type=accept_type,
+                params=params,
+                headers=headers)
+
+        key = (uri,
+               None if params is None else tuple(sorted(params.items())),
+               None if headers is None else tuple(sorted(headers.items())),
+               accept_type, self._api_version)
+        with self._in_flight_gets_lock:
+            future = self._in_flight_gets.get(key)
+            leader = future is None
+            if leader:
+                future = concurrent.futures.Future()
+                self._in_flight_gets[key] = future
+        if not leader:
+            return future.result()
+
+        try:
+            response = self._do_request_prim(
+                'GET',
+                uri,
+                self._get_session(),
+                accept_type=accept_type,
+                params=params,
+                headers=headers)
+            # Read the body before publishing the response to followers.
+            response.content
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._in_flight_gets_lock:
+                del self._in_flight_gets[key]
+
+    def _get_resource_stream(self, uri, params=None):
+        """Issue a GET whose response body is read incrementally.
+
+        :param str uri: resource uri.
+        :param dict params: query parameters.
 
-        self._log_request_response(response=response, request_body=data)
+        :return: the response, with its body not read yet. The caller must
+            close it.
 
+        :rtype: requests.Response
+
+        :raises VcdResponseException: if the server returns an error status.
+        """
+        response = self._do_request_prim(
+            'GET', uri, self._get_session(), params=params, stream=True)
+        sc = response.status_code
+        if not 200 <= sc <= 299:
+            try:
+                self._response_code_to_exception(
+                    sc, self._get_response_request_id(response),
+                    _objectify_response(response))
+            finally:
+                response.close()
         return response
 
     def upload_fragment(self, uri, contents, range_str):
@@ -1184,12 +2532,13 @@ class Client(object):
         data = contents
 
         # If we pump data too fast, server can reply back with statuses other
-        # than 200 e.g. 416. As counter measure, on receiving non 200 status,
-        # we will retry the upload for a fixed number of times. If all the
+        # than 200 e.g. 416, or drop the connection. As counter measure, we
+        # will retry the upload for a fixed number of times, backing off
+        # exponentially to give the server time to recover. If all the
         # retry efforts fail, we will fail the upload completely and return.
         for attempt in range(1, self._UPLOAD_FRAGMENT_MAX_RETRIES + 1):
             try:
-                response = self._session.put(
+                response = self._get_session().put(
                     uri,
                     data=data,
                     headers=headers,
@@ -1201,12 +2550,16 @@ class Client(object):
                     self._response_code_to_exception(sc, None, response)
                 else:
                     return response
-            except VcdResponseException:
+            except (VcdResponseException, requests.exceptions.ConnectionError):
                 # retry if not the last attempt
                 if attempt < self._UPLOAD_FRAGMENT_MAX_RETRIES:
+                    delay = self._UPLOAD_FRAGMENT_RETRY_BACKOFF.next_delay(
+                        attempt, None)
                     self._logger.debug(
-                        'Failure: attempt#%s to upload data in '
-                        'range %s failed. Retrying.' % (attempt, range_str))
+                        'Failure: attempt#%s to upload data in range %s '
+                        'failed. Retrying in %.1f seconds.' %
+                        (attempt, range_str, delay))
+                    time.sleep(delay)
                     continue
                 else:
                     self._logger.error(
@@ -1218,9 +2571,45 @@ class Client(object):
                           file_name,
                           chunk_size=SIZE_1MB,
                           size=0,
-                          callback=None):
-
-        response = self._session.get(
+                          callback=None,
+                          download_workers=1):
+        """Downloads the contents of an uri into a local file.
+
+        With several workers, a file larger than one range is preallocated
+        and split into ranges downloaded concurrently, each with its own GET
+        request carrying a Range header, and written at its offset in the
+        file. If vCD ignores the Range header, the file is downloaded with a
+        single request.
+
+        :param str uri: uri of the contents to download.
+        :param str file_name: name of the target file on local disk.
+        :param int chunk_size: size of the chunks read from the network and
+            written to the disk.
+        :param size: size of the contents, passed as is to callback. Ranged
+            downloads are only used if size is set.
+        :param function callback: a function with signature
+            function(bytes_written, total_size) to let the caller monitor
+            progress of the download operation. It is always called from the
+            calling thread.
+        :param int download_workers: number of ranges downloaded
+            concurrently. Each worker thread sends its requests on a session
+            of its own, and all sessions share the client's connection pool.
+            Size the pool accordingly.
+
+        :return: number of bytes written to the file.
+
+        :rtype: int
+
+        :raises: DownloadException: if a ranged download is incomplete.
+        """
+        # Empty files, whose ranges vCD rejects, and files that fit in one
+        # range are downloaded with a single plain request.
+        if download_workers > 1 and \
+           int(size or 0) > self._get_download_range_size(chunk_size):
+            return self._download_ranges(uri, file_name, chunk_size, size,
+                                         callback, download_workers)
+
+        response = self._get_session().get(
             uri, stream=True, verify=self._verify_ssl_certs)
         self._log_request_response(response, skip_logging_response_body=True)
 
@@ -1228,6 +2617,17 @@ class Client(object):
         if sc != 200:
             self._response_code_to_exception(sc, None, response)
 
+        return self._write_response_to_file(response, file_name, chunk_size,
+                                            size, callback)
+
+    def _write_response_to_file(self, response, file_name, chunk_size, size,
+                                callback):
+        """Write a streamed response body to a local file.
+
+        :return: number of bytes written to the file.
+
+        :rtype: int
+        """
         bytes_written = 0
         with open(file_name, 'wb') as f:
             for chunk in response.iter_content(chunk_size=chunk_size):
@@ -1239,6 +2639,137 @@ class Client(object):
                     self._logger.debug('Downloaded bytes : %s' % bytes_written)
         return bytes_written
 
+    def _get_range(self, uri, start, end):
+        """Send a GET request for a byte range of an uri.
+
+        The range is requested uncompressed, as the offsets of a compressed
+        response would not be those of the file.
+
+        :param str uri: uri of the contents.
+        :param int start: offset of the first byte of the range.
+        :param int end: offset of the last byte of the range.
+
+        :return: the streamed response, with status 206 if vCD honoured the
+            range, 200 if it sent the whole contents.
+
+        :rtype: requests.Response
+        """
+        headers = {
+            self._HEADER_RANGE_NAME: 'bytes=%s-%s' % (start, end),
+            self._HEADER_ACCEPT_ENCODING_NAME:
+            self._HEADER_ACCEPT_ENCODING_VALUE_IDENTITY
+        }
+        response = self._get_session().get(
+            uri, stream=True, headers=headers, verify=self._verify_ssl_certs)
+        self._log_request_response(response, skip_logging_response_body=True)
+
+        sc = response.status_code
+        if sc not in (200, 206):
+            try:
+                self._response_code_to_exception(sc, None, response)
+            finally:
+                response.close()
+        return response
+
+    def _get_download_range_size(self, chunk_size):
+        return max(chunk_size, self._DOWNLOAD_RANGE_SIZE)
+
+    def _download_ranges(self, uri, file_name, chunk_size, size, callback,
+                         download_workers):
+        """Download an uri with concurrent ranged requests.
+
+        See download_from_uri() for the parameters.
+
+        :return: number of bytes written to the file.
+
+        :rtype: int
+        """
+        range_size = self._get_download_range_size(chunk_size)
+        response = self._get_range(uri, 0, range_size - 1)
+        content_range = response.headers.get(self._HEADER_CONTENT_RANGE_NAME)
+        if response.status_code != 206 or content_range is None:
+            return self._write_response_to_file(response, file_name,
+                                                chunk_size, size, callback)
+        total_size = int(content_range.rsplit('/', 1)[1])
+
+        try:
+            with open(file_name, 'wb') as f:
+                f.truncate(total_size)
+        except Exception:
+            response.close()
+            raise
+
+        lock = threading.Lock()
+        progress = {'bytes_written': 0}
+        aborted = threading.Event()
+
+        def download_range(start, end, response=None):
+            if aborted.is_set():
+                if response is not None:
+                    response.close()
+                return
+            if response is None:
+                response = self._get_range(uri, start, end)
+                if response.status_code != 206:
+                    response.close()
+                    raise DownloadException(
+                        'Range %s-%s of %s was not sent.' % (start, end, uri))
+            bytes_written = 0
+            with response, open(file_name, 'r+b') as f:
+                f.seek(start)
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if aborted.is_set():
+                        return
+                    f.write(chunk)
+                    bytes_written += len(chunk)
+                    with lock:
+                        progress['bytes_written'] += len(chunk)
+            if bytes_written != end - start + 1:
+                raise DownloadException(
+                    'Download incomplete for range %s-%s of %s' %
+                    (start, end, uri))
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=download_workers)
+        pending = set()
+        first_range = None
+        try:
+            first_range = executor.submit(self._call_on_thread_session,
+                                          download_range, 0,
+                                          min(range_size, total_size) - 1,
+                                          response)
+            pending.add(first_range)
+            for start in range(range_size, total_size, range_size):
+                pending.add(
+                    executor.submit(self._call_on_thread_session,
+                                    download_range, start,
+                                    min(start + range_size, total_size) - 1))
+            reported_bytes = 0
+            while len(pending) > 0:
+                done, pending = concurrent.futures.wait(
+                    pending,
+                    timeout=0.5,
+                    return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+                with lock:
+                    bytes_written = progress['bytes_written']
+                if bytes_written != reported_bytes:
+                    reported_bytes = bytes_written
+                    if callback is not None:
+                        callback(bytes_written, size)
+                    self._logger.debug('Downloaded bytes : %s' % bytes_written)
+        finally:
+            aborted.set()
+            for future in pending:
+                future.cancel()
+            # The response of the first range is closed by its download,
+            # unless the download never ran.
+            if first_range is None or first_range.cancelled():
+                response.close()
+            executor.shutdown(wait=True)
+        return reported_bytes
+
     def put_resource(self,
                      uri,
                      contents,
@@ -1257,12 +2788,20 @@ class Client(object):
             objectify_results=objectify_results,
             params=params)
 
-    def put_linked_resource(self, resource, rel, media_type, contents):
+    def put_linked_resource(self,
+                            resource,
+                            rel,
+                            media_type,
+                            contents,
+                            link_index=None):
         """Puts to a resource link.
 
         Puts the contents of the resource referenced by the link with the
         specified rel and mediaType in the specified resource.
 
+        :param dict link_index: links of the resource as returned by
+            index_links(), looked up instead of scanning the resource.
+
         :return: the result of the PUT operation.
 
         :raises: OperationNotSupportedException: if the operation fails due to
@@ -1270,7 +2809,8 @@ class Client(object):
         """
         try:
             return self.put_resource(
-                find_link(resource, rel, media_type).href, contents,
+                find_link(resource, rel, media_type,
+                          link_index=link_index).href, contents,
                 media_type)
         except MissingLinkException as e:
             raise OperationNotSupportedException from e
@@ -1294,12 +2834,20 @@ class Client(object):
             objectify_results=objectify_results,
             params=params)
 
-    def post_linked_resource(self, resource, rel, media_type, contents):
+    def post_linked_resource(self,
+                             resource,
+                             rel,
+                             media_type,
+                             contents,
+                             link_index=None):
         """Posts to a resource link.
 
         Posts the contents of the resource referenced by the link with the
         specified rel and mediaType in the specified resource.
 
+        :param dict link_index: links of the resource as returned by
+            index_links(), looked up instead of scanning the resource.
+
         :return: the result of the POST operation.
 
         :raises: OperationNotSupportedException: if the operation fails due to
@@ -1307,26 +2855,50 @@ class Client(object):
         """
         try:
             return self.post_resource(
-                find_link(resource, rel, media_type).href, contents,
+                find_link(resource, rel, media_type,
+                          link_index=link_index).href, contents,
                 media_type)
         except MissingLinkException as e:
             raise OperationNotSupportedException(
                 "Operation is not supported").with_traceback(e.__traceback__)
 
-    def get_resource(self, uri, params=None, objectify_results=True):
+    def get_resource(self,
+                     uri,
+                     params=None,
+                     objectify_results=True,
+                     use_cache=True,
+                     json_results=False):
         """Gets the specified contents to the specified resource.
 
         This method does an HTTP GET.
+
+        :param bool use_cache: if False bypass the client's response cache,
+            if it has one.
+        :param bool json_results: if True request the JSON representation
+            of the resource and return it as a dict, which is faster to
+            parse and smaller than XML. objectify_results is then ignored.
         """
         return self._do_request(
-            'GET', uri, objectify_results=objectify_results, params=params)
-
-    def get_linked_resource(self, resource, rel, media_type):
+            'GET',
+            uri,
+            objectify_results=objectify_results,
+            params=params,
+            use_cache=use_cache,
+            accept_type=self._ACCEPT_TYPE_JSON if json_results else None)
+
+    def get_linked_resource(self,
+                            resource,
+                            rel,
+                            media_type,
+                            link_index=None):
         """Gets the content of the resource link.
 
         Gets the contents of the resource referenced by the link with the
         specified rel and mediaType in the specified resource.
 
+        :param dict link_index: links of the resource as returned by
+            index_links(), looked up instead of scanning the resource.
+
         :return: an object containing XML representation of the resource the
             link points to.
 
@@ -1336,7 +2908,9 @@ class Client(object):
             the link being not visible to the logged in user of the client.
         """
         try:
-            return self.get_resource(find_link(resource, rel, media_type).href)
+            return self.get_resource(
+                find_link(resource, rel, media_type,
+                          link_index=link_index).href)
         except MissingLinkException as e:
             raise OperationNotSupportedException(
                 "Operation is not supported").with_traceback(e.__traceback__)
@@ -1345,18 +2919,26 @@ class Client(object):
         full_uri = '%s?force=%s&recursive=%s' % (uri, force, recursive)
         return self._do_request('DELETE', full_uri, params=params)
 
-    def delete_linked_resource(self, resource, rel, media_type):
+    def delete_linked_resource(self,
+                               resource,
+                               rel,
+                               media_type,
+                               link_index=None):
         """Deletes the resource referenced by the link.
 
         Deletes the resource referenced by the link with the specified rel and
         mediaType in the specified resource.
 
+        :param dict link_index: links of the resource as returned by
+            index_links(), looked up instead of scanning the resource.
+
         :raises: OperationNotSupportedException: if the operation fails due to
             the link being not visible to the logged in user of the client.
         """
         try:
             return self.delete_resource(
-                find_link(resource, rel, media_type).href)
+                find_link(resource, rel, media_type,
+                          link_index=link_index).href)
         except MissingLinkException as e:
             raise OperationNotSupportedException(
                 "Operation is not supported").with_traceback(e.__traceback__)
@@ -1461,12 +3043,41 @@ class Client(object):
 
     def _get_query_list_map(self):
         if self._query_list_map is None:
-            self._query_list_map = {}
-            for link in self.get_query_list().Link:
-                self._query_list_map[(link.get('type'),
-                                      link.get('name'))] = link.get('href')
+            with self._lock:
+                if self._query_list_map is None:
+                    self._query_list_map = self._load_query_list_map()
+                    if self._session_cache_key is not None:
+                        query_list = [[media_type, name, href]
+                                      for (media_type, name), href in
+                                      self._query_list_map.items()]
+                        self._session_cache.update(
+                            self._session_cache_key,
+                            self._get_auth_token(),
+                            query_list_map=query_list)
         return self._query_list_map
 
+    def _load_query_list_map(self):
+        """Return the query list map of the session, fetching it if needed.
+
+        :return: query hrefs keyed by (media type, query name).
+
+        :rtype: dict
+        """
+        cache = self._server_info_cache
+        if cache is not None and self._login_user is not None:
+            query_list_map = cache.get_query_list_map(
+                self._uri, self._api_version, self._login_user)
+            if query_list_map is not None:
+                return query_list_map
+        query_list_map = {}
+        for link in self.get_query_list().Link:
+            query_list_map[(link.get('type'),
+                            link.get('name'))] = link.get('href')
+        if cache is not None and self._login_user is not None:
+            cache.set_query_list_map(self._uri, self._api_version,
+                                     self._login_user, query_list_map)
+        return query_list_map
+
     def get_typed_query(self,
                         query_type_name,
                         query_result_format=QueryResultFormat.REFERENCES,
@@ -1476,13 +3087,19 @@ class Client(object):
                         equality_filter=None,
                         sort_asc=None,
                         sort_desc=None,
-                        fields=None):
+                        fields=None,
+                        prefetch_workers=None,
+                        streaming=False,
+                        compact=False,
+                        json_results=False):
         """Issue a typed query using vCD query API.
 
         :param str query_type_name: name of the entity, which should be a
             string listed in ResourceType enum values.
         :param QueryResultFormat query_result_format: format of query result.
-        :param int page_size: number of entries per page.
+        :param page_size: number of entries per page. 'auto' requests the
+            largest page size vCD allows by default (128), which minimizes
+            round trips of bulk scans. None uses the server default of 25.
         :param include_links: (not used).
         :param str qfilter: filter expression for the query. Is normally made
             up of sub expressions, where each sub-expression is of the form
@@ -1501,6 +3118,25 @@ class Client(object):
         :param str sort_desc: if 'name' field is present in the result sort
             descending by that field.
         :param str fields: comma separated list of fields to return.
+        :param int prefetch_workers: if set, the number of pages fetched
+            concurrently. The remaining pages are computed from the total and
+            page size of the first page and fetched in parallel, while
+            records are still returned in order. Use a stable sort order and
+            a connection pool at least this large.
+        :param bool streaming: if True, parse each page incrementally while
+            it is downloaded and detach every record from its page before
+            returning it, so no page is held in memory as a whole. This
+            lowers peak memory and time to first record of large queries.
+            prefetch_workers is ignored in this mode.
+        :param bool compact: if True, return QueryRecord objects holding only
+            the record attributes instead of lxml elements. With fields set,
+            every record has href, id and the requested fields, None when
+            absent.
+        :param bool json_results: if True, request the JSON representation
+            of result pages and return records as dicts, which is faster to
+            parse than XML. Records contain the attributes of XML records
+            as keys, plus nested 'link' and 'metadata' values. Cannot be
+            combined with streaming or compact.
 
         :return: A query object that runs the query when execute()
             method is called.
@@ -1517,7 +3153,11 @@ class Client(object):
             equality_filter=equality_filter,
             sort_asc=sort_asc,
             sort_desc=sort_desc,
-            fields=fields)
+            fields=fields,
+            prefetch_workers=prefetch_workers,
+            streaming=streaming,
+            compact=compact,
+            json_results=json_results)
 
     def _get_wk_resource(self, wk_type):
         return self.get_resource(self._get_wk_endpoint(wk_type))
@@ -1531,7 +3171,12 @@ class Client(object):
                 str(wk_type).split('.')[-1])
 
 
-def find_link(resource, rel, media_type, fail_if_absent=True, name=None):
+def find_link(resource,
+              rel,
+              media_type,
+              fail_if_absent=True,
+              name=None,
+              link_index=None):
     """Returns the link of the specified rel and type in the resource.
 
     :param lxml.objectify.ObjectifiedElement resource: the resource with the
@@ -1540,6 +3185,8 @@ def find_link(resource, rel, media_type, fail_if_absent=True, name=None):
     :param str media_type: media type of content.
     :param bool fail_if_absent: if True raise an exception if there's
         not exactly one link of the specified rel and media type.
+    :param dict link_index: links of the resource as returned by
+        index_links(), looked up instead of scanning the resource.
 
     :return: an object containing Link XML element representing the desired
         link or None if no such link is present and fail_if_absent is False.
@@ -1551,7 +3198,7 @@ def find_link(resource, rel, media_type, fail_if_absent=True, name=None):
     :raises MultipleLinksException: if multiple links of the specified rel
         and media type are found
     """
-    links = get_links(resource, rel, media_type, name)
+    links = get_links(resource, rel, media_type, name, link_index)
     num_links = len(links)
     if num_links == 0:
         if fail_if_absent:
@@ -1564,19 +3211,27 @@ def find_link(resource, rel, media_type, fail_if_absent=True, name=None):
         raise MultipleLinksException(resource.get('href'), rel, media_type)
 
 
-def get_links(resource, rel=RelationType.DOWN, media_type=None, name=None):
+def get_links(resource,
+              rel=RelationType.DOWN,
+              media_type=None,
+              name=None,
+              link_index=None):
     """Returns all the links of the specified rel and type in the resource.
 
     :param lxml.objectify.ObjectifiedElement resource: the resource with the
         links.
     :param RelationType rel: the rel of the desired link.
     :param str media_type: media type of content.
+    :param dict link_index: links of the resource as returned by
+        index_links(), looked up instead of scanning the resource.
 
     :return: list of lxml.objectify.ObjectifiedElement objects, where each
         object contains a Link XML element. Result could include an empty list.
 
     :rtype: list
     """
+    if link_index is not None:
+        return list(link_index.get((rel.value, media_type, name), ()))
     links = []
     for link in resource.findall('{http://www.vmware.com/vcloud/v1.5}Link'):
         link_rel = link.get('rel')
@@ -1593,6 +3248,61 @@ def get_links(resource, rel=RelationType.DOWN, media_type=None, name=None):
     return links
 
 
+def index_links(resource):
+    """Index the links of a resource by rel, type and name.
+
+    Lookups of links in the index with find_link() or get_links() are dict
+    hits, instead of scans of all the links of the resource. The index does
+    not follow later changes to the links of the resource.
+
+    :param lxml.objectify.ObjectifiedElement resource: the resource with the
+        links.
+
+    :return: lists of Link objects keyed by (rel, media type, name), and by
+        (rel, media type, None) for links of any name.
+
+    :rtype: dict
+    """
+    index = {}
+    for elem in resource.findall('{http://www.vmware.com/vcloud/v1.5}Link'):
+        link = Link(elem)
+        index.setdefault((link.rel, link.media_type, None), []).append(link)
+        if link.name is not None:
+            index.setdefault((link.rel, link.media_type, link.name),
+                             []).append(link)
+    return index
+
+
+class _LinkIndexMixin(object):
+    """Indexes the links of the resource held by a resource wrapper.
+
+    The wrapper holds its resource in self.resource. The index is built once
+    per resource object, and rebuilt when self.resource is replaced.
+    """
+
+    _link_index = None
+
+    def _get_link_index(self, resource):
+        """Return the links of resource, indexed once per resource.
+
+        :param lxml.objectify.ObjectifiedElement resource: the resource with
+            the links.
+
+        :return: the links as returned by index_links() if resource is the
+            resource held by the wrapper, else None so that lookups scan
+            resource.
+
+        :rtype: dict
+        """
+        if resource is None or resource is not self.resource:
+            return None
+        link_index = self._link_index
+        if link_index is None or link_index[0] is not resource:
+            link_index = (resource, index_links(resource))
+            self._link_index = link_index
+        return link_index[1]
+
+
 class Link(object):
     """Abstraction over <Link> elements."""
 
@@ -1604,9 +3314,113 @@ class Link(object):
             if 'name' in link_elem.attrib else None
 
 
+class QueryRecord(object):
+    """Compact, read-only representation of a query result record.
+
+    Records only keep the attribute values of the XML record, in
+    __slots__ shared by every record with the same type and attribute
+    names, so they are far smaller and faster to read than the original
+    lxml elements. Child elements, e.g. metadata values, are not kept.
+
+    Attributes are accessible as object attributes (names that are not
+    valid identifiers have invalid characters replaced by '_'), through
+    get() like on the original element, or via to_dict().
+    """
+
+    __slots__ = ()
+    record_type = None
+    _fields = ()
+    _attributes = ()
+
+    def __init__(self, *values):
+        for field, value in zip(self._fields, values):
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('%s is read-only' % type(self).__name__)
+
+    def get(self, name, default=None):
+        """Return the value of the record attribute with the given name.
+
+        :param str name: XML attribute name.
+        :param default: value returned if the record has no such attribute.
+        """
+        try:
+            index = self._attributes.index(name)
+        except ValueError:
+            return default
+        value = getattr(self, self._fields[index])
+        return default if value is None else value
+
+    def to_dict(self):
+        """Return the record's attributes as a dictionary.
+
+        :rtype: dict
+        """
+        return {
+            attribute: getattr(self, field)
+            for attribute, field in zip(self._attributes, self._fields)
+        }
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, field) for field in self._fields))
+
+    def __repr__(self):
+        return '%s(%s)' % (self.record_type, ', '.join(
+            '%s=%r' % (field, getattr(self, field))
+            for field in self._fields))
+
+
+_record_classes = {}
+_record_classes_lock = threading.Lock()
+
+
+def _get_record_class(record_type, attributes):
+    """Return the QueryRecord subclass for a record type and attribute set.
+
+    Classes are created once per distinct (record type, attributes) pair and
+    then shared by all records with that shape.
+
+    :param str record_type: record element name, e.g. 'VMRecord'.
+    :param tuple attributes: XML attribute names.
+
+    :rtype: type
+    """
+    key = (record_type, attributes)
+    record_class = _record_classes.get(key)
+    if record_class is None:
+        with _record_classes_lock:
+            record_class = _record_classes.get(key)
+            if record_class is None:
+                fields = []
+                for attribute in attributes:
+                    field = re.sub(r'\W', '_', attribute)
+                    if not field.isidentifier() or keyword.iskeyword(field) \
+                       or field in fields or hasattr(QueryRecord, field):
+                        field = '_' + field
+                    fields.append(field)
+                record_class = type(
+                    record_type, (QueryRecord, ), {
+                        '__slots__': tuple(fields),
+                        'record_type': record_type,
+                        '_fields': tuple(fields),
+                        '_attributes': attributes
+                    })
+                _record_classes[key] = record_class
+    return record_class
+
+
 class _AbstractQuery(object):
     """Implements internal query object representation."""
 
+    # page_size value requesting the largest page the server returns.
+    AUTO_PAGE_SIZE = 'auto'
+    # Default of the vCD restapi.queryservice.maxPageSize setting.
+    _MAX_PAGE_SIZE = 128
+
     def __init__(self,
                  query_result_format,
                  client,
@@ -1616,13 +3430,18 @@ class _AbstractQuery(object):
                  equality_filter=None,
                  sort_asc=None,
                  sort_desc=None,
-                 fields=None):
+                 fields=None,
+                 prefetch_workers=None,
+                 streaming=False,
+                 compact=False,
+                 json_results=False):
         """Constructor for _AbstractQuery object.
 
         :param QueryResultFormat query_result_format: format of query result.
         :param pyvcloud.vcd.client.Client client: the client that will be used
             to make REST calls to vCD.
-        :param int page_size:
+        :param page_size: number of records per page, 'auto' for the server
+            maximum or None for the server default.
         :param bool include_links: if True, query result will include links in
             the body.
         :param str qfilter: filter expression for the query. The values in the
@@ -1638,7 +3457,20 @@ class _AbstractQuery(object):
             order. attribute-name cannot include metadata.
         :param str fields: comma-separated list of attribute names or metadata
             key names to return
+        :param int prefetch_workers: number of result pages to fetch
+            concurrently, None fetches pages one after the other.
+        :param bool streaming: if True, parse result pages incrementally
+            while they are downloaded.
+        :param bool compact: if True, return results as QueryRecord objects.
+        :param bool json_results: if True, request JSON result pages and
+            return records as dicts.
+
+        :raises InvalidParameterException: if json_results is combined with
+            streaming or compact.
         """
+        if json_results and (streaming or compact):
+            raise InvalidParameterException(
+                'JSON results cannot be streamed or compacted.')
         self._client = client
         self._query_result_format = query_result_format
         self._page_size = page_size
@@ -1659,6 +3491,19 @@ class _AbstractQuery(object):
         self._sort_asc = sort_asc
 
         self.fields = fields
+        self._prefetch_workers = prefetch_workers
+        self._streaming = streaming
+        self._compact = compact
+        self._json_results = json_results
+        self._compact_attributes = None
+        if compact and fields is not None:
+            attributes = ['href', 'id']
+            for field in fields.split(','):
+                # Metadata values are child elements, not attributes.
+                if not field.startswith('metadata') and \
+                   field not in attributes:
+                    attributes.append(field)
+            self._compact_attributes = tuple(attributes)
 
     def execute(self):
         """Executes query and returns results.
@@ -1677,22 +3522,194 @@ class _AbstractQuery(object):
             self._filter,
             self._include_links,
             fields=self.fields)
-        return self._iterator(self._client.get_resource(query_uri))
+        if self._streaming:
+            results = self._streaming_iterator(query_uri)
+        else:
+            query_results = self._get_page(query_uri)
+            if self._prefetch_workers is not None and \
+               self._prefetch_workers > 1:
+                results = self._prefetch_iterator(query_href, query_results)
+            else:
+                results = self._iterator(query_results)
+        if self._compact:
+            return map(self._to_compact_record, results)
+        return results
+
+    def _to_compact_record(self, record):
+        attrib = record.attrib
+        attributes = self._compact_attributes
+        if attributes is None:
+            attributes = tuple(attrib.keys())
+        record_class = _get_record_class(record.tag.rpartition('}')[2],
+                                         attributes)
+        return record_class(*[attrib.get(a) for a in attributes])
+
+    def _get_page(self, page_uri):
+        return self._client.get_resource(
+            page_uri,
+            objectify_results=True,
+            use_cache=False,
+            json_results=self._json_results)
 
     def _iterator(self, query_results):
         while True:
             next_page_uri = None
-            for r in query_results.iterchildren():
-                tag = etree.QName(r.tag)
-                if tag.localname == 'Link':
-                    if r.get('rel') == RelationType.NEXT_PAGE.value:
-                        next_page_uri = r.get('href')
-                else:
-                    yield r
+            if isinstance(query_results, dict):
+                yield from self._page_records(query_results)
+                for link in query_results.get('link') or ():
+                    if link.get('rel') == RelationType.NEXT_PAGE.value:
+                        next_page_uri = link.get('href')
+            else:
+                for r in query_results.iterchildren():
+                    tag = etree.QName(r.tag)
+                    if tag.localname == 'Link':
+                        if r.get('rel') == RelationType.NEXT_PAGE.value:
+                            next_page_uri = r.get('href')
+                    else:
+                        yield r
             if next_page_uri is None:
                 break
-            query_results = self._client.get_resource(
-                next_page_uri, objectify_results=True)
+            query_results = self._get_page(next_page_uri)
+
+    def _prefetch_iterator(self, query_href, query_results):
+        """Yield records, fetching the pages after the first concurrently.
+
+        :param str query_href: base href of the query.
+        :param query_results: first page of results, an
+            lxml.objectify.ObjectifiedElement or a dict for JSON results.
+        """
+        total = int(query_results.get('total', 0))
+        page_size = int(query_results.get('pageSize', 0))
+        if page_size == 0 or total <= self._page * page_size:
+            yield from self._iterator(query_results)
+            return
+        last_page = (total + page_size - 1) // page_size
+        page_uris = (self._build_query_uri(
+            query_href,
+            page,
+            self._page_size,
+            self._filter,
+            self._include_links,
+            fields=self.fields) for page in range(self._page + 1,
+                                                  last_page + 1))
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._prefetch_workers)
+        in_flight = collections.deque()
+        try:
+            for page_uri in itertools.islice(page_uris,
+                                             self._prefetch_workers):
+                in_flight.append(
+                    executor.submit(self._client._call_on_thread_session,
+                                    self._get_page, page_uri))
+            yield from self._page_records(query_results)
+            while len(in_flight) > 0:
+                query_results = in_flight.popleft().result()
+                page_uri = next(page_uris, None)
+                if page_uri is not None:
+                    in_flight.append(
+                        executor.submit(self._client._call_on_thread_session,
+                                        self._get_page, page_uri))
+                yield from self._page_records(query_results)
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    _STREAM_CHUNK_SIZE = 64 * 1024
+    _LINK_TAG = '{%s}Link' % NSMAP['vcloud']
+    # Tags of the page element of records and references results.
+    _PAGE_TAGS = ('{%s}QueryResultRecords' % NSMAP['vcloud'],
+                  '{%s}References' % NSMAP['vcloud'])
+
+    def _streaming_iterator(self, query_uri):
+        """Yield records while pages are downloaded and parsed.
+
+        Records are moved out of their page as soon as they are parsed, so
+        records are freed once the caller drops them and the other records
+        parsed from the same chunk of the page.
+
+        :param str query_uri: uri of the first page.
+        """
+        huge_tree = self._client._huge_tree
+        records_parser = _get_parser(True, huge_tree)
+        while query_uri is not None:
+            response = self._client._get_resource_stream(query_uri)
+            query_uri = None
+            try:
+                # Only the start of the page element is reported. Reporting
+                # other elements would create a proxy for each of them,
+                # which costs more than parsing them.
+                parser = etree.XMLPullParser(
+                    events=('start', ),
+                    tag=self._PAGE_TAGS,
+                    remove_blank_text=True,
+                    resolve_entities=False,
+                    no_network=True,
+                    load_dtd=False,
+                    huge_tree=huge_tree)
+                page = None
+                for chunk in response.iter_content(
+                        chunk_size=self._STREAM_CHUNK_SIZE):
+                    parser.feed(chunk)
+                    if page is None:
+                        page = next(parser.read_events(), (None, None))[1]
+                        if page is None:
+                            continue
+                    # All children but the last one have been parsed.
+                    records = records_parser.makeelement('page')
+                    next_page_uri = self._move_records(page, len(page) - 1,
+                                                       records)
+                    if next_page_uri is not None:
+                        query_uri = next_page_uri
+                    yield from records.iterchildren()
+                root = parser.close()
+                if page is None:
+                    page = root
+                records = records_parser.makeelement('page')
+                next_page_uri = self._move_records(page, len(page), records)
+                if next_page_uri is not None:
+                    query_uri = next_page_uri
+                yield from records.iterchildren()
+            finally:
+                response.close()
+
+    def _move_records(self, page, count, records):
+        """Move the first children of a page to another element.
+
+        Element classes are looked up when elements are first accessed. The
+        records are moved without keeping references to them, so they get
+        their objectify classes when they are next accessed, under their
+        new parent as in buffered pages, once all their children are
+        parsed.
+
+        :param lxml.etree._Element page: the page element.
+        :param int count: number of children to move.
+        :param lxml.etree._Element records: element to move the records to.
+
+        :return: href of the next page if its link was moved, else None.
+
+        :rtype: str
+        """
+        next_page_uri = None
+        for elem in page[:count]:
+            if elem.tag == self._LINK_TAG:
+                page.remove(elem)
+                if elem.get('rel') == RelationType.NEXT_PAGE.value:
+                    next_page_uri = elem.get('href')
+            else:
+                records.append(elem)
+        return next_page_uri
+
+    @staticmethod
+    def _page_records(query_results):
+        if isinstance(query_results, dict):
+            # Records of JSON pages, references of the references format.
+            yield from query_results.get('record') or \
+                query_results.get('reference') or ()
+            return
+        for r in query_results.iterchildren():
+            if etree.QName(r.tag).localname != 'Link':
+                yield r
 
     def find_unique(self):
         """Convenience wrapper over execute().
@@ -1728,8 +3745,10 @@ class _AbstractQuery(object):
         uri += '&page='
         uri += str(page)
 
-        if (page_size is not None):
-            uri += 'pageSize='
+        if page_size == self.AUTO_PAGE_SIZE:
+            page_size = self._MAX_PAGE_SIZE
+        if page_size is not None:
+            uri += '&pageSize='
             uri += str(page_size)
 
         if qfilter is not None:
@@ -1767,7 +3786,11 @@ class _TypedQuery(_AbstractQuery):
                  equality_filter=None,
                  sort_asc=None,
                  sort_desc=None,
-                 fields=None):
+                 fields=None,
+                 prefetch_workers=None,
+                 streaming=False,
+                 compact=False,
+                 json_results=False):
         super(_TypedQuery, self).__init__(
             query_result_format,
             client,
@@ -1777,9 +3800,114 @@ class _TypedQuery(_AbstractQuery):
             equality_filter=equality_filter,
             sort_asc=sort_asc,
             sort_desc=sort_desc,
-            fields=fields)
+            fields=fields,
+            prefetch_workers=prefetch_workers,
+            streaming=streaming,
+            compact=compact,
+            json_results=json_results)
         self._query_type_name = query_type_name
 
+    # Query fields holding integers, exported as int64 columns.
+    _INTEGER_FIELDS = frozenset([
+        'cpuAllocationMhz', 'cpuLimitMhz', 'cpuReservationMhz', 'cpuUsedMhz',
+        'hardwareVersion', 'memoryAllocationMB', 'memoryLimitMB', 'memoryMB',
+        'memoryReservationMB', 'memoryUsedMB', 'numberOfCatalogs',
+        'numberOfCpus', 'numberOfDisks', 'numberOfMedia',
+        'numberOfStorageProfiles', 'numberOfVApps', 'numberOfVAppTemplates',
+        'numberOfVMs', 'numberOfVdcs', 'sizeMB', 'storageAllocationMB',
+        'storageKB', 'storageLimitMB', 'storageUsedMB', 'totalStorageMB'
+    ])
+
+    def to_columns(self, dtypes=None):
+        """Execute the query and return the results column by column.
+
+        Each requested field, or each record attribute if the query has no
+        fields, becomes a NumPy array with one entry per record, without
+        building a dictionary per record. Well-known numeric fields such as
+        numberOfCpus, memoryMB and storageKB become int64 arrays, or float64
+        arrays with NaN for records lacking the value. Other fields become
+        object arrays of strings, with None for missing values. Requires the
+        numpy package, e.g. pip install pyvcloud[columnar].
+
+        :param dict dtypes: numpy dtypes of columns, overriding the defaults,
+            e.g. {'isDeployed': bool, 'cpuSpeedMhz': 'float64',
+            'name': str}. Numeric columns are parsed as numbers, bool
+            columns are True for 'true', string columns hold '' for missing
+            values and other dtypes are converted by numpy from the
+            attribute strings.
+
+        :return: arrays keyed by field name.
+
+        :rtype: dict
+
+        :raises ClientException: if numpy is not installed.
+        :raises InvalidParameterException: if the query returns JSON results.
+        """
+        if self._json_results:
+            raise InvalidParameterException(
+                'to_columns() does not support JSON results.')
+        try:
+            import numpy
+        except ImportError:
+            raise ClientException('to_columns() requires the numpy package.')
+        if self.fields is not None:
+            names = [
+                field for field in self.fields.split(',')
+                if not field.startswith('metadata')
+            ]
+            columns = collections.OrderedDict((name, []) for name in names)
+            count = 0
+            for record in self.execute():
+                attrib = self._get_record_attributes(record)
+                for name, values in columns.items():
+                    values.append(attrib.get(name))
+                count += 1
+        else:
+            columns = collections.OrderedDict()
+            count = 0
+            for record in self.execute():
+                attrib = self._get_record_attributes(record)
+                for name in attrib.keys():
+                    if name not in columns:
+                        columns[name] = [None] * count
+                for name, values in columns.items():
+                    values.append(attrib.get(name))
+                count += 1
+
+        dtypes = dtypes or {}
+        arrays = collections.OrderedDict()
+        for name, values in columns.items():
+            dtype = dtypes.get(name)
+            if dtype is None and name in self._INTEGER_FIELDS:
+                dtype = numpy.int64
+            dtype = numpy.dtype(object if dtype is None else dtype)
+            if dtype.kind == 'O':
+                array = numpy.empty(count, dtype=object)
+                array[:] = values
+            elif dtype == numpy.bool_:
+                array = numpy.array([v == 'true' for v in values],
+                                    dtype=numpy.bool_)
+            elif dtype.kind in 'iufc':
+                array = numpy.array(
+                    ['nan' if v is None else v for v in values],
+                    dtype=numpy.float64)
+                # Integer columns with missing values stay float64.
+                if dtype.kind not in 'iu' or not numpy.isnan(array).any():
+                    array = array.astype(dtype)
+            elif dtype.kind in 'US':
+                array = numpy.array(['' if v is None else v for v in values],
+                                    dtype=dtype)
+            else:
+                array = numpy.array(values, dtype=dtype)
+            arrays[name] = array
+        return arrays
+
+    @staticmethod
+    def _get_record_attributes(record):
+        if isinstance(record, QueryRecord):
+            return record.to_dict()
+        return record.attrib
+
     def _find_query_uri(self, query_result_format):
         (query_media_type, _) = query_result_format.value
         query_href = \
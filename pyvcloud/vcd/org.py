@@ -13,11 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+from concurrent.futures import ThreadPoolExecutor
+import io
 import math
 import os
 import shutil
 import tarfile
 import tempfile
+import threading
 import time
 import traceback
 import urllib
@@ -26,6 +30,8 @@ from lxml import etree
 from lxml import objectify
 
 from pyvcloud.vcd.acl import Acl
+from pyvcloud.vcd.client import _get_parser
+from pyvcloud.vcd.client import _LinkIndexMixin
 from pyvcloud.vcd.client import ApiVersion
 from pyvcloud.vcd.client import E
 from pyvcloud.vcd.client import E_OVF
@@ -36,13 +42,14 @@ from pyvcloud.vcd.client import NSMAP
 from pyvcloud.vcd.client import QueryResultFormat
 from pyvcloud.vcd.client import RelationType
 from pyvcloud.vcd.client import ResourceType
+from pyvcloud.vcd.exceptions import AccessForbiddenException
 from pyvcloud.vcd.exceptions import DownloadException
 from pyvcloud.vcd.exceptions import EntityNotFoundException
 from pyvcloud.vcd.exceptions import InvalidParameterException
+from pyvcloud.vcd.exceptions import NotFoundException
 from pyvcloud.vcd.exceptions import UploadException
 from pyvcloud.vcd.system import System
 from pyvcloud.vcd.utils import get_admin_href
-from pyvcloud.vcd.utils import get_safe_members_in_tar_file
 from pyvcloud.vcd.utils import to_dict
 
 # Uptil pyvcloud v20.0.0 1 MB was the default chunk size,
@@ -51,7 +58,7 @@ from pyvcloud.vcd.utils import to_dict
 DEFAULT_CHUNK_SIZE = 10 * 1024 * 1024
 
 
-class Org(object):
+class Org(_LinkIndexMixin):
     def __init__(self, client, href=None, resource=None):
         """Constructor for Org objects.
 
@@ -108,7 +115,8 @@ class Org(object):
         payload = E.AdminCatalog(E.Description(description), name=name)
         return self.client.post_linked_resource(
             self.resource, RelationType.ADD, EntityType.ADMIN_CATALOG.value,
-            payload)
+            payload,
+            link_index=self._get_link_index(self.resource))
 
     def delete_catalog(self, name):
         """Delete a catalog in the organization.
@@ -167,7 +175,8 @@ class Org(object):
         links = get_links(
             self.resource,
             rel=RelationType.DOWN,
-            media_type=EntityType.CATALOG.value)
+            media_type=EntityType.CATALOG.value,
+            link_index=self._get_link_index(self.resource))
         for link in links:
             if name == link.name:
                 if is_admin_operation:
@@ -373,7 +382,8 @@ class Org(object):
                               file_name,
                               chunk_size=DEFAULT_CHUNK_SIZE,
                               callback=None,
-                              task_callback=None):
+                              task_callback=None,
+                              download_workers=1):
         """Downloads an item from a catalog into a local file.
 
         :param str catalog_name: name of the catalog whose item needs to be
@@ -389,6 +399,12 @@ class Org(object):
         :param function task_callback: a function with signature
             function(task) to let the caller monitor the progress of enable
             download task.
+        :param int download_workers: number of concurrent downloads. Files
+            of a template are downloaded concurrently, and large files are
+            split in ranges downloaded concurrently. When several files are
+            downloaded at once, callback receives the progress of all the
+            files, and is called from worker threads, one call at a time.
+            Size the client's connection pool accordingly.
 
         :return: number of bytes written to file.
 
@@ -416,13 +432,20 @@ class Org(object):
                 file_name,
                 chunk_size=chunk_size,
                 size=size,
-                callback=callback)
+                callback=callback,
+                download_workers=download_workers)
         elif item_type == EntityType.VAPP_TEMPLATE.value:
             bytes_written = self._download_ovf(entity_resource, file_name,
-                                               chunk_size, callback)
+                                               chunk_size, callback,
+                                               download_workers)
         return bytes_written
 
-    def _download_ovf(self, entity_resource, file_name, chunk_size, callback):
+    def _download_ovf(self,
+                      entity_resource,
+                      file_name,
+                      chunk_size,
+                      callback,
+                      download_workers=1):
         """Helper method to download an ova file from vCD catalog.
 
         :param lxml.objectify.ObjectifiedElement entity_resource: an object
@@ -436,6 +459,8 @@ class Org(object):
         :param function callback: a function with signature
             function(bytes_written, total_size) to let the caller monitor
             progress of the download operation.
+        :param int download_workers: number of concurrent downloads, shared
+            between the files of the template.
 
         :return: number of bytes written to file.
 
@@ -466,12 +491,13 @@ class Org(object):
             ns = '{' + NSMAP['ovf'] + '}'
             files_to_tar = []
             for f in ovf_descriptor.References.File:
-                source_file_name = f.get(ns + 'href')
-                source_file_size = int(f.get(ns + 'size'))
-
                 # TODO() Add support for ns + 'chunkSize' - will need support
                 # for downloading part of a file at an offset from an uri.
+                files_to_tar.append((f.get(ns + 'href'),
+                                     int(f.get(ns + 'size'))))
 
+            def download_file(source_file_name, source_file_size,
+                              file_callback, range_workers):
                 target_file = os.path.join(tempdir, source_file_name)
                 uri = transfer_uri_base + source_file_name
                 num_bytes = self.client.download_from_uri(
@@ -479,17 +505,28 @@ class Org(object):
                     target_file,
                     chunk_size=chunk_size,
                     size=str(source_file_size),
-                    callback=callback)
+                    callback=file_callback,
+                    download_workers=range_workers)
                 if num_bytes != source_file_size:
                     raise DownloadException(
                         'Download incomplete for file %s' % source_file_name)
-                files_to_tar.append(source_file_name)
+
+            file_workers = max(1, min(download_workers, len(files_to_tar)))
+            range_workers = max(1, download_workers // file_workers)
+            if file_workers == 1:
+                for (source_file_name, source_file_size) in files_to_tar:
+                    download_file(source_file_name, source_file_size,
+                                  callback, range_workers)
+            else:
+                self._download_files_concurrently(
+                    files_to_tar, download_file, callback, file_workers,
+                    range_workers)
 
             with tarfile.open(file_name, 'w') as tar:
                 os.chdir(tempdir)
                 tar.add('descriptor.ovf')
-                for f in files_to_tar:
-                    tar.add(f)
+                for (source_file_name, _) in files_to_tar:
+                    tar.add(source_file_name)
         finally:
             if tempdir is not None:
                 os.chdir(cwd)
@@ -501,13 +538,60 @@ class Org(object):
 
         return bytes_written
 
+    def _download_files_concurrently(self, files, download_file, callback,
+                                     file_workers, range_workers):
+        """Helper method to download files with a pool of worker threads.
+
+        :param list files: tuples (file name, file size) of the files.
+        :param function download_file: a function with signature
+            function(file_name, file_size, file_callback, range_workers)
+            downloading one file.
+        :param function callback: a function with signature
+            function(bytes_written, total_size) called with the progress of
+            all the files, or None.
+        :param int file_workers: number of files downloaded concurrently.
+        :param int range_workers: number of concurrent ranged downloads of
+            each file.
+        """
+        lock = threading.Lock()
+        file_bytes_written = {}
+        total_size = sum(file_size for (_, file_size) in files)
+
+        def get_file_callback(file_name):
+            def file_callback(bytes_written, file_size):
+                with lock:
+                    file_bytes_written[file_name] = bytes_written
+                    if callback is not None:
+                        callback(
+                            sum(file_bytes_written.values()), total_size)
+
+            return file_callback
+
+        executor = ThreadPoolExecutor(max_workers=file_workers)
+        futures = []
+        try:
+            for (file_name, file_size) in files:
+                futures.append(
+                    executor.submit(self.client._call_on_thread_session,
+                                    download_file, file_name, file_size,
+                                    get_file_callback(file_name),
+                                    range_workers))
+            for future in futures:
+                future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
     def upload_media(self,
                      catalog_name,
                      file_name,
                      item_name=None,
                      description='',
                      chunk_size=DEFAULT_CHUNK_SIZE,
-                     callback=None):
+                     callback=None,
+                     upload_workers=1,
+                     journal=None):
         """Uploads a media file to a catalog.
 
         This method only uploads bits to vCD spool area, doesn't block while
@@ -526,6 +610,13 @@ class Org(object):
         :param function callback: a function with signature
             function(bytes_written, total_size) to let the caller monitor
             progress of the upload operation.
+        :param int upload_workers: number of chunks uploaded concurrently.
+            Each worker thread sends its chunks on a session of its own,
+            and all sessions share the client's connection pool. Size the
+            pool accordingly.
+        :param pyvcloud.vcd.upload_journal.UploadJournal journal: if set,
+            resume the upload recorded in the journal, if any, and record
+            the progress of the upload.
 
         :return: number of bytes uploaded to the catalog.
 
@@ -538,17 +629,45 @@ class Org(object):
         catalog_resource = self.get_catalog(catalog_name)
         if item_name is None:
             item_name = os.path.basename(file_name)
-        image_type = os.path.splitext(item_name)[1][1:]
-        media = E.Media(
-            name=item_name, size=str(stat_info.st_size), imageType=image_type)
-        media.append(E.Description(description))
-        catalog_item_resource = self.client.post_linked_resource(
-            catalog_resource, RelationType.ADD, EntityType.MEDIA.value, media)
-        entity_resource = self.client.get_resource(
-            catalog_item_resource.Entity.get('href'))
-        file_href = entity_resource.Files.File.Link.get('href')
-        return self._upload_file(
-            file_name, file_href, chunk_size=chunk_size, callback=callback)
+        journal_key = None
+        entity_resource = None
+        if journal is not None:
+            journal_key = journal.get_key(
+                catalog_resource.get('href'), item_name, file_name)
+            entity_resource = self._get_journaled_entity(journal, journal_key)
+        if entity_resource is None:
+            image_type = os.path.splitext(item_name)[1][1:]
+            media = E.Media(
+                name=item_name,
+                size=str(stat_info.st_size),
+                imageType=image_type)
+            media.append(E.Description(description))
+            catalog_item_resource = self.client.post_linked_resource(
+                catalog_resource, RelationType.ADD, EntityType.MEDIA.value,
+                media)
+            entity_href = catalog_item_resource.Entity.get('href')
+            entity_resource = self.client.get_resource(entity_href)
+            if journal is not None:
+                journal.start(journal_key, entity_href)
+        target_file = entity_resource.Files.File
+        file_href = target_file.Link.get('href')
+        try:
+            bytes_uploaded = self._upload_file(
+                file_name,
+                file_href,
+                chunk_size=chunk_size,
+                callback=self._get_journal_callback(journal, journal_key,
+                                                    file_href, callback),
+                upload_workers=upload_workers,
+                confirmed_bytes=self._get_confirmed_bytes(
+                    journal, journal_key, target_file))
+        except Exception:
+            if journal is not None:
+                journal.flush()
+            raise
+        if journal is not None:
+            journal.remove(journal_key)
+        return bytes_uploaded
 
     def upload_ovf(self,
                    catalog_name,
@@ -556,11 +675,14 @@ class Org(object):
                    item_name=None,
                    description='',
                    chunk_size=DEFAULT_CHUNK_SIZE,
-                   callback=None):
+                   callback=None,
+                   upload_workers=1,
+                   journal=None):
         """Uploads an ova file to a catalog.
 
         This method only uploads bits to vCD spool area, doesn't block while
-        vCD imports the uploaded bit into catalog.
+        vCD imports the uploaded bit into catalog. Files are read directly
+        from the ova, which is not extracted.
 
         :param str catalog_name: name of the catalog where the ova file will
             be uploaded.
@@ -575,6 +697,13 @@ class Org(object):
         :param function callback: a function with signature
             function(bytes_written, total_size) to let the caller monitor
             progress of the upload operation.
+        :param int upload_workers: number of chunks uploaded concurrently.
+            Each worker thread sends its chunks on a session of its own,
+            and all sessions share the client's connection pool. Size the
+            pool accordingly.
+        :param pyvcloud.vcd.upload_journal.UploadJournal journal: if set,
+            resume the upload recorded in the journal, if any, and record
+            the progress of the upload.
 
         :return: number of bytes uploaded to the catalog.
 
@@ -588,25 +717,30 @@ class Org(object):
             item_name = os.path.basename(file_name)
         total_bytes_uploaded = 0
 
+        ova = None
         try:
-            tempdir = tempfile.mkdtemp(dir='.')
+            # Referenced files are read straight out of the archive, an ova
+            # is never extracted to disk.
             ova = tarfile.open(file_name)
-            ova.extractall(
-                path=tempdir, members=get_safe_members_in_tar_file(ova))
-            ova.close()
-            ovf_file = None
-            extracted_files = os.listdir(tempdir)
-            for f in extracted_files:
-                fn, ex = os.path.splitext(f)
-                if ex == '.ovf':
-                    ovf_file = os.path.join(tempdir, f)
-                    break
-            if ovf_file is None:
+            members = {}
+            ovf_member = None
+            for member in ova.getmembers():
+                if not member.isfile():
+                    continue
+                member_name = os.path.normpath(member.name)
+                members[member_name] = member
+                if ovf_member is None and \
+                   os.path.dirname(member_name) == '' and \
+                   os.path.splitext(member_name)[1] == '.ovf':
+                    ovf_member = member
+            if ovf_member is None:
                 raise UploadException('OVF descriptor file not found.')
 
-            stat_info = os.stat(ovf_file)
-            total_bytes_uploaded += stat_info.st_size
-            ovf_resource = objectify.parse(ovf_file)
+            total_bytes_uploaded += ovf_member.size
+            with ova.extractfile(ovf_member) as ovf_file:
+                # The descriptor is untrusted input, parsed without
+                # resolving entities like responses of vCD.
+                ovf_resource = objectify.parse(ovf_file, _get_parser())
             files_to_upload = []
             ns = '{' + NSMAP['ovf'] + '}'
             for f in ovf_resource.getroot().References.File:
@@ -618,23 +752,37 @@ class Org(object):
                 }
                 files_to_upload.append(source_file)
 
-            params = E.UploadVAppTemplateParams(name=item_name)
-            params.append(E.Description(description))
-            catalog_item_resource = self.client.post_linked_resource(
-                catalog_resource, RelationType.ADD,
-                EntityType.UPLOAD_VAPP_TEMPLATE_PARAMS.value, params)
-
-            entity_href = catalog_item_resource.Entity.get('href')
-            entity_resource = self.client.get_resource(entity_href)
-            ovf_upload_href = entity_resource.Files.File.Link.get('href')
-            self.client.put_resource(ovf_upload_href, ovf_resource,
-                                     EntityType.TEXT_XML.value)
-
-            while True:
-                time.sleep(5)
+            journal_key = None
+            entity_resource = None
+            if journal is not None:
+                journal_key = journal.get_key(
+                    catalog_resource.get('href'), item_name, file_name)
+                entity_resource = self._get_journaled_entity(
+                    journal, journal_key)
+            if entity_resource is None:
+                params = E.UploadVAppTemplateParams(name=item_name)
+                params.append(E.Description(description))
+                catalog_item_resource = self.client.post_linked_resource(
+                    catalog_resource, RelationType.ADD,
+                    EntityType.UPLOAD_VAPP_TEMPLATE_PARAMS.value, params)
+                entity_href = catalog_item_resource.Entity.get('href')
                 entity_resource = self.client.get_resource(entity_href)
-                if len(entity_resource.Files.File) > 1:
-                    break
+                if journal is not None:
+                    journal.start(journal_key, entity_href)
+            entity_href = entity_resource.get('href')
+
+            # vCD lists the referenced files once it has the descriptor,
+            # which a resumed upload may have sent already.
+            if len(entity_resource.Files.File) < 2:
+                ovf_upload_href = entity_resource.Files.File.Link.get('href')
+                self.client.put_resource(ovf_upload_href, ovf_resource,
+                                         EntityType.TEXT_XML.value)
+
+                while True:
+                    time.sleep(5)
+                    entity_resource = self.client.get_resource(entity_href)
+                    if len(entity_resource.Files.File) > 1:
+                        break
 
             for source_file in files_to_upload:
                 source_file_name = source_file.get('href')
@@ -649,30 +797,42 @@ class Org(object):
                                           ' file %s' % source_file_name)
 
                 if source_file['chunkSize'] is not None:
-                    file_paths = self._get_multi_part_file_paths(
-                        tempdir, source_file_name, int(source_file_size),
+                    part_names = self._get_multi_part_file_names(
+                        source_file_name, int(source_file_size),
                         int(source_file['chunkSize']))
-                    total_bytes_uploaded += self._upload_multi_part_file(
-                        file_paths, target_uri, chunk_size, callback)
                 else:
-                    file_path = os.path.join(tempdir, source_file_name)
-                    total_bytes_uploaded += self._upload_file(
-                        file_path,
-                        target_uri,
-                        chunk_size=chunk_size,
-                        callback=callback)
+                    part_names = [source_file_name]
+                part_members = []
+                for part_name in part_names:
+                    member = members.get(os.path.normpath(part_name))
+                    if member is None:
+                        raise UploadException('File %s not found in %s.' %
+                                              (part_name, file_name))
+                    part_members.append(member)
+                total_bytes_uploaded += self._upload_tar_members(
+                    ova, part_members, target_uri, chunk_size,
+                    self._get_journal_callback(journal, journal_key,
+                                               target_uri, callback),
+                    upload_workers,
+                    self._get_confirmed_bytes(journal, journal_key,
+                                              target_file))
+            if journal is not None:
+                journal.remove(journal_key)
         except Exception as e:
+            if journal is not None:
+                journal.flush()
             print(traceback.format_exc())
             raise UploadException('Ovf upload failed').with_traceback(
                 e.__traceback__)
         finally:
-            shutil.rmtree(tempdir)
+            if ova is not None:
+                ova.close()
 
         return total_bytes_uploaded
 
-    def _get_multi_part_file_paths(self, base_dir, base_file_name,
-                                   total_file_size, part_size):
-        """Helper method to get path to multi-part files.
+    def _get_multi_part_file_names(self, base_file_name, total_file_size,
+                                   part_size):
+        """Helper method to get names of multi-part files.
 
         For example a file called test.vmdk with total_file_size = 100 bytes
         and part_size = 40 bytes, implies the file is made of *3* part
@@ -680,36 +840,110 @@ class Org(object):
             - test.vmdk.000000000 = 40 bytes
             - test.vmdk.000000001 = 40 bytes
             - test.vmdk.000000002 = 20 bytes
-        Say base_dir = '/dummy_path/', and base_file_name = 'test.vmdk' then
-        the output of this function will be ['/dummy_path/test.vmdk.000000000',
-        '/dummy_path/test.vmdk.000000001', '/dummy_path/test.vmdk.000000002',]
+        Say base_file_name = 'test.vmdk' then the output of this function will
+        be ['test.vmdk.000000000', 'test.vmdk.000000001',
+        'test.vmdk.000000002',]
 
-        :param str base_dir: base directory where the file parts are located.
         :param str base_file_name: common portion of the filename among all
             the part-files.
         :param int total_file_size: size of the entire file (sum of all
             parts).
         :param int part_size: size of each part of the file.
 
-        :return: a list of file-paths as strings, where each item corresponds
+        :return: a list of file names as strings, where each item corresponds
             to one part of the multi-part file.
 
         :rtype: list
         """
-        file_paths = []
+        file_names = []
         num_parts = math.ceil(total_file_size / part_size)
         for i in range(num_parts):
             postfix = ('000000000' + str(i))[-9:]
-            file_path = os.path.join(base_dir, base_file_name + '.' + postfix)
-            file_paths.append(file_path)
+            file_names.append(base_file_name + '.' + postfix)
+
+        return file_names
+
+    def _get_journaled_entity(self, journal, journal_key):
+        """Helper method to get the entity of an upload to resume.
+
+        :param pyvcloud.vcd.upload_journal.UploadJournal journal: the upload
+            journal.
+        :param str journal_key: journal key of the upload.
+
+        :return: the entity of the journaled catalog item, or None if there
+            is no upload to resume. Uploads whose entity is gone or no
+            longer accepts files are removed from the journal.
+
+        :rtype: lxml.objectify.ObjectifiedElement
+        """
+        upload = journal.load(journal_key)
+        if upload is None:
+            return None
+        try:
+            entity_resource = self.client.get_resource(upload['entity_href'])
+        except (AccessForbiddenException, NotFoundException):
+            entity_resource = None
+        if entity_resource is None or not hasattr(entity_resource, 'Files'):
+            journal.remove(journal_key)
+            return None
+        return entity_resource
+
+    def _get_confirmed_bytes(self, journal, journal_key, target_file):
+        """Helper method to get the uploaded prefix of a file to resume.
+
+        :param pyvcloud.vcd.upload_journal.UploadJournal journal: the upload
+            journal, or None.
+        :param str journal_key: journal key of the upload.
+        :param lxml.objectify.ObjectifiedElement target_file: the File
+            element of the file in the entity being uploaded.
+
+        :return: number of bytes of the file that need not be uploaded.
 
-        return file_paths
+        :rtype: int
+        """
+        if journal is None:
+            return 0
+        confirmed_bytes = journal.get_confirmed_bytes(
+            journal_key, target_file.Link.get('href'))
+        # vCD may have discarded bytes confirmed earlier, in which case the
+        # file is uploaded again from the start.
+        if int(target_file.get('bytesTransferred', 0)) < confirmed_bytes:
+            return 0
+        return confirmed_bytes
+
+    def _get_journal_callback(self, journal, journal_key, target_uri,
+                              callback):
+        """Helper method to record upload progress in a journal.
+
+        :param pyvcloud.vcd.upload_journal.UploadJournal journal: the upload
+            journal, or None.
+        :param str journal_key: journal key of the upload.
+        :param str target_uri: uri where the file is uploaded to.
+        :param function callback: the progress callback of the caller, or
+            None.
+
+        :return: a progress callback that records confirmed bytes before
+            calling callback.
+
+        :rtype: function
+        """
+        if journal is None:
+            return callback
+
+        def journal_callback(bytes_written, total_size):
+            journal.confirm(journal_key, target_uri, bytes_written)
+            if callback is not None:
+                callback(bytes_written, total_size)
+
+        return journal_callback
 
     def _upload_file(self,
                      file_name,
                      target_uri,
                      chunk_size=DEFAULT_CHUNK_SIZE,
-                     callback=None):
+                     callback=None,
+                     upload_workers=1,
+                     confirmed_bytes=0):
         """Helper function to upload contents of a local file.
 
         :param str file_name: name of the file on local disk whose content
@@ -721,45 +955,79 @@ class Org(object):
         :param function callback: a function with signature
             function(bytes_written, total_size) to let the caller monitor
             progress of the upload operation.
+        :param int upload_workers: number of chunks uploaded concurrently.
+        :param int confirmed_bytes: number of bytes at the start of the file
+            that were uploaded earlier, and are skipped.
 
         :return: number of bytes uploaded to the uri.
 
         :rtype: int
         """
         return self._upload_part_file(
-            file_name, target_uri, chunk_size=chunk_size, callback=callback)
-
-    def _upload_multi_part_file(self,
-                                part_file_paths,
-                                target_uri,
-                                chunk_size=DEFAULT_CHUNK_SIZE,
-                                callback=None):
-        """Helper function to upload contents of a multi-part local file.
-
-        :param list(str) part_file_paths: the path (with name) of the parts of
-            the file on local disk whose content will be uploaded to the uri.
-        :param str target_uri: uri where the contents of the local file will
-            be uploaded to.
-        :param int chunk_size: size of chunks in which the local file will be
+            file_name,
+            target_uri,
+            chunk_size=chunk_size,
+            callback=callback,
+            upload_workers=upload_workers,
+            confirmed_bytes=confirmed_bytes)
+
+    def _upload_tar_members(self,
+                            tar_file,
+                            part_members,
+                            target_uri,
+                            chunk_size=DEFAULT_CHUNK_SIZE,
+                            callback=None,
+                            upload_workers=1,
+                            confirmed_bytes=0):
+        """Helper function to upload a file stored in parts in a tar archive.
+
+        :param tarfile.TarFile tar_file: the archive, opened for reading.
+        :param list(tarfile.TarInfo) part_members: the members of the archive
+            holding the parts of the file, in order. A file stored in one
+            piece has a single part.
+        :param str target_uri: uri where the contents of the file will be
+            uploaded to.
+        :param int chunk_size: size of chunks in which the file will be
             uploaded.
         :param function callback: a function with signature
             function(bytes_written, total_size) to let the caller monitor
             progress of the upload operation.
+        :param int upload_workers: number of chunks uploaded concurrently.
+        :param int confirmed_bytes: number of bytes at the start of the file
+            that were uploaded earlier, and are skipped.
 
         :return: number of bytes uploaded to the uri.
 
         :rtype: int
         """
         total_bytes_to_upload = 0
-        for part_file in part_file_paths:
-            stat_info = os.stat(part_file)
-            total_bytes_to_upload += stat_info.st_size
-
+        for part_member in part_members:
+            total_bytes_to_upload += part_member.size
+
+        # Members of an uncompressed archive are read in place, straight
+        # into the upload buffers. Members of a compressed archive, and
+        # sparse members, are read through tarfile.
+        archive = tar_file.fileobj
+        if not isinstance(archive, io.BufferedReader):
+            archive = None
         uploaded_bytes = 0
-        for part_file_name in part_file_paths:
-            uploaded_bytes += self._upload_part_file(
-                part_file_name, target_uri, uploaded_bytes,
-                total_bytes_to_upload, chunk_size, callback)
+        for part_member in part_members:
+            skipped_bytes = min(part_member.size,
+                                max(0, confirmed_bytes - uploaded_bytes))
+            uploaded_bytes += skipped_bytes
+            if archive is not None and not part_member.issparse():
+                archive.seek(part_member.offset_data + skipped_bytes)
+                uploaded_bytes += self._upload_stream(
+                    archive, part_member.size - skipped_bytes, target_uri,
+                    uploaded_bytes, total_bytes_to_upload, chunk_size,
+                    callback, upload_workers)
+                continue
+            with tar_file.extractfile(part_member) as f:
+                f.seek(skipped_bytes)
+                uploaded_bytes += self._upload_stream(
+                    f, part_member.size - skipped_bytes, target_uri,
+                    uploaded_bytes, total_bytes_to_upload, chunk_size,
+                    callback, upload_workers)
         return uploaded_bytes
 
     def _upload_part_file(self,
@@ -768,7 +1036,9 @@ class Org(object):
                           offset=0,
                           total_file_size=None,
                           chunk_size=DEFAULT_CHUNK_SIZE,
-                          callback=None):
+                          callback=None,
+                          upload_workers=1,
+                          confirmed_bytes=0):
         """Helper function to upload contents of a single part file.
 
         :param list(str) part_file_path: path (with name) of the part-file on
@@ -784,6 +1054,9 @@ class Org(object):
         :param function callback: a function with signature
             function(bytes_written, total_size) to let the caller monitor
             progress of the upload operation.
+        :param int upload_workers: number of chunks uploaded concurrently.
+        :param int confirmed_bytes: number of bytes at the start of the
+            target file that were uploaded earlier, and are skipped.
 
         :return: number of bytes uploaded to the uri.
 
@@ -793,42 +1066,170 @@ class Org(object):
         part_file_size = stat_info.st_size
         if total_file_size is None:
             total_file_size = part_file_size
+        skipped_bytes = min(part_file_size, max(0, confirmed_bytes - offset))
+
+        with open(part_file_path, 'rb', buffering=0) as f:
+            f.seek(skipped_bytes)
+            return skipped_bytes + self._upload_stream(
+                f, part_file_size - skipped_bytes, target_uri,
+                offset + skipped_bytes, total_file_size, chunk_size, callback,
+                upload_workers)
+
+    def _upload_stream(self, f, part_file_size, target_uri, offset,
+                       total_file_size, chunk_size, callback, upload_workers):
+        """Upload the contents of a readable file object in chunks.
+
+        Chunks are read into buffers that are reused for the whole upload,
+        rather than allocated for each chunk.
+
+        :param file f: file to upload, opened for binary reading. It may be
+            a member of an archive.
+        :param int part_file_size: number of bytes to upload from f, starting
+            at its current position.
+        :param str target_uri: uri where the contents of the file will be
+            uploaded to.
+        :param int offset: number of bytes to skip on the target uri.
+        :param int total_file_size: size of the entire target file.
+        :param int chunk_size: size of each uploaded chunk.
+        :param function callback: a function with signature
+            function(bytes_written, total_size), or None.
+        :param int upload_workers: number of chunks uploaded concurrently.
+
+        :return: number of bytes uploaded to the uri.
+
+        :rtype: int
+        """
+        if upload_workers > 1:
+            return self._upload_chunks_concurrently(
+                f, part_file_size, target_uri, offset, total_file_size,
+                chunk_size, callback, upload_workers)
+        buffer = bytearray(min(chunk_size, part_file_size))
         uploaded_bytes = 0
+        while uploaded_bytes < part_file_size:
+            data_size = min(chunk_size, part_file_size - uploaded_bytes)
+            data = self._read_chunk(f, buffer, data_size)
+            self._upload_chunk(target_uri, data, offset + uploaded_bytes,
+                               total_file_size)
+            uploaded_bytes += data_size
+            if callback is not None:
+                callback(offset + uploaded_bytes, total_file_size)
+        return uploaded_bytes
 
-        with open(part_file_path, 'rb') as f:
-            while uploaded_bytes < part_file_size:
-                data = f.read(chunk_size)
-                data_size = len(data)
-                if data_size <= chunk_size:
-                    range_str = 'bytes %s-%s/%s' % \
-                                (offset + uploaded_bytes,
-                                 offset + uploaded_bytes + data_size - 1,
-                                 total_file_size)
-                    response = self.client.upload_fragment(
-                        target_uri, data, range_str)
-                    uploaded_bytes += data_size
-                    if callback is not None:
-                        callback(offset + uploaded_bytes, total_file_size)
-
-                    # We can hit an issue similar to the following issue
-                    # https://github.com/requests/requests/issues/4664
-                    #
-                    # Our uploads would fail with the error message,
-                    #
-                    # urllib3.exceptions.ProtocolError: ('Connection aborted.',
-                    # ConnectionResetError(10054, 'An existing connection was
-                    # forcibly closed by the remote host', None, 10054, None))
-                    #
-                    # This error is probably caused by request lib reusing
-                    # keep-alive connections that were marked as closed by the
-                    # server. As a workaround for this, we will wait 1 second
-                    # after issuing the PUT call if the connection is closed by
-                    # the server. Spacing out the requests seems to help
-                    # requests lib with pruning dead keep-alive connections.
-                    if self.client.is_connection_closed(response):
-                        time.sleep(1)
+    def _read_chunk(self, f, buffer, size):
+        """Read the next chunk of a file into a reusable buffer.
+
+        :param file f: file opened for binary reading.
+        :param bytearray buffer: buffer of at least size bytes.
+        :param int size: number of bytes to read.
+
+        :return: a view of the first size bytes of the buffer, which hold
+            the chunk.
+
+        :rtype: memoryview
+
+        :raises: UploadException: if the file ends before size bytes are
+            read.
+        """
+        view = memoryview(buffer)[:size]
+        read_bytes = 0
+        while read_bytes < size:
+            n = f.readinto(view[read_bytes:])
+            if not n:
+                raise UploadException(
+                    'File %s is shorter than expected.' % f.name)
+            read_bytes += n
+        return view
+
+    def _upload_chunks_concurrently(self, f, part_file_size, target_uri,
+                                    offset, total_file_size, chunk_size,
+                                    callback, upload_workers):
+        """Upload the chunks of a file with a pool of worker threads.
+
+        Chunks are read in order and at most two per worker are held in
+        memory at any time, in buffers recycled once their chunk is
+        uploaded. Chunks are confirmed in order too, so callback
+        is called with increasing byte counts from the calling thread.
+
+        :param file f: file to upload, opened for binary reading.
+        :param int part_file_size: number of bytes to upload from f.
+        :param str target_uri: uri where the contents of the file will be
+            uploaded to.
+        :param int offset: number of bytes to skip on the target uri.
+        :param int total_file_size: size of the entire target file.
+        :param int chunk_size: size of each uploaded chunk.
+        :param function callback: a function with signature
+            function(bytes_written, total_size), or None.
+        :param int upload_workers: number of concurrent uploads.
+
+        :return: number of bytes uploaded to the uri.
+
+        :rtype: int
+        """
+        window = 2 * upload_workers
+        in_flight = collections.deque()
+        free_buffers = []
+        read_bytes = 0
+        uploaded_bytes = 0
+        executor = ThreadPoolExecutor(max_workers=upload_workers)
+        try:
+            while read_bytes < part_file_size or len(in_flight) > 0:
+                while read_bytes < part_file_size and len(in_flight) < window:
+                    if len(free_buffers) > 0:
+                        buffer = free_buffers.pop()
+                    else:
+                        buffer = bytearray(min(chunk_size, part_file_size))
+                    data_size = min(chunk_size, part_file_size - read_bytes)
+                    data = self._read_chunk(f, buffer, data_size)
+                    in_flight.append((buffer, data_size,
+                                      executor.submit(
+                                          self.client._call_on_thread_session,
+                                          self._upload_chunk, target_uri,
+                                          data, offset + read_bytes,
+                                          total_file_size)))
+                    read_bytes += data_size
+                (buffer, data_size, future) = in_flight.popleft()
+                future.result()
+                free_buffers.append(buffer)
+                uploaded_bytes += data_size
+                if callback is not None:
+                    callback(offset + uploaded_bytes, total_file_size)
+        finally:
+            for (_, _, future) in in_flight:
+                future.cancel()
+            executor.shutdown(wait=True)
         return uploaded_bytes
 
+    def _upload_chunk(self, target_uri, data, start, total_file_size):
+        """Upload one chunk of a file.
+
+        :param str target_uri: uri where the file is uploaded to.
+        :param bytes data: contents of the chunk, any bytes-like object.
+        :param int start: offset of the chunk in the target file.
+        :param int total_file_size: size of the entire target file.
+        """
+        range_str = 'bytes %s-%s/%s' % \
+                    (start, start + len(data) - 1, total_file_size)
+        response = self.client.upload_fragment(target_uri, data, range_str)
+
+        # We can hit an issue similar to the following issue
+        # https://github.com/requests/requests/issues/4664
+        #
+        # Our uploads would fail with the error message,
+        #
+        # urllib3.exceptions.ProtocolError: ('Connection aborted.',
+        # ConnectionResetError(10054, 'An existing connection was
+        # forcibly closed by the remote host', None, 10054, None))
+        #
+        # This error is probably caused by request lib reusing
+        # keep-alive connections that were marked as closed by the
+        # server. As a workaround for this, we will wait 1 second
+        # after issuing the PUT call if the connection is closed by
+        # the server. Spacing out the requests seems to help
+        # requests lib with pruning dead keep-alive connections.
+        # Concurrent uploads only hold up the worker that sent the chunk.
+        if self.client.is_connection_closed(response):
+            time.sleep(1)
+
     def capture_vapp(self,
                      catalog_resource,
                      vapp_href,
@@ -1571,7 +1972,8 @@ class Org(object):
         links = get_links(
             self.resource,
             rel=RelationType.DOWN,
-            media_type=EntityType.VDC.value)
+            media_type=EntityType.VDC.value,
+            link_index=self._get_link_index(self.resource))
         for link in links:
             if name == link.name:
                 if is_admin_operation:
@@ -1602,7 +2004,8 @@ class Org(object):
         links = get_links(
             self.resource,
             rel=RelationType.DOWN,
-            media_type=EntityType.VDC.value)
+            media_type=EntityType.VDC.value,
+            link_index=self._get_link_index(self.resource))
         for link in links:
             if link.href.endswith(f'/api/vdc/{id}'):
                 return self.client.get_resource(link.href)
@@ -1619,6 +2022,9 @@ class Org(object):
         if self.resource is None:
             self.reload()
         result = []
-        for v in get_links(self.resource, media_type=EntityType.VDC.value):
+        for v in get_links(
+                self.resource,
+                media_type=EntityType.VDC.value,
+                link_index=self._get_link_index(self.resource)):
             result.append({'name': v.name, 'href': v.href})
         return result
@@ -0,0 +1,169 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+import threading
+import time
+import urllib.parse
+
+
+class _CacheEntry(object):
+    __slots__ = ('path', 'content', 'content_type', 'etag', 'expires')
+
+    def __init__(self, path, content, content_type, etag, expires):
+        self.path = path
+        self.content = content
+        self.content_type = content_type
+        self.etag = etag
+        self.expires = expires
+
+
+class ResponseCache(object):
+    """LRU cache of GET response bodies for Clients.
+
+    Pass an instance to Client(response_cache=...) to enable caching.
+    Entries are keyed by the user of the client's session, URI, query
+    parameters, Accept header and API version, and hold the raw response
+    body. Clients may share a cache: a client is only served the responses
+    fetched by sessions of its own user. Every hit is parsed again, so
+    callers never share (and cannot corrupt) cached lxml objects.
+
+    An entry is served without contacting vCD until its TTL expires. After
+    that, if vCD sent an ETag, the client revalidates the entry with a
+    conditional GET, and a 304 Not Modified response refreshes it.
+    Entries are invalidated when the client issues a PUT, POST or DELETE
+    to their href, to one of its ancestors or to one of its descendants,
+    e.g. a POST to <vapp>/power/action/powerOn evicts <vapp>, whichever
+    user fetched it. Changes made by clients that do not share the cache,
+    or reflected in unrelated hrefs, are only seen once the TTL expires, so
+    keep it short.
+
+    :param int max_entries: maximum number of cached responses.
+    :param float ttl: seconds a response is served without revalidation.
+    """
+
+    def __init__(self, max_entries=1024, ttl=30):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+
+    @staticmethod
+    def _get_path(uri):
+        return urllib.parse.urlsplit(uri).path.rstrip('/')
+
+    def lookup(self, key):
+        """Return the cached entry for a key.
+
+        :param tuple key: cache key.
+
+        :return: a tuple (content, content_type, etag, fresh) where fresh is
+            False if the entry must be revalidated before use, or None on a
+            miss.
+
+        :rtype: tuple
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            fresh = time.monotonic() < entry.expires
+            if not fresh and entry.etag is None:
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if fresh:
+                self._hits += 1
+            else:
+                self._revalidations += 1
+            return (entry.content, entry.content_type, entry.etag, fresh)
+
+    def store(self, key, uri, content, etag=None, content_type=None):
+        """Cache a response body.
+
+        :param tuple key: cache key.
+        :param str uri: uri of the resource, used for invalidation.
+        :param bytes content: response body.
+        :param str etag: ETag header of the response, if any.
+        :param str content_type: Content-Type header of the response, if
+            any.
+        """
+        with self._lock:
+            self._entries[key] = _CacheEntry(self._get_path(uri), content,
+                                             content_type, etag,
+                                             time.monotonic() + self._ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def refresh(self, key):
+        """Extend the lifetime of an entry after a 304 Not Modified.
+
+        :param tuple key: cache key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires = time.monotonic() + self._ttl
+
+    def invalidate(self, uri):
+        """Drop entries of a resource, its ancestors and its descendants.
+
+        :param str uri: uri of the modified resource.
+        """
+        path = self._get_path(uri)
+        with self._lock:
+            for key in list(self._entries.keys()):
+                cached_path = self._entries[key].path
+                if cached_path == path or \
+                   path.startswith(cached_path + '/') or \
+                   cached_path.startswith(path + '/'):
+                    del self._entries[key]
+
+    def clear(self, prefix=None):
+        """Drop entries.
+
+        :param tuple prefix: if not None, only drop the entries whose key
+            starts with the items of prefix, e.g. (identity, ) for the
+            entries of a user.
+        """
+        with self._lock:
+            if prefix is None:
+                self._entries.clear()
+                return
+            for key in list(self._entries.keys()):
+                if key[:len(prefix)] == prefix:
+                    del self._entries[key]
+
+    def get_stats(self):
+        """Return cache statistics.
+
+        :return: number of entries, hits, misses and conditional
+            revalidations.
+
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self._hits,
+                'misses': self._misses,
+                'revalidations': self._revalidations
+            }
@@ -0,0 +1,339 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+def _purge_expired(data):
+    now = time.time()
+    return {
+        key: entry
+        for key, entry in data.items()
+        if isinstance(entry, dict) and entry.get('expires', 0) >= now
+    }
+
+
+def _remove_prefixed(data, prefix):
+    return {
+        key: entry
+        for key, entry in data.items() if not key.startswith(prefix)
+    }
+
+
+class _LockedJsonFile(object):
+    """A JSON document on disk shared by processes through a file lock.
+
+    The document is only read or replaced while holding an exclusive lock
+    on a companion '.lock' file. Replacement is atomic and the file is only
+    readable by its owner, as it may contain session tokens.
+
+    :param str path: path of the JSON file.
+    """
+
+    def __init__(self, path):
+        self._path = Path(path)
+        self._lock_path = Path(str(path) + '.lock')
+
+    @contextlib.contextmanager
+    def locked(self):
+        """Hold the file lock for the duration of a with block."""
+        self._path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(str(self._lock_path), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    def read(self):
+        """Return the document, or an empty one if missing or unreadable.
+
+        :rtype: dict
+        """
+        try:
+            with self._path.open('r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def write(self, data):
+        """Atomically replace the document.
+
+        :param dict data: the new document.
+        """
+        fd, tmp_path = tempfile.mkstemp(
+            dir=str(self._path.parent), prefix=self._path.name)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, str(self._path))
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+
+class SessionCache(object):
+    """On-disk cache of vCD login sessions shared by processes.
+
+    Pass an instance to Client(session_cache=...). Client.set_credentials()
+    then reuses a cached session for the same server and credentials
+    instead of negotiating the API version and logging in, and caches the
+    sessions it creates. A session is stored with its token, API version,
+    well-known endpoints and query list, in the format accepted by
+    Client.rehydrate(). Entries are keyed by a salted hash of the server URI
+    and credentials, passwords are never stored.
+
+    Cached sessions are not validated when reused. If vCD rejects a cached
+    token, the client logs in again with the original credentials and
+    retries the request once, unless its body was a consumed stream. Set
+    ttl below the session timeout of vCD so
+    this is rare.
+
+    The file may be shared with a ServerInfoCache, each cache only clears
+    its own entries.
+
+    :param str path: cache file, ~/.pyvcloud/session_cache.json by default.
+        The file is created with owner-only permissions.
+    :param float ttl: seconds a session is reused after login.
+    """
+
+    _DEFAULT_PATH = Path.home() / '.pyvcloud' / 'session_cache.json'
+    _KEY_ITERATIONS = 10000
+    # Prefix of the keys of this cache in the file.
+    _PREFIX = 'session|'
+
+    def __init__(self, path=None, ttl=1800):
+        self._file = _LockedJsonFile(
+            self._DEFAULT_PATH if path is None else path)
+        self._ttl = ttl
+
+    @classmethod
+    def get_key(cls, uri, creds):
+        """Return the cache key of a login.
+
+        :param str uri: API URI of the vCD server.
+        :param pyvcloud.vcd.client.BasicLoginCredentials creds: credentials.
+
+        :return: the key.
+
+        :rtype: str
+        """
+        salt = '%s|%s@%s' % (uri, creds.user, creds.org)
+        return hashlib.pbkdf2_hmac('sha256', creds.password.encode('utf-8'),
+                                   salt.encode('utf-8'),
+                                   cls._KEY_ITERATIONS).hex()
+
+    def load(self, key):
+        """Return a cached session.
+
+        :param str key: cache key.
+
+        :return: the session state, or None if missing or expired.
+
+        :rtype: dict
+        """
+        with self._file.locked():
+            state = self._file.read().get(self._PREFIX + key)
+        if state is None or state.get('expires', 0) < time.time():
+            return None
+        return state
+
+    def store(self, key, state):
+        """Cache a new session, replacing any session cached for the key.
+
+        :param str key: cache key.
+        :param dict state: session state, see Client.rehydrate().
+        """
+        state = dict(state)
+        state['expires'] = time.time() + self._ttl
+        with self._file.locked():
+            data = _purge_expired(self._file.read())
+            data[self._PREFIX + key] = state
+            self._file.write(data)
+
+    def update(self, key, token, **fields):
+        """Add fields to a cached session.
+
+        :param str key: cache key.
+        :param str token: token of the session to update. Nothing is
+            updated if the key was cached again for another session.
+        :param fields: fields to set.
+        """
+        with self._file.locked():
+            data = self._file.read()
+            state = data.get(self._PREFIX + key)
+            if state is not None and state.get('token') == token:
+                state.update(fields)
+                self._file.write(data)
+
+    def remove(self, key, token=None):
+        """Remove a cached session.
+
+        :param str key: cache key.
+        :param str token: if set, only remove the entry if it is still the
+            session with this token.
+        """
+        with self._file.locked():
+            data = self._file.read()
+            state = data.get(self._PREFIX + key)
+            if state is not None and \
+               (token is None or state.get('token') == token):
+                del data[self._PREFIX + key]
+                self._file.write(data)
+
+    def clear(self):
+        """Remove all cached sessions."""
+        with self._file.locked():
+            self._file.write(
+                _remove_prefixed(self._file.read(), self._PREFIX))
+
+
+class ServerInfoCache(object):
+    """Cache of API versions and query lists of vCD servers.
+
+    Pass one instance to every Client(server_info_cache=...) of a process
+    to let short-lived clients skip the /versions request when negotiating
+    the API version, and the query list request before their first typed
+    query. Versions are cached per server URI, query lists per server URI,
+    API version and user, since they depend on the user's rights. With a
+    path, entries are also shared with other processes through a file.
+
+    Entries expire after ttl seconds, so clients notice server upgrades
+    within that time. The file may be shared with a SessionCache, each
+    cache only clears its own entries.
+
+    :param str path: cache file, or None to only cache in this process.
+    :param float ttl: seconds an entry is used.
+    """
+
+    # Prefix of the keys of this cache in the file.
+    _PREFIX = 'server_info|'
+
+    def __init__(self, path=None, ttl=3600):
+        self._file = None if path is None else _LockedJsonFile(path)
+        self._ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry['expires'] < now:
+                # Another process may have refreshed the file entry.
+                del self._entries[key]
+                entry = None
+        if entry is None and self._file is not None:
+            with self._file.locked():
+                entry = self._file.read().get(self._PREFIX + key)
+            if entry is None or entry.get('expires', 0) < now:
+                return None
+            with self._lock:
+                self._entries[key] = entry
+        if entry is None:
+            return None
+        return entry['value']
+
+    def _set(self, key, value):
+        entry = {'value': value, 'expires': time.time() + self._ttl}
+        with self._lock:
+            self._entries[key] = entry
+        if self._file is not None:
+            with self._file.locked():
+                data = _purge_expired(self._file.read())
+                data[self._PREFIX + key] = entry
+                self._file.write(data)
+
+    def get_versions(self, uri):
+        """Return the cached active API versions of a server.
+
+        :param str uri: API URI of the server.
+
+        :return: versions sorted in numerical order, or None.
+
+        :rtype: list
+        """
+        return self._get('versions|%s' % uri)
+
+    def set_versions(self, uri, versions):
+        """Cache the active API versions of a server.
+
+        :param str uri: API URI of the server.
+        :param list versions: versions sorted in numerical order.
+        """
+        self._set('versions|%s' % uri, list(versions))
+
+    def get_query_list_map(self, uri, api_version, user):
+        """Return a cached query list map.
+
+        :param str uri: API URI of the server.
+        :param str api_version: API version of the session.
+        :param str user: user name qualified by org, i.e. user@org.
+
+        :return: query hrefs keyed by (media type, query name), or None.
+
+        :rtype: dict
+        """
+        value = self._get('queries|%s|%s|%s' % (uri, api_version, user))
+        if value is None:
+            return None
+        return {(media_type, name): href for media_type, name, href in value}
+
+    def set_query_list_map(self, uri, api_version, user, query_list_map):
+        """Cache a query list map.
+
+        :param str uri: API URI of the server.
+        :param str api_version: API version of the session.
+        :param str user: user name qualified by org, i.e. user@org.
+        :param dict query_list_map: query hrefs keyed by (media type, query
+            name).
+        """
+        self._set('queries|%s|%s|%s' % (uri, api_version, user),
+                  [[media_type, name, href]
+                   for (media_type, name), href in query_list_map.items()])
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+        if self._file is not None:
+            with self._file.locked():
+                self._file.write(
+                    _remove_prefixed(self._file.read(), self._PREFIX))
@@ -0,0 +1,190 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+from pathlib import Path
+import threading
+import time
+
+from pyvcloud.vcd.session_cache import _LockedJsonFile
+from pyvcloud.vcd.session_cache import _purge_expired
+
+
+class UploadJournal(object):
+    """On-disk journal of catalog uploads, used to resume them.
+
+    Pass an instance to Org.upload_ovf(journal=...) or
+    Org.upload_media(journal=...). The journal records the catalog item
+    created for each upload and, for each file sent to its transfer uri,
+    the number of bytes vCD confirmed so far. If the upload fails, or the
+    process dies, calling the same method again with the same catalog,
+    item name and unchanged local file reuses the catalog item and resumes
+    every file from its last confirmed byte, as long as vCD still holds
+    that many bytes of it. A completed upload is removed from the journal.
+
+    vCD discards the transferred bytes of an item after a period without
+    uploads, so entries expire after ttl seconds without progress.
+
+    Confirmed bytes are written to the journal file at most once every
+    flush_interval seconds, and when an upload fails. If the process dies,
+    the upload resumes from the bytes written last.
+
+    :param str path: journal file, ~/.pyvcloud/upload_journal.json by
+        default.
+    :param float ttl: seconds an upload can be resumed after its last
+        progress.
+    :param float flush_interval: minimum seconds between two writes of
+        confirmed bytes to the journal file.
+    """
+
+    _DEFAULT_PATH = Path.home() / '.pyvcloud' / 'upload_journal.json'
+
+    def __init__(self, path=None, ttl=3600, flush_interval=5):
+        self._file = _LockedJsonFile(
+            self._DEFAULT_PATH if path is None else path)
+        self._ttl = ttl
+        self._flush_interval = flush_interval
+        # Confirmed bytes not written yet, keyed by (key, target uri).
+        self._pending = {}
+        self._flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    @staticmethod
+    def get_key(catalog_href, item_name, file_name):
+        """Return the journal key of an upload.
+
+        The key changes when the local file is modified, so a changed file
+        is never resumed.
+
+        :param str catalog_href: href of the target catalog.
+        :param str item_name: name of the catalog item.
+        :param str file_name: path of the uploaded local file.
+
+        :return: the key.
+
+        :rtype: str
+        """
+        stat_info = os.stat(file_name)
+        key = '%s|%s|%s|%s|%s' % (catalog_href, item_name,
+                                  os.path.abspath(file_name),
+                                  stat_info.st_size, stat_info.st_mtime_ns)
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def load(self, key):
+        """Return a journaled upload.
+
+        :param str key: journal key.
+
+        :return: the upload, a dict holding the href of the catalog item's
+            entity as 'entity_href' and the confirmed bytes of each transfer
+            uri as 'files', or None if missing or expired.
+
+        :rtype: dict
+        """
+        with self._file.locked():
+            entry = self._file.read().get(key)
+        if entry is None or entry.get('expires', 0) < time.time():
+            return None
+        return entry
+
+    def start(self, key, entity_href):
+        """Record a new upload, replacing any upload journaled for the key.
+
+        :param str key: journal key.
+        :param str entity_href: href of the entity of the new catalog item.
+        """
+        self._discard_pending(key)
+        with self._file.locked():
+            data = _purge_expired(self._file.read())
+            data[key] = {
+                'entity_href': entity_href,
+                'files': {},
+                'expires': time.time() + self._ttl
+            }
+            self._file.write(data)
+
+    def get_confirmed_bytes(self, key, target_uri):
+        """Return the number of bytes of a file confirmed by vCD.
+
+        :param str key: journal key.
+        :param str target_uri: transfer uri of the file.
+
+        :return: length of the uploaded prefix of the file.
+
+        :rtype: int
+        """
+        entry = self.load(key)
+        if entry is None:
+            return 0
+        with self._lock:
+            confirmed_bytes = self._pending.get((key, target_uri))
+        if confirmed_bytes is not None:
+            return confirmed_bytes
+        return entry['files'].get(target_uri, 0)
+
+    def confirm(self, key, target_uri, confirmed_bytes):
+        """Record that vCD confirmed the first bytes of a file.
+
+        The journal file is only written if flush_interval seconds passed
+        since it was last written, see flush().
+
+        :param str key: journal key.
+        :param str target_uri: transfer uri of the file.
+        :param int confirmed_bytes: length of the uploaded prefix of the
+            file.
+        """
+        with self._lock:
+            self._pending[(key, target_uri)] = confirmed_bytes
+            if time.monotonic() - self._flushed_at < self._flush_interval:
+                return
+        self.flush()
+
+    def flush(self):
+        """Write the confirmed bytes recorded since the last write."""
+        with self._flush_lock:
+            with self._lock:
+                pending = self._pending
+                self._pending = {}
+                self._flushed_at = time.monotonic()
+            if len(pending) == 0:
+                return
+            with self._file.locked():
+                data = self._file.read()
+                for (key, target_uri), confirmed_bytes in pending.items():
+                    entry = data.get(key)
+                    if entry is not None:
+                        entry['files'][target_uri] = confirmed_bytes
+                        entry['expires'] = time.time() + self._ttl
+                self._file.write(data)
+
+    def remove(self, key):
+        """Remove an upload from the journal.
+
+        :param str key: journal key.
+        """
+        self._discard_pending(key)
+        with self._file.locked():
+            data = self._file.read()
+            if key in data:
+                del data[key]
+                self._file.write(data)
+
+    def _discard_pending(self, key):
+        with self._lock:
+            for pending_key in list(self._pending):
+                if pending_key[0] == key:
+                    del self._pending[pending_key]
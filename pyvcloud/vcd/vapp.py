@@ -19,6 +19,7 @@ from lxml import etree
 from lxml import objectify
 
 from pyvcloud.vcd.acl import Acl
+from pyvcloud.vcd.client import _LinkIndexMixin
 from pyvcloud.vcd.client import E
 from pyvcloud.vcd.client import E_OVF
 from pyvcloud.vcd.client import EntityType
@@ -44,7 +45,7 @@ DEFAULT_CHUNK_SIZE = 10 * 1024 * 1024
 LOGGER = get_logger()
 
 
-class VApp(object):
+class VApp(_LinkIndexMixin):
     def __init__(self, client, name=None, href=None, resource=None):
         """Constructor for VApp objects.
 
@@ -153,7 +154,8 @@ class VApp(object):
         """
         self.get_resource()
         return self.client.get_linked_resource(
-            self.resource, RelationType.DOWN, EntityType.METADATA.value)
+            self.resource, RelationType.DOWN, EntityType.METADATA.value,
+            link_index=self._get_link_index(self.resource))
 
     def set_metadata(self,
                      domain,
@@ -391,8 +393,9 @@ class VApp(object):
         """
         vapp_resource = self.get_resource()
         try:
-            return self.client.post_linked_resource(vapp_resource, rel,
-                                                    media_type, contents)
+            return self.client.post_linked_resource(
+                vapp_resource, rel, media_type, contents,
+                link_index=self._get_link_index(vapp_resource))
         except OperationNotSupportedException:
             power_state = self.get_power_state(vapp_resource)
             raise OperationNotSupportedException(
@@ -687,7 +690,9 @@ class VApp(object):
 
         :rtype: lxml.objectify.ObjectifiedElement
         """
-        acl = Acl(self.client, self.get_resource())
+        resource = self.get_resource()
+        acl = Acl(self.client, resource,
+                  link_index=self._get_link_index(resource))
         return acl.get_access_settings()
 
     def add_access_settings(self, access_settings_list=None):
@@ -707,7 +712,9 @@ class VApp(object):
 
         :rtype: lxml.objectify.ObjectifiedElement
         """
-        acl = Acl(self.client, self.get_resource())
+        resource = self.get_resource()
+        acl = Acl(self.client, resource,
+                  link_index=self._get_link_index(resource))
         return acl.add_access_settings(access_settings_list)
 
     def remove_access_settings(self,
@@ -729,7 +736,9 @@ class VApp(object):
 
         :rtype: lxml.objectify.ObjectifiedElement`
         """
-        acl = Acl(self.client, self.get_resource())
+        resource = self.get_resource()
+        acl = Acl(self.client, resource,
+                  link_index=self._get_link_index(resource))
         return acl.remove_access_settings(access_settings_list, remove_all)
 
     def share_with_org_members(self, everyone_access_level='ReadOnly'):
@@ -744,7 +753,9 @@ class VApp(object):
 
         :rtype: lxml.objectify.ObjectifiedElement
         """
-        acl = Acl(self.client, self.get_resource())
+        resource = self.get_resource()
+        acl = Acl(self.client, resource,
+                  link_index=self._get_link_index(resource))
         return acl.share_with_org_members(everyone_access_level)
 
     def unshare_from_org_members(self):
@@ -755,7 +766,9 @@ class VApp(object):
 
         :rtype: lxml.objectify.ObjectifiedElement
         """
-        acl = Acl(self.client, self.get_resource())
+        resource = self.get_resource()
+        acl = Acl(self.client, resource,
+                  link_index=self._get_link_index(resource))
         return acl.unshare_from_org_members()
 
     def get_all_networks(self):
@@ -922,7 +935,8 @@ class VApp(object):
             params.append(E.AllEULAsAccepted(all_eulas_accepted))
         return self.client.post_linked_resource(
             self.resource, RelationType.RECOMPOSE,
-            EntityType.RECOMPOSE_VAPP_PARAMS.value, params)
+            EntityType.RECOMPOSE_VAPP_PARAMS.value, params,
+            link_index=self._get_link_index(self.resource))
 
     def delete_vms(self, names):
         """Recompose the vApp and delete vms.
@@ -940,7 +954,8 @@ class VApp(object):
             params.append(E.DeleteItem(href=vm.get('href')))
         return self.client.post_linked_resource(
             self.resource, RelationType.RECOMPOSE,
-            EntityType.RECOMPOSE_VAPP_PARAMS.value, params)
+            EntityType.RECOMPOSE_VAPP_PARAMS.value, params,
+            link_index=self._get_link_index(self.resource))
 
     def connect_org_vdc_network(self,
                                 orgvdc_network_name,
@@ -971,8 +986,11 @@ class VApp(object):
         """
         vdc = VDC(
             self.client,
-            href=find_link(self.resource, RelationType.UP,
-                           EntityType.VDC.value).href)
+            href=find_link(
+                self.resource,
+                RelationType.UP,
+                EntityType.VDC.value,
+                link_index=self._get_link_index(self.resource)).href)
         orgvdc_network_href = vdc.get_orgvdc_network_admin_href_by_name(
             orgvdc_network_name)
 
@@ -1339,7 +1357,8 @@ class VApp(object):
             self.resource,
             rel=RelationType.DOWN,
             media_type=EntityType.vApp_Network.value,
-            name=network_name).href
+            name=network_name,
+            link_index=self._get_link_index(self.resource)).href
         vapp_network_resource = self.client.get_resource(
             vapp_network_resource_href)
         obj = self.client.get_linked_resource(
@@ -1379,7 +1398,8 @@ class VApp(object):
                     E.Description(description))
 
         return self.client.put_linked_resource(
-            self.resource, RelationType.EDIT, EntityType.VAPP.value, vapp)
+            self.resource, RelationType.EDIT, EntityType.VAPP.value, vapp,
+            link_index=self._get_link_index(self.resource))
 
     def suspend_vapp(self):
         """Suspend a vApp.
@@ -1391,7 +1411,8 @@ class VApp(object):
         """
         self.get_resource()
         return self.client.post_linked_resource(
-            self.resource, RelationType.POWER_SUSPEND, None, None)
+            self.resource, RelationType.POWER_SUSPEND, None, None,
+            link_index=self._get_link_index(self.resource))
 
     def discard_suspended_state_vapp(self):
         """Discard suspended state of the vApp.
@@ -1404,19 +1425,22 @@ class VApp(object):
         """
         self.get_resource()
         return self.client.post_linked_resource(
-            self.resource, RelationType.DISCARD_SUSPENDED_STATE, None, None)
+            self.resource, RelationType.DISCARD_SUSPENDED_STATE, None, None,
+            link_index=self._get_link_index(self.resource))
 
     def enter_maintenance_mode(self):
         """Enter maintenance mode a vApp."""
         self.get_resource()
         return self.client.post_linked_resource(
-            self.resource, RelationType.ENTER_MAINTENANCE_MODE, None, None)
+            self.resource, RelationType.ENTER_MAINTENANCE_MODE, None, None,
+            link_index=self._get_link_index(self.resource))
 
     def exit_maintenance_mode(self):
         """Exit maintenance mode a vApp."""
         self.get_resource()
         return self.client.post_linked_resource(
-            self.resource, RelationType.EXIT_MAINTENANCE_MODE, None, None)
+            self.resource, RelationType.EXIT_MAINTENANCE_MODE, None, None,
+            link_index=self._get_link_index(self.resource))
 
     def enable_download(self):
         """Helper method to enable an entity for download.
@@ -1426,7 +1450,8 @@ class VApp(object):
         """
         self.get_resource()
         task = self.client.post_linked_resource(
-            self.resource, RelationType.ENABLE, None, None)
+            self.resource, RelationType.ENABLE, None, None,
+            link_index=self._get_link_index(self.resource))
         self.client.get_task_monitor().wait_for_success(task, 60, 1)
 
     def download_ova(self, file_name, chunk_size=DEFAULT_CHUNK_SIZE):
@@ -1443,8 +1468,11 @@ class VApp(object):
         self.enable_download()
         self.resource = None
         self.get_resource()
-        ova_uri = find_link(self.resource, RelationType.DOWNLOAD_OVA_DEFAULT,
-                            EntityType.APPLICATION_BINARY.value).href
+        ova_uri = find_link(
+            self.resource,
+            RelationType.DOWNLOAD_OVA_DEFAULT,
+            EntityType.APPLICATION_BINARY.value,
+            link_index=self._get_link_index(self.resource)).href
         return self.client.download_from_uri(ova_uri, file_name, chunk_size)
 
     def upgrade_virtual_hardware(self):
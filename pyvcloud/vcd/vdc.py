@@ -15,6 +15,7 @@
 from lxml import etree
 
 from pyvcloud.vcd.acl import Acl
+from pyvcloud.vcd.client import _LinkIndexMixin
 from pyvcloud.vcd.client import E
 from pyvcloud.vcd.client import E_OVF
 from pyvcloud.vcd.client import EdgeGatewayType
@@ -41,7 +42,7 @@ from pyvcloud.vcd.utils import get_admin_href
 from pyvcloud.vcd.utils import netmask_to_cidr_prefix_len
 
 
-class VDC(object):
+class VDC(_LinkIndexMixin):
     def __init__(self, client, name=None, href=None, resource=None):
         """Constructor for VDC objects.
 
@@ -252,8 +253,11 @@ class VDC(object):
         self.get_resource()
 
         # Get hold of the template
-        org_href = find_link(self.resource, RelationType.UP,
-                             EntityType.ORG.value).href
+        org_href = find_link(
+            self.resource,
+            RelationType.UP,
+            EntityType.ORG.value,
+            link_index=self._get_link_index(self.resource)).href
         org = Org(self.client, href=org_href)
         catalog_item = org.get_catalog_item(catalog, template)
         template_resource = self.client.get_resource(
@@ -460,7 +464,8 @@ class VDC(object):
         return self.client.post_linked_resource(
             self.resource, RelationType.ADD,
             EntityType.INSTANTIATE_VAPP_TEMPLATE_PARAMS.value,
-            vapp_template_params)
+            vapp_template_params,
+            link_index=self._get_link_index(self.resource))
 
     def list_resources(self, entity_type=None):
         """Fetch information about all resources in the current org vdc.
@@ -497,9 +502,11 @@ class VDC(object):
         :rtype: list
         """
         self.get_resource()
-        links = self.client.get_linked_resource(self.resource,
-                                                RelationType.EDGE_GATEWAYS,
-                                                EntityType.RECORDS.value)
+        links = self.client.get_linked_resource(
+            self.resource,
+            RelationType.EDGE_GATEWAYS,
+            EntityType.RECORDS.value,
+            link_index=self._get_link_index(self.resource))
         edge_gateways = []
         if hasattr(links, 'EdgeGatewayRecord'):
             for e in links.EdgeGatewayRecord:
@@ -557,7 +564,8 @@ class VDC(object):
 
         return self.client.post_linked_resource(
             self.resource, RelationType.ADD,
-            EntityType.DISK_CREATE_PARMS.value, disk_params)
+            EntityType.DISK_CREATE_PARMS.value, disk_params,
+            link_index=self._get_link_index(self.resource))
 
     def update_disk(self,
                     name=None,
@@ -771,7 +779,8 @@ class VDC(object):
         """
         self.get_resource()
         return self.client.get_linked_resource(
-            self.resource, RelationType.DOWN, EntityType.METADATA.value)
+            self.resource, RelationType.DOWN, EntityType.METADATA.value,
+            link_index=self._get_link_index(self.resource))
 
     def get_metadata_value(self, key, domain=MetadataDomain.GENERAL):
         """Fetch a metadata value identified by the domain and key.
@@ -928,8 +937,11 @@ class VDC(object):
         """
         self.get_resource()
 
-        return self.client.delete_linked_resource(self.resource,
-                                                  RelationType.REMOVE, None)
+        return self.client.delete_linked_resource(
+            self.resource,
+            RelationType.REMOVE,
+            None,
+            link_index=self._get_link_index(self.resource))
 
     def get_access_settings(self):
         """Get the access settings of the vdc.
@@ -939,7 +951,9 @@ class VDC(object):
 
         :rtype: lxml.objectify.ObjectifiedElement
         """
-        acl = Acl(self.client, self.get_resource())
+        resource = self.get_resource()
+        acl = Acl(self.client, resource,
+                  link_index=self._get_link_index(resource))
         return acl.get_access_settings()
 
     def add_access_settings(self, access_settings_list=None):
@@ -959,7 +973,9 @@ class VDC(object):
 
         :rtype: lxml.objectify.ObjectifiedElement
         """
-        acl = Acl(self.client, self.get_resource())
+        resource = self.get_resource()
+        acl = Acl(self.client, resource,
+                  link_index=self._get_link_index(resource))
         return acl.add_access_settings(access_settings_list)
 
     def remove_access_settings(self,
@@ -981,7 +997,9 @@ class VDC(object):
 
         :rtype: lxml.objectify.ObjectifiedElement`
         """
-        acl = Acl(self.client, self.get_resource())
+        resource = self.get_resource()
+        acl = Acl(self.client, resource,
+                  link_index=self._get_link_index(resource))
         return acl.remove_access_settings(access_settings_list, remove_all)
 
     def share_with_org_members(self, everyone_access_level='ReadOnly'):
@@ -996,7 +1014,9 @@ class VDC(object):
 
         :rtype: lxml.objectify.ObjectifiedElement
         """
-        acl = Acl(self.client, self.get_resource())
+        resource = self.get_resource()
+        acl = Acl(self.client, resource,
+                  link_index=self._get_link_index(resource))
         return acl.share_with_org_members(everyone_access_level)
 
     def unshare_from_org_members(self):
@@ -1010,7 +1030,9 @@ class VDC(object):
 
         :rtype: lxml.objectify.ObjectifiedElement
         """
-        acl = Acl(self.client, self.get_resource())
+        resource = self.get_resource()
+        acl = Acl(self.client, resource,
+                  link_index=self._get_link_index(resource))
         return acl.unshare_from_org_members()
 
     def create_vapp(self,
@@ -1073,7 +1095,8 @@ class VDC(object):
 
         return self.client.post_linked_resource(
             self.resource, RelationType.ADD,
-            EntityType.COMPOSE_VAPP_PARAMS.value, params)
+            EntityType.COMPOSE_VAPP_PARAMS.value, params,
+            link_index=self._get_link_index(self.resource))
 
     def create_routed_vdc_network(self,
                                   network_name,
@@ -1175,7 +1198,8 @@ class VDC(object):
 
         return self.client.post_linked_resource(
             self.resource, RelationType.ADD, EntityType.ORG_VDC_NETWORK.value,
-            request_payload)
+            request_payload,
+            link_index=self._get_link_index(self.resource))
 
     def create_directly_connected_vdc_network(self,
                                               network_name,
@@ -1215,7 +1239,8 @@ class VDC(object):
 
         return self.client.post_linked_resource(
             self.resource, RelationType.ADD, EntityType.ORG_VDC_NETWORK.value,
-            request_payload)
+            request_payload,
+            link_index=self._get_link_index(self.resource))
 
     def create_isolated_vdc_network(self,
                                     network_name,
@@ -1308,7 +1333,8 @@ class VDC(object):
 
         return self.client.post_linked_resource(
             self.resource, RelationType.ADD, EntityType.ORG_VDC_NETWORK.value,
-            request_payload)
+            request_payload,
+            link_index=self._get_link_index(self.resource))
 
     def list_orgvdc_network_records(self):
         """Fetch all org vdc network's record in the current vdc.
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from pyvcloud.vcd.client import _LinkIndexMixin
 from pyvcloud.vcd.client import E
 from pyvcloud.vcd.client import EntityType
 from pyvcloud.vcd.client import IpAddressMode
@@ -29,7 +30,7 @@ from pyvcloud.vcd.exceptions import MultipleRecordsException
 from pyvcloud.vcd.exceptions import OperationNotSupportedException
 
 
-class VM(object):
+class VM(_LinkIndexMixin):
     """A helper class to work with Virtual Machines."""
 
     def __init__(self, client, href=None, resource=None):
@@ -255,8 +256,9 @@ class VM(object):
         """
         vm_resource = self.get_resource()
         try:
-            return self.client.post_linked_resource(vm_resource, rel,
-                                                    media_type, contents)
+            return self.client.post_linked_resource(
+                vm_resource, rel, media_type, contents,
+                link_index=self._get_link_index(vm_resource))
         except OperationNotSupportedException:
             power_state = self.get_power_state(vm_resource)
             raise OperationNotSupportedException(
@@ -380,7 +382,8 @@ class VM(object):
             snapshot_vm_params.set('name', str(name).lower())
         return self.client.post_linked_resource(
             self.resource, RelationType.SNAPSHOT_CREATE,
-            EntityType.SNAPSHOT_CREATE.value, snapshot_vm_params)
+            EntityType.SNAPSHOT_CREATE.value, snapshot_vm_params,
+            link_index=self._get_link_index(self.resource))
 
     def snapshot_revert_to_current(self):
         """Reverts a virtual machine to the current snapshot, if any.
@@ -392,7 +395,8 @@ class VM(object):
         """
         self.get_resource()
         return self.client.post_linked_resource(
-            self.resource, RelationType.SNAPSHOT_REVERT_TO_CURRENT, None, None)
+            self.resource, RelationType.SNAPSHOT_REVERT_TO_CURRENT, None, None,
+            link_index=self._get_link_index(self.resource))
 
     def snapshot_remove_all(self):
         """Removes all user created snapshots of a virtual machine.
@@ -404,7 +408,8 @@ class VM(object):
         """
         self.get_resource()
         return self.client.post_linked_resource(
-            self.resource, RelationType.SNAPSHOT_REMOVE_ALL, None, None)
+            self.resource, RelationType.SNAPSHOT_REMOVE_ALL, None, None,
+            link_index=self._get_link_index(self.resource))
 
     def add_nic(self, adapter_type, is_primary, is_connected, network_name,
                 ip_address_mode, ip_address):
@@ -551,7 +556,8 @@ class VM(object):
         """
         self.get_resource()
         return self.client.post_linked_resource(
-            self.resource, RelationType.DISCARD_SUSPENDED_STATE, None, None)
+            self.resource, RelationType.DISCARD_SUSPENDED_STATE, None, None,
+            link_index=self._get_link_index(self.resource))
 
     def install_vmware_tools(self):
         """Install vmware tools in the vm.
@@ -563,7 +569,8 @@ class VM(object):
         """
         self.get_resource()
         return self.client.post_linked_resource(
-            self.resource, RelationType.INSTALL_VMWARE_TOOLS, None, None)
+            self.resource, RelationType.INSTALL_VMWARE_TOOLS, None, None,
+            link_index=self._get_link_index(self.resource))
 
     def insert_cd_from_catalog(self, media_href):
         """Insert CD from catalog to the vm.
@@ -580,7 +587,8 @@ class VM(object):
             E.Media(href=media_href))
         return self.client.post_linked_resource(
             vm_resource, RelationType.INSERT_MEDIA,
-            EntityType.MEDIA_INSERT_OR_EJECT_PARAMS.value, media_insert_params)
+            EntityType.MEDIA_INSERT_OR_EJECT_PARAMS.value, media_insert_params,
+            link_index=self._get_link_index(vm_resource))
 
     def eject_cd(self, media_href):
         """Insert CD from catalog to the vm.
@@ -597,7 +605,8 @@ class VM(object):
             E.Media(href=media_href))
         return self.client.post_linked_resource(
             vm_resource, RelationType.EJECT_MEDIA,
-            EntityType.MEDIA_INSERT_OR_EJECT_PARAMS.value, media_eject_params)
+            EntityType.MEDIA_INSERT_OR_EJECT_PARAMS.value, media_eject_params,
+            link_index=self._get_link_index(vm_resource))
 
     def upgrade_virtual_hardware(self):
         """Upgrade virtual hardware of vm.
@@ -609,7 +618,8 @@ class VM(object):
         """
         self.get_resource()
         return self.client.post_linked_resource(
-            self.resource, RelationType.UPGRADE, None, None)
+            self.resource, RelationType.UPGRADE, None, None,
+            link_index=self._get_link_index(self.resource))
 
     def consolidate(self):
         """Consolidate VM.
@@ -621,7 +631,8 @@ class VM(object):
         """
         self.get_resource()
         return self.client.post_linked_resource(
-            self.resource, RelationType.CONSOLIDATE, None, None)
+            self.resource, RelationType.CONSOLIDATE, None, None,
+            link_index=self._get_link_index(self.resource))
 
     def copy_to(self, source_vapp_name, target_vapp_name, target_vm_name):
         """Copy VM from one vApp to another.
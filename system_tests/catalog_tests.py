@@ -25,6 +25,7 @@ from pyvcloud.system_test_framework.environment import developerModeAware
 from pyvcloud.system_test_framework.environment import Environment
 
 from pyvcloud.vcd.exceptions import EntityNotFoundException
+from pyvcloud.vcd.upload_journal import UploadJournal
 
 
 class TestCatalog(BaseTestCase):
@@ -48,6 +49,8 @@ class TestCatalog(BaseTestCase):
     _test_template_with_chunk_size_name = 'template_with_custom_chunk_size'
     _test_template_with_chunk_size_file_name = \
         'template_with_custom_chunk_size.ova'
+    _test_template_parallel_name = 'test-template-parallel-upload'
+    _test_template_journaled_name = 'test-template-journaled-upload'
 
     def test_0000_setup(self):
         """Setup a catalog for the tests in this module.
@@ -74,7 +77,7 @@ class TestCatalog(BaseTestCase):
         self.assertIsNotNone(TestCatalog._test_catalog_href)
 
     def _template_upload_helper(self, org, catalog_name, template_name,
-                                template_file_name):
+                                template_file_name, upload_workers=1):
         """Helper method to upload a template to a catalog in vCD.
 
         This method creates the catalog item and uploads the template file
@@ -89,6 +92,7 @@ class TestCatalog(BaseTestCase):
             uploaded template
         :param str template_file_name: name of the local template file which
             will be uploaded.
+        :param int upload_workers: number of chunks uploaded concurrently.
 
         :raises: EntityNotFoundException: if the catalog is not found.
         :raises: InternalServerException: if template already exists in vCD.
@@ -99,7 +103,8 @@ class TestCatalog(BaseTestCase):
         bytes_uploaded = org.upload_ovf(
             catalog_name=catalog_name,
             file_name=template_file_name,
-            item_name=template_name)
+            item_name=template_name,
+            upload_workers=upload_workers)
         self.assertNotEqual(bytes_uploaded, -1)
 
     def _template_import_monitor(self, client, org, catalog_name,
@@ -170,6 +175,58 @@ class TestCatalog(BaseTestCase):
             catalog_name=TestCatalog._test_catalog_name,
             template_name=TestCatalog._test_template_with_chunk_size_name)
 
+    def test_0025_upload_template_in_parallel(self):
+        """Test the method org.upload_ovf() with several upload workers.
+
+        Upload an ova template to catalog, sending the chunks of its files
+        over 4 concurrent connections.
+
+        This test passes if the upload succeeds and no exceptions are raised.
+        """
+        org = Environment.get_test_org(TestCatalog._client)
+
+        self._template_upload_helper(
+            org=org,
+            catalog_name=TestCatalog._test_catalog_name,
+            template_name=TestCatalog._test_template_parallel_name,
+            template_file_name=TestCatalog._test_template_file_name,
+            upload_workers=4)
+        self._template_import_monitor(
+            client=TestCatalog._client,
+            org=org,
+            catalog_name=TestCatalog._test_catalog_name,
+            template_name=TestCatalog._test_template_parallel_name)
+
+    def test_0026_upload_template_with_journal(self):
+        """Test the method org.upload_ovf() with an upload journal.
+
+        Upload an ova template to catalog, recording the progress of the
+        upload in a journal.
+
+        This test passes if the upload succeeds and the completed upload is
+        removed from the journal.
+        """
+        org = Environment.get_test_org(TestCatalog._client)
+        with tempfile.TemporaryDirectory() as journal_dir:
+            journal = UploadJournal(
+                path=os.path.join(journal_dir, 'journal.json'))
+            bytes_uploaded = org.upload_ovf(
+                catalog_name=TestCatalog._test_catalog_name,
+                file_name=TestCatalog._test_template_file_name,
+                item_name=TestCatalog._test_template_journaled_name,
+                journal=journal)
+            self.assertNotEqual(bytes_uploaded, -1)
+            journal_key = journal.get_key(
+                TestCatalog._test_catalog_href,
+                TestCatalog._test_template_journaled_name,
+                TestCatalog._test_template_file_name)
+            self.assertIsNone(journal.load(journal_key))
+        self._template_import_monitor(
+            client=TestCatalog._client,
+            org=org,
+            catalog_name=TestCatalog._test_catalog_name,
+            template_name=TestCatalog._test_template_journaled_name)
+
     def test_0030_download(self):
         """Test the method org.download_catalog_item().
 
@@ -200,6 +257,37 @@ class TestCatalog(BaseTestCase):
                 os.chdir(cwd)
                 shutil.rmtree(tempdir)
 
+    def test_0035_download_in_parallel(self):
+        """Test the method org.download_catalog_item() with several workers.
+
+        Download the first template uploaded earlier, once sequentially and
+        once with 4 concurrent downloads.
+
+        This test passes if both downloads write the same number of bytes to
+        the disk without raising any exceptions.
+        """
+        org = Environment.get_test_org(TestCatalog._client)
+        tempdir = None
+        try:
+            cwd = os.getcwd()
+            tempdir = tempfile.mkdtemp(dir='.')
+            os.chdir(tempdir)
+            bytes_written = org.download_catalog_item(
+                catalog_name=TestCatalog._test_catalog_name,
+                item_name=TestCatalog._test_template_name,
+                file_name='sequential.ova')
+            bytes_written_in_parallel = org.download_catalog_item(
+                catalog_name=TestCatalog._test_catalog_name,
+                item_name=TestCatalog._test_template_name,
+                file_name='parallel.ova',
+                download_workers=4)
+            self.assertNotEqual(bytes_written, 0)
+            self.assertEqual(bytes_written, bytes_written_in_parallel)
+        finally:
+            if tempdir is not None:
+                os.chdir(cwd)
+                shutil.rmtree(tempdir)
+
     def test_0040_list_catalog(self):
         """Test the method org.list_catalog().
 
@@ -485,7 +573,9 @@ class TestCatalog(BaseTestCase):
             catalog_name = TestCatalog._test_catalog_name
             items_to_delete = [
                 TestCatalog._test_template_name,
-                TestCatalog._test_template_with_chunk_size_name
+                TestCatalog._test_template_with_chunk_size_name,
+                TestCatalog._test_template_parallel_name,
+                TestCatalog._test_template_journaled_name
             ]
 
             for item in items_to_delete:
@@ -13,13 +13,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import os
+import tempfile
 import unittest
 
 from pyvcloud.system_test_framework.base_test import BaseTestCase
 from pyvcloud.system_test_framework.environment import Environment
 
+from pyvcloud.vcd.async_client import AsyncClient
 import pyvcloud.vcd.client as client
 from pyvcloud.vcd.exceptions import VcdException
+from pyvcloud.vcd.response_cache import ResponseCache
+from pyvcloud.vcd.session_cache import ServerInfoCache
+from pyvcloud.vcd.session_cache import SessionCache
 
 
 class TestClient(BaseTestCase):
@@ -184,6 +192,185 @@ class TestClient(BaseTestCase):
         if unreachable_code:
             raise Exception("Login succeeded with bad host")
 
+    def test_0090_connection_pool_settings(self):
+        """Client applies pool settings and reports pool statistics."""
+        self._client = client.Client(
+            self._host,
+            verify_ssl_certs=False,
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=1,
+            keep_alive_timeout=30)
+        self.assertIsNone(self._client.get_connection_pool_stats())
+        creds = client.BasicLoginCredentials(self._user, self._org, self._pass)
+        self._client.set_credentials(creds)
+        self._client.get_org_list()
+
+        stats = self._client.get_connection_pool_stats()
+        self.assertEqual(stats['pool_connections'], 2)
+        self.assertEqual(stats['pool_maxsize'], 4)
+        self.assertGreater(stats['requests'], 0)
+        self.assertEqual(stats['in_flight'], 0)
+        self.assertEqual(len(stats['pools']), 1)
+
+    def test_0100_async_client(self):
+        """Async client issues concurrent requests with the client session."""
+        self._client = self._create_client_with_credentials(None)
+        org_href = self._client.get_org().get('href')
+
+        async def fetch():
+            async with AsyncClient(self._client) as async_client:
+                orgs = await asyncio.gather(
+                    *[async_client.get_resource(org_href) for _ in range(5)])
+                query = async_client.get_typed_query(
+                    client.ResourceType.ORGANIZATION.value,
+                    query_result_format=client.QueryResultFormat.RECORDS)
+                records = [record async for record in query.execute()]
+                return orgs, records
+
+        orgs, records = asyncio.get_event_loop().run_until_complete(fetch())
+        self.assertEqual(len(orgs), 5)
+        for org in orgs:
+            self.assertEqual(org.get('href'), org_href)
+        sync_records = list(
+            self._client.get_typed_query(
+                client.ResourceType.ORGANIZATION.value,
+                query_result_format=client.QueryResultFormat.RECORDS)
+            .execute())
+        self.assertEqual(len(records), len(sync_records))
+
+    def test_0110_response_cache(self):
+        """Cached GETs are served locally until the resource is modified."""
+        cache = ResponseCache(ttl=300)
+        self._client = client.Client(
+            self._host, verify_ssl_certs=False, response_cache=cache)
+        creds = client.BasicLoginCredentials(self._user, self._org, self._pass)
+        self._client.set_credentials(creds)
+        org_href = self._client.get_org().get('href')
+
+        org1 = self._client.get_resource(org_href)
+        org2 = self._client.get_resource(org_href)
+        self.assertIsNot(org1, org2)
+        self.assertEqual(org1.get('name'), org2.get('name'))
+        self.assertEqual(cache.get_stats()['hits'], 1)
+
+        self._client.get_resource(org_href, use_cache=False)
+        self.assertEqual(cache.get_stats()['hits'], 1)
+
+        self._client.logout()
+        self.assertEqual(cache.get_stats()['entries'], 0)
+        self._client = None
+
+    def test_0120_coalesce_requests(self):
+        """Concurrent identical GETs each get their own parsed result."""
+        self._client = client.Client(
+            self._host, verify_ssl_certs=False, coalesce_requests=True)
+        creds = client.BasicLoginCredentials(self._user, self._org, self._pass)
+        self._client.set_credentials(creds)
+        org_href = self._client.get_org().get('href')
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            orgs = list(
+                executor.map(lambda _: self._client.get_resource(org_href),
+                             range(8)))
+        self.assertEqual(len(set(id(org) for org in orgs)), 8)
+        for org in orgs:
+            self.assertEqual(org.get('href'), org_href)
+        self.assertEqual(len(self._client._in_flight_gets), 0)
+
+    def test_0130_thread_safe_client(self):
+        """A thread safe client can be shared by a pool of workers."""
+        self._client = client.Client(
+            self._host,
+            verify_ssl_certs=False,
+            pool_maxsize=8,
+            thread_safe=True)
+        creds = client.BasicLoginCredentials(self._user, self._org, self._pass)
+        self._client.set_credentials(creds)
+        org_href = self._client.get_org().get('href')
+
+        def fetch(_):
+            query = self._client.get_typed_query(
+                client.ResourceType.ORGANIZATION.value,
+                query_result_format=client.QueryResultFormat.RECORDS)
+            records = list(query.execute())
+            org = self._client.get_resource(org_href)
+            return id(self._client._get_session()), len(records), org
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(fetch, range(32)))
+        self.assertEqual(len(set(result[0] for result in results)), 8)
+        self.assertEqual(len(set(result[1] for result in results)), 1)
+        for result in results:
+            self.assertEqual(result[2].get('href'), org_href)
+        stats = self._client.get_connection_pool_stats()
+        self.assertLessEqual(stats['peak_in_flight'], 8)
+
+    def test_0140_session_cache(self):
+        """Clients with the same credentials reuse a cached session."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = SessionCache(os.path.join(cache_dir, 'sessions.json'))
+            creds = client.BasicLoginCredentials(self._user, self._org,
+                                                 self._pass)
+            first_client = client.Client(
+                self._host, verify_ssl_certs=False, session_cache=cache)
+            first_client.set_credentials(creds)
+            token = first_client._get_auth_token()
+            first_client.logout()
+
+            self._client = client.Client(
+                self._host, verify_ssl_certs=False, session_cache=cache)
+            self._client.set_credentials(creds)
+            self.assertEqual(self._client._get_auth_token(), token)
+            self.assertEqual(self._client.get_api_version(),
+                             first_client.get_api_version())
+            self.assertIsNotNone(self._client.get_org())
+
+            self._client.logout(keep_cached_session=False)
+            self._client = None
+            self.assertIsNone(
+                cache.load(cache.get_key(first_client.get_api_uri(), creds)))
+
+    def test_0150_server_info_cache(self):
+        """Clients sharing a server info cache negotiate the same version."""
+        cache = ServerInfoCache(ttl=60)
+        creds = client.BasicLoginCredentials(self._user, self._org, self._pass)
+        versions = []
+        for _ in range(2):
+            new_client = client.Client(
+                self._host, verify_ssl_certs=False, server_info_cache=cache)
+            new_client.set_credentials(creds)
+            query = new_client.get_typed_query(
+                client.ResourceType.ORGANIZATION.value,
+                query_result_format=client.QueryResultFormat.RECORDS)
+            self.assertTrue(len(list(query.execute())) > 0)
+            versions.append(new_client.get_api_version())
+            new_client.logout()
+        self.assertEqual(versions[0], versions[1])
+        self.assertIsNotNone(cache.get_versions(new_client.get_api_uri()))
+
+    def test_0160_transfer_stats(self):
+        """Client reports compressed and uncompressed response sizes."""
+        self._client = self._create_client_with_credentials(None)
+        transfers = []
+        self._client.set_transfer_listener(
+            lambda *transfer: transfers.append(transfer))
+        self._client.reset_transfer_stats()
+        query = self._client.get_typed_query(
+            client.ResourceType.ORGANIZATION.value,
+            query_result_format=client.QueryResultFormat.RECORDS)
+        list(query.execute())
+
+        stats = self._client.get_transfer_stats()
+        self.assertGreater(stats['responses'], 0)
+        self.assertEqual(len(transfers), stats['responses'])
+        (method, uri, status_code, wire_bytes, content_bytes) = transfers[-1]
+        self.assertEqual(method, 'GET')
+        self.assertEqual(status_code, 200)
+        self.assertGreater(content_bytes, 0)
+        if wire_bytes is not None:
+            self.assertLessEqual(stats['wire_bytes'], stats['content_bytes'])
+
     def _create_client_with_credentials(self, api_version):
         """Create client with[out] explicit API version and login."""
         new_client = client.Client(
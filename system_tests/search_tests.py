@@ -190,6 +190,95 @@ class TestSearch(BaseTestCase):
                 len(q2_result) >= 4,
                 "Expect at least 4 users from list: {0}".format(format))
 
+    def test_0070_prefetch_pages(self):
+        """Verify concurrent page prefetch returns the same ordered results."""
+        self._client = Environment.get_sys_admin_client()
+        # Rights span several pages on any vCD installation.
+        q1 = self._client.get_typed_query(
+            ResourceType.RIGHT.value,
+            query_result_format=QueryResultFormat.ID_RECORDS,
+            sort_asc='name')
+        q1_names = [r.get('name') for r in q1.execute()]
+        q2 = self._client.get_typed_query(
+            ResourceType.RIGHT.value,
+            query_result_format=QueryResultFormat.ID_RECORDS,
+            sort_asc='name',
+            prefetch_workers=4)
+        q2_names = [r.get('name') for r in q2.execute()]
+        self.assertTrue(len(q1_names) > 25, "Expect more than one page")
+        self.assertEqual(q1_names, q2_names)
+
+    def test_0080_page_size(self):
+        """Verify explicit and automatic page sizes return all results."""
+        self._client = Environment.get_sys_admin_client()
+        results = []
+        for page_size in [None, 5, 'auto']:
+            q1 = self._client.get_typed_query(
+                ResourceType.RIGHT.value,
+                query_result_format=QueryResultFormat.ID_RECORDS,
+                sort_asc='name',
+                page_size=page_size)
+            results.append([r.get('name') for r in q1.execute()])
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+
+    def test_0090_streaming(self):
+        """Verify streaming queries return the same records."""
+        self._client = Environment.get_sys_admin_client()
+        results = []
+        for streaming in [False, True]:
+            q1 = self._client.get_typed_query(
+                ResourceType.RIGHT.value,
+                query_result_format=QueryResultFormat.RECORDS,
+                sort_asc='name',
+                streaming=streaming)
+            results.append([(r.get('name'), r.get('href'))
+                            for r in q1.execute()])
+        self.assertTrue(len(results[1]) > 25, "Expect more than one page")
+        self.assertEqual(results[0], results[1])
+
+    def test_0100_compact_records(self):
+        """Verify compact records carry the attributes of XML records."""
+        self._client = Environment.get_sys_admin_client()
+        q1 = self._client.get_typed_query(
+            ResourceType.RIGHT.value,
+            query_result_format=QueryResultFormat.RECORDS,
+            sort_asc='name',
+            fields='name,category')
+        records = list(q1.execute())
+        q2 = self._client.get_typed_query(
+            ResourceType.RIGHT.value,
+            query_result_format=QueryResultFormat.RECORDS,
+            sort_asc='name',
+            fields='name,category',
+            compact=True)
+        compact_records = list(q2.execute())
+        self.assertEqual(len(records), len(compact_records))
+        for record, compact_record in zip(records, compact_records):
+            self.assertEqual(record.get('name'), compact_record.name)
+            self.assertEqual(record.get('href'), compact_record.href)
+            self.assertEqual(record.get('category'),
+                             compact_record.get('category'))
+
+    def test_0110_json_records(self):
+        """Verify JSON queries return the same records as XML queries."""
+        self._client = Environment.get_sys_admin_client()
+        results = []
+        for json_results in [False, True]:
+            q1 = self._client.get_typed_query(
+                ResourceType.RIGHT.value,
+                query_result_format=QueryResultFormat.RECORDS,
+                sort_asc='name',
+                json_results=json_results)
+            results.append([(r.get('name'), r.get('href'))
+                            for r in q1.execute()])
+        self.assertTrue(len(results[1]) > 25, "Expect more than one page")
+        self.assertEqual(results[0], results[1])
+        org = self._client.get_resource(
+            self._client.get_org().get('href'), json_results=True)
+        self.assertIsInstance(org, dict)
+        self.assertTrue(len(org.get('name')) > 0)
+
 
 if __name__ == '__main__':
     unittest.main()
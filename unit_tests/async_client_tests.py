@@ -0,0 +1,104 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import gc
+import unittest
+import warnings
+
+from unit_tests.fake_vcd import FakeVcd
+from unit_tests.fake_vcd import NS
+from unit_tests.fake_vcd import run_coroutine
+
+from pyvcloud.vcd.async_client import aiohttp
+from pyvcloud.vcd.async_client import AsyncClient
+from pyvcloud.vcd.client import BasicLoginCredentials
+from pyvcloud.vcd.exceptions import ClientException
+
+
+@unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+class TestAsyncClient(unittest.TestCase):
+    """Test AsyncClient requests against a fake vCD."""
+
+    def setUp(self):
+        self._vcd = FakeVcd().start()
+        self._vcd.set_response('GET', '/api/org/1',
+                               '<Org xmlns="%s" name="org"/>' % NS)
+        self._uri = self._vcd.href('/api/org/1')
+
+    def tearDown(self):
+        self._vcd.stop()
+
+    def test_0010_token_follows_relogin(self):
+        """Requests use the token of the Client's current session."""
+        client = self._vcd.get_client()
+
+        async def run():
+            async with AsyncClient(client) as async_client:
+                first = await async_client.get_resource(self._uri)
+                self._vcd.revoke_tokens()
+                client.set_credentials(
+                    BasicLoginCredentials(FakeVcd.USER, FakeVcd.ORG,
+                                          FakeVcd.PASSWORD))
+                second = await async_client.get_resource(self._uri)
+                return first, second
+
+        first, second = run_coroutine(run())
+        self.assertEqual(first.get('name'), 'org')
+        self.assertEqual(second.get('name'), 'org')
+        tokens = [request.headers.get('x-vcloud-authorization')
+                  for request in self._vcd.requests
+                  if request.path == '/api/org/1']
+        self.assertEqual(tokens, ['token-1', 'token-2'])
+
+    def test_0020_successive_loops(self):
+        """A client closed on each loop can be used on successive loops."""
+        async_client = AsyncClient(self._vcd.get_client())
+
+        async def get():
+            try:
+                return await async_client.get_resource(self._uri)
+            finally:
+                await async_client.close()
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always', ResourceWarning)
+            for i in range(2):
+                self.assertEqual(run_coroutine(get()).get('name'), 'org')
+            gc.collect()
+        self.assertEqual(self._vcd.count('GET', '/api/org/1'), 2)
+        self.assertEqual([
+            str(warning.message) for warning in caught
+            if issubclass(warning.category, ResourceWarning)
+        ], [])
+
+    def test_0030_loop_with_open_session(self):
+        """A client is not used on a new loop before it is closed."""
+        async_client = AsyncClient(self._vcd.get_client())
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(async_client.get_resource(self._uri))
+            with self.assertRaises(ClientException):
+                run_coroutine(async_client.get_resource(self._uri))
+            with self.assertRaises(ClientException):
+                run_coroutine(async_client.close())
+            loop.run_until_complete(async_client.close())
+        finally:
+            loop.close()
+        self.assertEqual(self._vcd.count('GET', '/api/org/1'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+import time
+import unittest
+
+from unit_tests.fake_vcd import FakeVcd
+from unit_tests.fake_vcd import NS
+
+
+def _slow_org(request):
+    time.sleep(0.1)
+    return 200, ('<Org xmlns="%s" name="org"/>' % NS).encode(), None
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Test connection pooling of Client sessions."""
+
+    def setUp(self):
+        self._vcd = FakeVcd().start()
+        self._vcd.set_handler('GET', '/api/org/1', _slow_org)
+        self._uri = self._vcd.href('/api/org/1')
+
+    def tearDown(self):
+        self._vcd.stop()
+
+    def _burst(self, client, count):
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            list(executor.map(lambda i: client.get_resource(
+                self._uri, use_cache=False), range(count)))
+
+    def test_0010_idle_connections_are_reopened(self):
+        """Connections idle past keep_alive_timeout are reopened.
+
+        Connections left over from a burst stay idle while steady traffic
+        reuses a single connection, and must be reopened by the next
+        burst even though the client never sat idle.
+        """
+        client = self._vcd.get_client(pool_maxsize=4, keep_alive_timeout=0.3)
+        self._burst(client, 4)
+        deadline = time.monotonic() + 0.6
+        while time.monotonic() < deadline:
+            client.get_resource(self._uri, use_cache=False)
+        self.assertEqual(client.get_connection_pool_stats()['idle_resets'],
+                         0)
+        self._burst(client, 4)
+        self.assertEqual(client.get_connection_pool_stats()['idle_resets'],
+                         3)
+
+    def test_0020_saturation(self):
+        """The pool is only reported saturated if a request waited."""
+        client = self._vcd.get_client(pool_maxsize=2, pool_block=True)
+        self._burst(client, 2)
+        stats = client.get_connection_pool_stats()
+        self.assertEqual(stats['peak_in_flight'], 2)
+        self.assertEqual(stats['pool_exhausted'], 0)
+        self.assertFalse(stats['saturated'])
+        self._burst(client, 4)
+        stats = client.get_connection_pool_stats()
+        self.assertGreater(stats['pool_exhausted'], 0)
+        self.assertTrue(stats['saturated'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import re
+import shutil
+import tempfile
+import time
+import unittest
+
+from unit_tests.fake_vcd import FakeVcd
+
+
+class TestDownload(unittest.TestCase):
+    """Test downloads from transfer uris."""
+
+    def setUp(self):
+        self._vcd = FakeVcd().start()
+        self._client = self._vcd.get_client()
+        # Small ranges, so that small files are split.
+        self._client._DOWNLOAD_RANGE_SIZE = 1000
+        self._dir = tempfile.mkdtemp()
+        self._file_name = os.path.join(self._dir, 'download')
+        self._uri = self._vcd.href('/transfer/file')
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+        self._vcd.stop()
+
+    def _set_contents(self, contents):
+        """Serve contents, honoring Range headers like vCD."""
+        def get_file(request):
+            headers = {'Content-Type': 'application/octet-stream'}
+            range_header = request.headers.get('Range')
+            if range_header is None:
+                return 200, contents, headers
+            start, end = map(int, re.match(r'bytes=(\d+)-(\d+)$',
+                                           range_header).groups())
+            if start >= len(contents):
+                headers['Content-Range'] = 'bytes */%d' % len(contents)
+                return 416, b'', headers
+            end = min(end, len(contents) - 1)
+            headers['Content-Range'] = 'bytes %d-%d/%d' % (start, end,
+                                                           len(contents))
+            return 206, contents[start:end + 1], headers
+
+        self._vcd.set_handler('GET', '/transfer/file', get_file)
+
+    def _download(self, size):
+        written = self._client.download_from_uri(
+            self._uri, self._file_name, chunk_size=100, size=str(size),
+            download_workers=4)
+        with open(self._file_name, 'rb') as f:
+            return written, f.read()
+
+    def _get_ranges(self):
+        return [request.headers.get('Range')
+                for request in self._vcd.requests
+                if request.path == '/transfer/file']
+
+    def test_0010_empty_file(self):
+        self._set_contents(b'')
+        self.assertEqual(self._download(0), (0, b''))
+        self.assertEqual(self._get_ranges(), [None])
+
+    def test_0020_single_range_file(self):
+        contents = os.urandom(1000)
+        self._set_contents(contents)
+        self.assertEqual(self._download(len(contents)), (1000, contents))
+        self.assertEqual(self._get_ranges(), [None])
+
+    def test_0030_ranges(self):
+        contents = os.urandom(3500)
+        self._set_contents(contents)
+        self.assertEqual(self._download(len(contents)), (3500, contents))
+        self.assertEqual(sorted(self._get_ranges()), [
+            'bytes=0-999', 'bytes=1000-1999', 'bytes=2000-2999',
+            'bytes=3000-3499'
+        ])
+
+    def test_0040_worker_sessions(self):
+        """Worker threads do not share the client's session."""
+        sessions = []
+        get_range = self._client._get_range
+
+        def record_session(uri, start, end):
+            sessions.append(self._client._get_session())
+            return get_range(uri, start, end)
+
+        self._client._get_range = record_session
+        contents = os.urandom(3500)
+        self._set_contents(contents)
+        self.assertEqual(self._download(len(contents)), (3500, contents))
+        self.assertEqual(len(sessions), 4)
+        self.assertIs(sessions[0], self._client._session)
+        self.assertNotIn(self._client._session, sessions[1:])
+        self.assertIs(self._client._get_session(), self._client._session)
+
+    def test_0050_responses_closed_on_failure(self):
+        """The first range's response is closed if another range fails."""
+        responses = []
+        get_range = self._client._get_range
+        call_on_thread_session = self._client._call_on_thread_session
+
+        def record_response(uri, start, end):
+            response = get_range(uri, start, end)
+            responses.append(response)
+            return response
+
+        def delay_first_range(function, start, end, response=None):
+            # Start the download of the first range after the failure.
+            if start == 0:
+                time.sleep(0.5)
+            return call_on_thread_session(function, start, end, response)
+
+        self._client._get_range = record_response
+        self._client._call_on_thread_session = delay_first_range
+        contents = os.urandom(3500)
+        self._vcd.set_handler('GET', '/transfer/file', lambda request: (
+            206 if request.headers['Range'] == 'bytes=0-999' else 500,
+            contents[:1000], {'Content-Range': 'bytes 0-999/3500'}))
+        with self.assertRaises(Exception):
+            self._download(len(contents))
+        self.assertGreater(len(responses), 0)
+        self.assertTrue(all(response.raw.closed for response in responses))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,353 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import http.server
+import socketserver
+import threading
+import urllib.parse
+from xml.sax.saxutils import quoteattr
+
+from pyvcloud.vcd.client import BasicLoginCredentials
+from pyvcloud.vcd.client import Client
+from pyvcloud.vcd.client import NSMAP
+
+NS = NSMAP['vcloud']
+XML_TYPE = 'application/vnd.vmware.vcloud+xml'
+
+
+class FakeRequest(object):
+    """A request received by the fake vCD.
+
+    :param str method: HTTP method.
+    :param str path: path of the request, with its query string.
+    :param email.message.Message headers: request headers.
+    :param bytes body: request body.
+    """
+
+    def __init__(self, method, path, headers, body):
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.body = body
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _handle(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length) if length > 0 else b''
+        request = FakeRequest(self.command, self.path, self.headers, body)
+        status, content, headers = self.server.fake.handle(request)
+        self.send_response(status)
+        headers = dict(headers or {})
+        headers.setdefault('Content-Type', XML_TYPE)
+        headers.setdefault('X-VMWARE-VCLOUD-REQUEST-ID',
+                           'request-%d' % len(self.server.fake.requests))
+        headers['Content-Length'] = str(len(content))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+class FakeVcd(object):
+    """In-process fake of a vCD server for unit tests.
+
+    The fake answers the version list, logins and session requests, and
+    serves the responses set with set_response() or computed by handlers
+    set with set_handler().
+    Requests made with a token the fake did not issue, or revoked with
+    revoke_tokens(), get a 401 response. Every request is recorded.
+    """
+
+    USER = 'user'
+    ORG = 'org'
+    PASSWORD = 'password'
+
+    def __init__(self):
+        self.requests = []
+        self._responses = {}
+        self._queries = []
+        self._tokens = set()
+        self._logins = 0
+        self._lock = threading.Lock()
+        self._server = _Server(('127.0.0.1', 0), _Handler)
+        self._server.fake = self
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def base_uri(self):
+        return 'http://127.0.0.1:%d' % self._server.server_address[1]
+
+    def href(self, path):
+        """Return the absolute href of a path of the fake server."""
+        return self.base_uri + path
+
+    def get_client(self, **kwargs):
+        """Return a Client logged in to the fake server.
+
+        :param kwargs: arguments of the Client constructor.
+
+        :rtype: pyvcloud.vcd.client.Client
+        """
+        kwargs.setdefault('api_version', '32.0')
+        client = Client(self.base_uri, **kwargs)
+        client.set_credentials(
+            BasicLoginCredentials(self.USER, self.ORG, self.PASSWORD))
+        return client
+
+    def set_response(self, method, path, content, status=200, headers=None):
+        """Serve a fixed response.
+
+        :param str method: HTTP method.
+        :param str path: path, with its query string if the response only
+            applies to that query.
+        :param content: response body, str or bytes.
+        :param int status: HTTP status code.
+        :param dict headers: response headers.
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        self._responses[(method, path)] = lambda request: (status, content,
+                                                           headers)
+
+    def set_handler(self, method, path, handler):
+        """Serve responses computed by a function.
+
+        :param str method: HTTP method.
+        :param str path: path, with its query string if the handler only
+            applies to that query.
+        :param function handler: a function with signature
+            function(request) returning a tuple (status, content, headers).
+        """
+        self._responses[(method, path)] = handler
+
+    def set_query(self, query_type, handler):
+        """Serve a typed query.
+
+        The query is listed in the query list of sessions, in every result
+        format, with href /api/query/<query_type>?format=<format>.
+
+        :param str query_type: name of the query, e.g. 'task'.
+        :param function handler: a function with signature
+            function(request) returning a tuple (status, content, headers).
+        """
+        self._queries.append(query_type)
+        self.set_handler('GET', '/api/query/' + query_type, handler)
+
+    def revoke_tokens(self):
+        """Reject the tokens of all current sessions."""
+        with self._lock:
+            self._tokens.clear()
+
+    def count(self, method, path):
+        """Return the number of requests received for a path.
+
+        :param str method: HTTP method.
+        :param str path: path, without its query string.
+
+        :rtype: int
+        """
+        return sum(1 for request in list(self.requests)
+                   if request.method == method and
+                   urllib.parse.urlsplit(request.path).path == path)
+
+    def handle(self, request):
+        self.requests.append(request)
+        path = urllib.parse.urlsplit(request.path).path
+        if request.method == 'GET' and path == '/api/versions':
+            return self._versions()
+        if request.method == 'POST' and path == '/api/sessions':
+            return self._login()
+        token = request.headers.get('x-vcloud-authorization')
+        with self._lock:
+            authorized = token in self._tokens
+        if not authorized:
+            return error(401, 'Unauthorized')
+        if request.method == 'DELETE' and path == '/api/session':
+            with self._lock:
+                self._tokens.discard(token)
+            return 204, b'', None
+        if request.method == 'GET' and path == '/api/session':
+            return 200, self._session(), {'x-vcloud-authorization': token}
+        if request.method == 'GET' and path == '/api/query':
+            return self._query_list()
+        handler = self._responses.get((request.method, request.path))
+        if handler is None:
+            handler = self._responses.get((request.method, path))
+        if handler is None:
+            return error(404, 'Not found: %s' % request.path)
+        return handler(request)
+
+    def _versions(self):
+        versions = ''.join(
+            '<VersionInfo deprecated="false"><Version>%s</Version>'
+            '<LoginUrl>%s</LoginUrl></VersionInfo>' %
+            (version, self.href('/api/sessions'))
+            for version in ['29.0', '30.0', '31.0', '32.0'])
+        return 200, ('<SupportedVersions xmlns="%s">%s</SupportedVersions>' %
+                     (NS, versions)).encode(), None
+
+    def _query_list(self):
+        links = ''.join(
+            '<Link rel="down" '
+            'type="application/vnd.vmware.vcloud.query.%s+xml" '
+            'name="%s" href="%s"/>' %
+            (query_format, query_type,
+             self.href('/api/query/%s?format=%s' %
+                       (query_type, query_format)))
+            for query_type in self._queries
+            for query_format in ['records', 'idrecords', 'references'])
+        return 200, ('<QueryList xmlns="%s">%s</QueryList>' %
+                     (NS, links)).encode(), None
+
+    def _login(self):
+        with self._lock:
+            self._logins += 1
+            token = 'token-%d' % self._logins
+            self._tokens.add(token)
+        return 200, self._session(), {'x-vcloud-authorization': token}
+
+    def _session(self):
+        return (
+            '<Session xmlns="%s" org="%s" user="%s">'
+            '<Link rel="down" '
+            'type="application/vnd.vmware.vcloud.query.queryList+xml" '
+            'href="%s"/>'
+            '<Link rel="down" type="application/vnd.vmware.vcloud.orgList+xml"'
+            ' href="%s"/>'
+            '</Session>' % (NS, self.ORG, self.USER, self.href('/api/query'),
+                            self.href('/api/org'))).encode()
+
+
+def error(status, message):
+    """Return a vCD error response.
+
+    :param int status: HTTP status code.
+    :param str message: error message.
+
+    :return: a tuple (status, content, headers).
+
+    :rtype: tuple
+    """
+    return status, (
+        '<Error xmlns="%s" message="%s" majorErrorCode="%d" '
+        'minorErrorCode="ERROR"/>' % (NS, message, status)).encode(), None
+
+
+def get_filter(request):
+    """Return the conditions of the filter of a query request.
+
+    :param FakeRequest request: a typed query request.
+
+    :return: (attribute, value) tuples of the filter's conditions, with
+        decoded values. Conditions must be joined with ',' or ';'.
+
+    :rtype: list
+    """
+    params = urllib.parse.parse_qs(urllib.parse.urlsplit(request.path).query)
+    if 'filter' not in params:
+        return []
+    conditions = []
+    for condition in params['filter'][0].replace(';', ',').split(','):
+        name, value = condition.split('==', 1)
+        conditions.append((name, urllib.parse.unquote_plus(value)))
+    return conditions
+
+
+def records(record_name, attributes, children=None, next_page_href=None):
+    """Return the XML of a page of query records.
+
+    :param str record_name: tag of the records, e.g. 'TaskRecord'.
+    :param list attributes: one dict of attributes per record.
+    :param list children: one string of child elements XML per record, if
+        any.
+    :param str next_page_href: href of the next page, if any.
+
+    :rtype: bytes
+    """
+    if children is None:
+        children = [''] * len(attributes)
+    link = ''
+    if next_page_href is not None:
+        link = '<Link rel="nextPage" href=%s/>' % quoteattr(next_page_href)
+    page = ''.join(
+        '<%s %s>%s</%s>' % (record_name, ' '.join(
+            '%s=%s' % (name, quoteattr(value))
+            for name, value in record.items()), child, record_name)
+        for record, child in zip(attributes, children))
+    return ('<QueryResultRecords xmlns="%s">%s%s</QueryResultRecords>' %
+            (NS, link, page)).encode()
+
+
+def task(href, status, owner_href=None, operation='op'):
+    """Return the XML of a Task resource.
+
+    Tasks in error hold an Error element.
+
+    :param str href: href of the task.
+    :param str status: status of the task.
+    :param str owner_href: href of the owner of the task, if any.
+    :param str operation: operation of the task.
+
+    :rtype: bytes
+    """
+    children = ''
+    if owner_href is not None:
+        children = '<Owner href="%s" type="%s"/>' % (
+            owner_href, 'application/vnd.vmware.vcloud.vApp+xml')
+    if status == 'error':
+        children += ('<Error message="failed" majorErrorCode="500" '
+                     'minorErrorCode="ERROR"/>')
+    return ('<Task xmlns="%s" href="%s" id="urn:vcloud:task:%s" '
+            'status="%s" operation="%s" operationName="%s">%s</Task>' %
+            (NS, href, href.rsplit('/', 1)[1], status, operation, operation,
+             children)).encode()
+
+
+def run_coroutine(coroutine):
+    """Run a coroutine to completion on a new event loop.
+
+    asyncio.run() is only available from Python 3.7.
+
+    :param coroutine: the coroutine to run.
+
+    :return: the result of the coroutine.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
@@ -0,0 +1,83 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from unit_tests.fake_vcd import error
+from unit_tests.fake_vcd import FakeVcd
+
+from pyvcloud.vcd.exceptions import NotFoundException
+from pyvcloud.vcd.exceptions import UnknownApiException
+from pyvcloud.vcd.response_cache import ResponseCache
+
+JSON_TYPE = 'application/vnd.vmware.vcloud.vApp+json;version=32.0'
+
+# Proxies answer with HTML pages that are not well-formed XML.
+BAD_GATEWAY_PAGE = (b'<html><head><title>502 Bad Gateway</title></head>'
+                    b'<body><center>Bad Gateway</center><hr></body></html>')
+
+
+class TestJsonResults(unittest.TestCase):
+    """Test resource reads in the JSON representation."""
+
+    def setUp(self):
+        self._vcd = FakeVcd().start()
+        self._uri = self._vcd.href('/api/vApp/vapp-1')
+
+    def tearDown(self):
+        self._vcd.stop()
+
+    def _get_clients(self):
+        return [
+            self._vcd.get_client(),
+            self._vcd.get_client(response_cache=ResponseCache())
+        ]
+
+    def test_0010_json_body(self):
+        """JSON bodies are decoded, including cached ones."""
+        self._vcd.set_response('GET', '/api/vApp/vapp-1',
+                               '{"name": "vapp"}',
+                               headers={'Content-Type': JSON_TYPE})
+        for client in self._get_clients():
+            for _ in range(2):
+                self.assertEqual(
+                    client.get_resource(self._uri, json_results=True),
+                    {'name': 'vapp'})
+
+    def test_0020_xml_error_body(self):
+        """XML errors of vCD are raised as such in JSON mode."""
+        self._vcd.set_handler('GET', '/api/vApp/vapp-1',
+                              lambda request: error(404, 'No vApp'))
+        for client in self._get_clients():
+            with self.assertRaises(NotFoundException) as cm:
+                client.get_resource(self._uri, json_results=True)
+            self.assertEqual(cm.exception.vcd_error.get('message'),
+                             'No vApp')
+
+    def test_0030_html_error_body(self):
+        """Errors with bodies that are not XML are raised too."""
+        self._vcd.set_response('GET', '/api/vApp/vapp-1', BAD_GATEWAY_PAGE,
+                               status=502,
+                               headers={'Content-Type': 'text/html'})
+        for client in self._get_clients():
+            for json_results in [True, False]:
+                with self.assertRaises(UnknownApiException) as cm:
+                    client.get_resource(self._uri, json_results=json_results)
+                self.assertEqual(cm.exception.status_code, 502)
+                self.assertIsNone(cm.exception.vcd_error)
+
+
+if __name__ == '__main__':
+    unittest.main()
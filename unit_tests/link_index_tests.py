@@ -0,0 +1,140 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from unit_tests.fake_vcd import FakeVcd
+
+from pyvcloud.vcd.client import _objectify_content
+from pyvcloud.vcd.client import EntityType
+from pyvcloud.vcd.client import find_link
+from pyvcloud.vcd.client import get_links
+from pyvcloud.vcd.client import index_links
+from pyvcloud.vcd.client import NSMAP
+from pyvcloud.vcd.client import RelationType
+from pyvcloud.vcd.org import Org
+from pyvcloud.vcd.vapp import VApp
+
+
+def _get_vapp(as_object=True):
+    return _objectify_content(
+        ('<VApp xmlns="%s" href="https://vcd/api/vApp/vapp-1">'
+         '<Link rel="up" type="%s" href="https://vcd/api/vdc/1"/>'
+         '<Link rel="down" type="%s" name="vm1" href="https://vcd/api/vm/1"/>'
+         '<Link rel="down" type="%s" name="vm2" href="https://vcd/api/vm/2"/>'
+         '</VApp>' % (NSMAP['vcloud'], EntityType.VDC.value,
+                      EntityType.VM.value, EntityType.VM.value)).encode(),
+        as_object)
+
+
+def _get_org(href, vdc_names):
+    return ('<Org xmlns="%s" href="%s" name="org">%s</Org>' %
+            (NSMAP['vcloud'], href, ''.join(
+                '<Link rel="down" type="%s" name="%s" href="%s/vdc/%s"/>' %
+                (EntityType.VDC.value, name, href, name)
+                for name in vdc_names))).encode()
+
+
+class TestLinkIndex(unittest.TestCase):
+    """Test link lookups on resources."""
+
+    def test_0010_lookup(self):
+        """Lookups give the same links with and without an index."""
+        for as_object in [True, False]:
+            vapp = _get_vapp(as_object)
+            for link_index in [None, index_links(vapp)]:
+                self.assertEqual(
+                    find_link(vapp, RelationType.UP, EntityType.VDC.value,
+                              link_index=link_index).href,
+                    'https://vcd/api/vdc/1')
+                self.assertEqual([
+                    link.href for link in get_links(
+                        vapp, RelationType.DOWN, EntityType.VM.value,
+                        link_index=link_index)
+                ], ['https://vcd/api/vm/1', 'https://vcd/api/vm/2'])
+                self.assertEqual([
+                    link.href for link in get_links(
+                        vapp, RelationType.DOWN, EntityType.VM.value, 'vm2',
+                        link_index)
+                ], ['https://vcd/api/vm/2'])
+                self.assertIsNone(
+                    find_link(vapp, RelationType.EDIT, EntityType.VAPP.value,
+                              fail_if_absent=False, link_index=link_index))
+
+    def test_0020_links_changed_in_place(self):
+        """Lookups without an index see links changed in place."""
+        vapp = _get_vapp()
+        find_link(vapp, RelationType.UP, EntityType.VDC.value)
+        vapp.Link[0].set('href', 'https://vcd/api/vdc/2')
+        self.assertEqual(
+            find_link(vapp, RelationType.UP, EntityType.VDC.value).href,
+            'https://vcd/api/vdc/2')
+        vapp.remove(vapp.Link[2])
+        self.assertEqual(
+            len(get_links(vapp, RelationType.DOWN, EntityType.VM.value)), 1)
+
+    def test_0030_wrapper_index(self):
+        """Wrappers index the links of each resource they hold once."""
+        vcd = FakeVcd().start()
+        try:
+            href = vcd.href('/api/org/1')
+            vcd.set_response('GET', '/api/org/1', _get_org(href, ['a', 'b']))
+            org = Org(vcd.get_client(), href=href)
+            org.reload()
+            link_index = org._get_link_index(org.resource)
+            self.assertEqual([vdc['name'] for vdc in org.list_vdcs()],
+                             ['a', 'b'])
+            self.assertIs(org._get_link_index(org.resource), link_index)
+            vcd.set_response('GET', '/api/org/1', _get_org(href, ['c']))
+            org.reload()
+            self.assertEqual([vdc['name'] for vdc in org.list_vdcs()], ['c'])
+            org.resource = _objectify_content(_get_org(href, ['d']))
+            self.assertEqual([vdc['name'] for vdc in org.list_vdcs()], ['d'])
+        finally:
+            vcd.stop()
+
+    def test_0040_linked_resources(self):
+        """Operations on linked resources look links up in the index."""
+        vcd = FakeVcd().start()
+        try:
+            href = vcd.href('/api/vApp/vapp-1')
+            vcd.set_response('GET', '/api/vApp/vapp-1', (
+                '<VApp xmlns="%s" href="%s" name="vapp">'
+                '<Link rel="power:suspend" href="%s/power/action/suspend"/>'
+                '<Link rel="enterMaintenanceMode" '
+                'href="%s/action/enterMaintenanceMode"/>'
+                '</VApp>' % (NSMAP['vcloud'], href, href, href)).encode())
+            for action in ['power/action/suspend',
+                           'action/enterMaintenanceMode']:
+                vcd.set_response('POST', '/api/vApp/vapp-1/' + action,
+                                 '<Task xmlns="%s"/>' % NSMAP['vcloud'])
+            vapp = VApp(vcd.get_client(), href=href)
+            vapp.suspend_vapp()
+            self.assertIs(vapp._link_index[0], vapp.resource)
+            link_index = vapp._get_link_index(vapp.resource)
+            vapp.enter_maintenance_mode()
+            self.assertIs(vapp._get_link_index(vapp.resource), link_index)
+            self.assertEqual(
+                vcd.count('POST', '/api/vApp/vapp-1/power/action/suspend'), 1)
+            self.assertEqual(
+                vcd.count('POST',
+                          '/api/vApp/vapp-1/action/enterMaintenanceMode'), 1)
+            self.assertIsNone(vapp._get_link_index(_get_vapp()))
+        finally:
+            vcd.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+from unit_tests.fake_vcd import FakeVcd
+from unit_tests.fake_vcd import run_coroutine
+from unit_tests.fake_vcd import task
+
+from pyvcloud.vcd.client import _objectify_content
+from pyvcloud.vcd.client import _TaskMonitor
+from pyvcloud.vcd.client import ExponentialBackoffPolling
+from pyvcloud.vcd.client import FixedPolling
+from pyvcloud.vcd.client import NSMAP
+from pyvcloud.vcd.client import PollingStrategy
+from pyvcloud.vcd.exceptions import TaskTimeoutException
+
+
+def _task_with_progress(progress):
+    return _objectify_content(
+        ('<Task xmlns="%s" status="running"><Progress>%d</Progress>'
+         '</Task>' % (NSMAP['vcloud'], progress)).encode())
+
+
+class TestPollingStrategies(unittest.TestCase):
+    """Test the delays chosen by polling strategies."""
+
+    def test_0010_fixed(self):
+        polling = FixedPolling(5)
+        self.assertEqual(
+            [polling.next_delay(attempt, attempt * 5.0)
+             for attempt in range(1, 5)], [5, 5, 5, 5])
+
+    def test_0020_backoff(self):
+        polling = ExponentialBackoffPolling(
+            initial=0.5, factor=2, max_delay=3, jitter=0)
+        self.assertEqual(
+            [polling.next_delay(attempt, 0) for attempt in range(1, 7)],
+            [0.5, 1, 2, 3, 3, 3])
+
+    def test_0030_backoff_jitter(self):
+        polling = ExponentialBackoffPolling(
+            initial=1, factor=1, max_delay=1, jitter=0.1)
+        for attempt in range(1, 100):
+            self.assertTrue(0.9 <= polling.next_delay(attempt, 0) <= 1.1)
+
+    def test_0040_backoff_progress(self):
+        polling = ExponentialBackoffPolling(
+            initial=0.5, factor=2, max_delay=30, jitter=0)
+        # 20 s elapsed at 80% predicts 5 s remaining, less than 16 s.
+        self.assertEqual(polling.next_delay(6, 20, _task_with_progress(80)),
+                         5)
+        # The prediction is bounded by the initial delay...
+        self.assertEqual(polling.next_delay(6, 1, _task_with_progress(99)),
+                         0.5)
+        # ...and only used when shorter than the backoff delay.
+        self.assertEqual(polling.next_delay(2, 20, _task_with_progress(10)),
+                         1)
+        polling.use_progress = False
+        self.assertEqual(polling.next_delay(6, 20, _task_with_progress(80)),
+                         16)
+
+
+class TestWaitTimeout(unittest.TestCase):
+    """Test timeouts and default polling of task waits."""
+
+    def setUp(self):
+        self._vcd = FakeVcd().start()
+        self._task_href = self._vcd.href('/api/task/1')
+        self._vcd.set_response('GET', '/api/task/1',
+                               task(self._task_href, 'running'))
+        self._client = self._vcd.get_client()
+
+    def tearDown(self):
+        self._vcd.stop()
+
+    def test_0010_default_polling(self):
+        """Waits poll every 5 seconds unless told otherwise."""
+        polling = _TaskMonitor(self._client)._get_polling_strategy(None)
+        self.assertIsInstance(polling, FixedPolling)
+        self.assertEqual(polling.interval, 5)
+
+    def test_0020_no_timeout(self):
+        """Synchronous waits outlast the timeout until the task finishes."""
+        polls = []
+
+        def get_task(request):
+            polls.append(request)
+            status = 'success' if len(polls) == 5 else 'running'
+            return 200, task(self._task_href, status), None
+
+        self._vcd.set_handler('GET', '/api/task/1', get_task)
+        result = self._client.get_task_monitor().wait_for_success(
+            _objectify_content(task(self._task_href, 'running')),
+            timeout=0.1,
+            poll_frequency=0.1)
+        self.assertEqual(result.get('status'), 'success')
+        self.assertEqual(len(polls), 5)
+
+    def test_0030_async_timeout(self):
+        """An async wait for a task still running after the timeout raises."""
+        start = time.monotonic()
+        with self.assertRaises(TaskTimeoutException):
+            run_coroutine(
+                self._client.get_task_monitor().async_wait_for_success(
+                    _objectify_content(task(self._task_href, 'running')),
+                    timeout=0.5,
+                    poll_frequency=0.1))
+        self.assertLess(time.monotonic() - start, 2)
+        # The last poll happens at the timeout, not one interval later.
+        self.assertIn(self._vcd.count('GET', '/api/task/1'), range(5, 8))
+
+    def test_0040_strategy_is_abstract(self):
+        """Polling strategies must implement next_delay()."""
+
+        class NoDelay(PollingStrategy):
+            pass
+
+        with self.assertRaises(TypeError):
+            NoDelay()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from unit_tests.fake_vcd import FakeVcd
+from unit_tests.fake_vcd import NS
+from unit_tests.fake_vcd import run_coroutine
+
+from pyvcloud.vcd.async_client import aiohttp
+from pyvcloud.vcd.async_client import AsyncClient
+from pyvcloud.vcd.client import BasicLoginCredentials
+from pyvcloud.vcd.client import Client
+from pyvcloud.vcd.client import E
+from pyvcloud.vcd.client import EntityType
+from pyvcloud.vcd.response_cache import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test the response cache of clients."""
+
+    def setUp(self):
+        self._vcd = FakeVcd().start()
+        self._vcd.set_response('GET', '/api/vApp/vapp-1',
+                               '<VApp xmlns="%s" name="vapp"/>' % NS)
+        self._vcd.set_response('PUT', '/api/vApp/vapp-1',
+                               '<VApp xmlns="%s" name="vapp"/>' % NS)
+        self._uri = self._vcd.href('/api/vApp/vapp-1')
+        self._cache = ResponseCache(ttl=60)
+
+    def tearDown(self):
+        self._vcd.stop()
+
+    def _get_count(self):
+        return self._vcd.count('GET', '/api/vApp/vapp-1')
+
+    def test_0010_shared_by_users(self):
+        """Clients sharing a cache only get responses of their own user."""
+        client = self._vcd.get_client(response_cache=self._cache)
+        client.get_resource(self._uri)
+        client.get_resource(self._uri)
+        self.assertEqual(self._get_count(), 1)
+
+        other_client = self._vcd.get_client(response_cache=self._cache)
+        other_client.set_credentials(
+            BasicLoginCredentials('other', FakeVcd.ORG, FakeVcd.PASSWORD))
+        other_client.get_resource(self._uri)
+        self.assertEqual(self._get_count(), 2)
+
+        same_user_client = self._vcd.get_client(response_cache=self._cache)
+        same_user_client.get_resource(self._uri)
+        self.assertEqual(self._get_count(), 2)
+
+    def test_0020_token_identity(self):
+        """Sessions rehydrated from tokens do not share responses."""
+        client = self._vcd.get_client(response_cache=self._cache)
+        client.get_resource(self._uri)
+        token_client = Client(self._vcd.base_uri, api_version='32.0',
+                              response_cache=self._cache)
+        token_client.rehydrate_from_token(
+            self._vcd.get_client()._get_auth_token())
+        token_client.get_resource(self._uri)
+        token_client.get_resource(self._uri)
+        self.assertEqual(self._get_count(), 2)
+
+    def test_0025_logout(self):
+        """Logging out only drops the responses of the client's user."""
+        client = self._vcd.get_client(response_cache=self._cache)
+        client.get_resource(self._uri)
+        other_client = self._vcd.get_client(response_cache=self._cache)
+        other_client.set_credentials(
+            BasicLoginCredentials('other', FakeVcd.ORG, FakeVcd.PASSWORD))
+        other_client.get_resource(self._uri)
+        self.assertEqual(self._get_count(), 2)
+
+        other_client.logout()
+        self.assertEqual(self._cache.get_stats()['entries'], 1)
+        client.get_resource(self._uri)
+        self.assertEqual(self._get_count(), 2)
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_0030_async_invalidation(self):
+        """Async updates drop the cached copies of a resource."""
+        client = self._vcd.get_client(response_cache=self._cache)
+        client.get_resource(self._uri)
+
+        async def update():
+            async with AsyncClient(client) as async_client:
+                await async_client.put_resource(
+                    self._uri, E.VApp(name='vapp'), EntityType.VAPP.value)
+
+        run_coroutine(update())
+        client.get_resource(self._uri)
+        self.assertEqual(self._get_count(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from unit_tests.fake_vcd import FakeVcd
+from unit_tests.fake_vcd import NS
+
+from pyvcloud.vcd.client import E
+from pyvcloud.vcd.client import EntityType
+from pyvcloud.vcd.session_cache import ServerInfoCache
+from pyvcloud.vcd.session_cache import SessionCache
+
+URI = 'https://vcd.example.com/api'
+
+
+class TestSessionCaches(unittest.TestCase):
+    """Test the on-disk session and server information caches."""
+
+    def setUp(self):
+        self._dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._dir, 'cache.json')
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def test_0010_expired_entry_read_again(self):
+        """An expired entry is read again from the file."""
+        cache = ServerInfoCache(self._path, ttl=0.2)
+        other_process_cache = ServerInfoCache(self._path, ttl=60)
+        cache.set_versions(URI, ['31.0'])
+        self.assertEqual(cache.get_versions(URI), ['31.0'])
+        time.sleep(0.3)
+        self.assertIsNone(cache.get_versions(URI))
+        other_process_cache.set_versions(URI, ['32.0'])
+        self.assertEqual(cache.get_versions(URI), ['32.0'])
+
+    def test_0020_expired_file_entry_not_kept(self):
+        """An expired file entry does not hide a later one."""
+        ServerInfoCache(self._path, ttl=0).set_versions(URI, ['31.0'])
+        cache = ServerInfoCache(self._path, ttl=60)
+        self.assertIsNone(cache.get_versions(URI))
+        ServerInfoCache(self._path, ttl=60).set_versions(URI, ['32.0'])
+        self.assertEqual(cache.get_versions(URI), ['32.0'])
+
+    def test_0030_shared_file(self):
+        """Caches sharing a file only clear their own entries."""
+        session_cache = SessionCache(self._path)
+        server_info_cache = ServerInfoCache(self._path)
+        session_cache.store('key', {'token': 'token'})
+        server_info_cache.set_versions(URI, ['32.0'])
+
+        session_cache.clear()
+        self.assertIsNone(session_cache.load('key'))
+        self.assertEqual(
+            ServerInfoCache(self._path).get_versions(URI), ['32.0'])
+
+        session_cache.store('key', {'token': 'token'})
+        server_info_cache.clear()
+        self.assertIsNone(ServerInfoCache(self._path).get_versions(URI))
+        self.assertEqual(session_cache.load('key')['token'], 'token')
+
+    def test_0040_rejected_session_replaced(self):
+        """A request rejected for a cached session is sent again."""
+        vcd = FakeVcd().start()
+        try:
+            vcd.set_response('POST', '/api/vApp/1/action/deploy',
+                             '<Task xmlns="%s" status="running"/>' % NS)
+            cache = SessionCache(self._path)
+            vcd.get_client(session_cache=cache)
+            vcd.revoke_tokens()
+            client = vcd.get_client(session_cache=cache)
+            task = client.post_resource(
+                vcd.href('/api/vApp/1/action/deploy'), E.DeployVAppParams(),
+                EntityType.DEPLOY.value)
+            self.assertEqual(task.get('status'), 'running')
+            self.assertEqual(vcd.count('POST', '/api/sessions'), 2)
+            self.assertEqual(vcd.count('POST', '/api/vApp/1/action/deploy'),
+                             2)
+        finally:
+            vcd.stop()
+
+    def test_0050_rejected_session_replaced_once(self):
+        """Threads rejected for a cached session log in again once."""
+        vcd = FakeVcd().start()
+        try:
+            vcd.set_response('GET', '/api/org/1',
+                             '<Org xmlns="%s" name="org"/>' % NS)
+            cache = SessionCache(self._path)
+            vcd.get_client(session_cache=cache)
+            vcd.revoke_tokens()
+            client = vcd.get_client(session_cache=cache, thread_safe=True)
+            barrier = threading.Barrier(8)
+            names = []
+
+            def get():
+                barrier.wait()
+                names.append(client.get_resource(
+                    vcd.href('/api/org/1')).get('name'))
+
+            threads = [threading.Thread(target=get) for i in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(names, ['org'] * 8)
+            self.assertEqual(vcd.count('POST', '/api/sessions'), 2)
+        finally:
+            vcd.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
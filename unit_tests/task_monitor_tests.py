@@ -0,0 +1,168 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import threading
+import unittest
+
+from lxml import etree
+from unit_tests.fake_vcd import FakeVcd
+from unit_tests.fake_vcd import get_filter
+from unit_tests.fake_vcd import NS
+from unit_tests.fake_vcd import records
+from unit_tests.fake_vcd import run_coroutine
+from unit_tests.fake_vcd import task
+
+from pyvcloud.vcd.async_client import aiohttp
+from pyvcloud.vcd.async_client import AsyncClient
+from pyvcloud.vcd.client import _objectify_content
+from pyvcloud.vcd.exceptions import VcdTaskException
+from pyvcloud.vcd.response_cache import ResponseCache
+
+
+class TestTaskMonitor(unittest.TestCase):
+    """Test task waits against a fake vCD."""
+
+    def setUp(self):
+        self._vcd = FakeVcd().start()
+
+    def tearDown(self):
+        self._vcd.stop()
+
+    def _set_task(self, path, status, owner_href=None):
+        self._vcd.set_response('GET', path,
+                               task(self._vcd.href(path), status, owner_href))
+        return _objectify_content(
+            task(self._vcd.href(path), 'running', owner_href))
+
+    def _check_owner_invalidated(self, wait):
+        vapp_href = self._vcd.href('/api/vApp/vapp-1')
+        self._vcd.set_response('GET', '/api/vApp/vapp-1',
+                               '<VApp xmlns="%s" name="vapp"/>' % NS)
+        client = self._vcd.get_client(response_cache=ResponseCache(ttl=60))
+        client.get_resource(vapp_href)
+        client.get_resource(vapp_href)
+        self.assertEqual(self._vcd.count('GET', '/api/vApp/vapp-1'), 1)
+        wait(client, self._set_task('/api/task/1', 'success', vapp_href))
+        client.get_resource(vapp_href)
+        self.assertEqual(self._vcd.count('GET', '/api/vApp/vapp-1'), 2)
+
+    def test_0010_owner_invalidated(self):
+        """A finished task drops the cached copies of its owner."""
+        self._check_owner_invalidated(
+            lambda client, task: client.get_task_monitor().wait_for_success(
+                task, poll_frequency=0.01))
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_0020_owner_invalidated_async(self):
+        """A task finished in an async wait drops its owner from caches."""
+        async def wait(client, task):
+            async with AsyncClient(client) as async_client:
+                return await async_client.get_task_monitor(
+                ).async_wait_for_success(task, poll_frequency=0.01)
+
+        self._check_owner_invalidated(
+            lambda client, task: run_coroutine(wait(client, task)))
+
+    def test_0030_wait_for_tasks(self):
+        """Tasks are polled with one query, and fetched once finished."""
+        statuses = {'1': 'running', '2': 'running', '3': 'running'}
+        polls = []
+        lock = threading.Lock()
+
+        def task_query(request):
+            task_ids = [value for name, value in get_filter(request)]
+            with lock:
+                polls.append(sorted(task_ids))
+                page = records('TaskRecord', [{
+                    'id': task_id,
+                    'href': self._vcd.href('/api/task/' + task_id[-1]),
+                    'status': statuses[task_id[-1]]
+                } for task_id in task_ids])
+                # Tasks finish one after the other, the last one in error.
+                if len(polls) <= 3:
+                    statuses[str(len(polls))] = \
+                        'error' if len(polls) == 3 else 'success'
+            return 200, page, None
+
+        def get_task(task_number):
+            def handler(request):
+                with lock:
+                    status = statuses[task_number]
+                return 200, task(
+                    self._vcd.href('/api/task/' + task_number), status), None
+            return handler
+
+        self._vcd.set_query('task', task_query)
+        tasks = []
+        for task_number in sorted(statuses):
+            path = '/api/task/' + task_number
+            self._vcd.set_handler('GET', path, get_task(task_number))
+            tasks.append(_objectify_content(
+                task(self._vcd.href(path), 'running')))
+        client = self._vcd.get_client()
+        futures = client.get_task_monitor().wait_for_tasks(
+            tasks, timeout=10, poll_frequency=0.01)
+        concurrent.futures.wait(futures, timeout=10)
+
+        self.assertEqual(futures[0].result().get('status'), 'success')
+        self.assertEqual(futures[1].result().get('status'), 'success')
+        self.assertIsInstance(futures[2].exception(), VcdTaskException)
+        task_ids = ['urn:vcloud:task:%s' % n for n in sorted(statuses)]
+        self.assertEqual(polls, [task_ids, task_ids, task_ids[1:],
+                                 task_ids[2:]])
+        for task_number in sorted(statuses):
+            self.assertEqual(
+                self._vcd.count('GET', '/api/task/' + task_number), 1)
+
+    def test_0040_wait_for_tasks_fallback(self):
+        """Tasks missing from the query are passed as records too."""
+        def task_query(request):
+            # Only the second task is visible to the query.
+            return 200, records('TaskRecord', [{
+                'id': 'urn:vcloud:task:2',
+                'href': self._vcd.href('/api/task/2'),
+                'name': 'op',
+                'status': 'success'
+            }]), None
+
+        self._vcd.set_query('task', task_query)
+        tasks = [
+            self._set_task('/api/task/1', 'success'),
+            self._set_task('/api/task/2', 'success')
+        ]
+        polled = []
+        client = self._vcd.get_client()
+        futures = client.get_task_monitor().wait_for_tasks(
+            tasks, timeout=10, poll_frequency=0.01, callback=polled.append)
+        concurrent.futures.wait(futures, timeout=10)
+
+        self.assertEqual([future.result().get('status')
+                          for future in futures], ['success', 'success'])
+        self.assertEqual([etree.QName(record).localname
+                          for record in polled], ['TaskRecord'] * 2)
+        self.assertEqual(dict(polled[0].attrib), {
+            'href': self._vcd.href('/api/task/1'),
+            'id': 'urn:vcloud:task:1',
+            'name': 'op',
+            'operationFullName': 'op',
+            'status': 'success'
+        })
+        self.assertEqual(polled[1].get('href'),
+                         self._vcd.href('/api/task/2'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,287 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+
+from unit_tests.fake_vcd import FakeVcd
+from unit_tests.fake_vcd import get_filter
+from unit_tests.fake_vcd import records
+from unit_tests.fake_vcd import run_coroutine
+from unit_tests.fake_vcd import task
+
+from pyvcloud.vcd.amqp import AmqpTaskNotificationListener
+from pyvcloud.vcd.amqp import pika
+from pyvcloud.vcd.amqp import TaskNotificationListener
+from pyvcloud.vcd.client import _objectify_content
+from pyvcloud.vcd.client import FixedPolling
+from pyvcloud.vcd.client import NSMAP
+from pyvcloud.vcd.exceptions import TaskTimeoutException
+
+
+def _notification(task_id, event='com/vmware/vcloud/event/task/complete'):
+    return ('<vmext:Notification xmlns:vmext="%s" type="%s">'
+            '<vmext:EntityLink type="vcloud:task" id="%s"/>'
+            '</vmext:Notification>' % (NSMAP['vmext'], event,
+                                       task_id)).encode()
+
+
+class _FakeBroker(object):
+    """Delivers vCD notifications to a listener from its own thread."""
+
+    def __init__(self, listener):
+        self._listener = listener
+        self._threads = []
+
+    def publish_task_completion(self, task_id, delay=0,
+                                event='com/vmware/vcloud/event/task/complete'):
+        body = _notification(task_id, event)
+
+        def deliver():
+            time.sleep(delay)
+            self._listener.dispatch(body)
+
+        thread = threading.Thread(target=deliver, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def join(self):
+        for thread in self._threads:
+            thread.join()
+
+
+class TestTaskNotifications(unittest.TestCase):
+    """Test task waits ended by completion notifications."""
+
+    def setUp(self):
+        self._vcd = FakeVcd().start()
+        self._listener = TaskNotificationListener()
+        self._broker = _FakeBroker(self._listener)
+        self._task_href = self._vcd.href('/api/task/1')
+        self._client = self._vcd.get_client()
+        self._client.get_task_monitor().set_notification_listener(
+            self._listener)
+
+    def tearDown(self):
+        self._broker.join()
+        self._vcd.stop()
+
+    def _set_task_statuses(self, statuses, delay=0):
+        """Serve the task with one status per poll, notifying at the end.
+
+        The completion notification is published by the first poll, while
+        vCD still reports the first status, as happens when vCD publishes
+        it before the task's new status is visible to REST calls.
+        """
+        polls = []
+
+        def get_task(request):
+            polls.append(request)
+            if len(polls) == 1:
+                self._broker.publish_task_completion('urn:vcloud:task:1',
+                                                     delay)
+            status = statuses[min(len(polls), len(statuses)) - 1]
+            return 200, task(self._task_href, status), None
+
+        self._vcd.set_handler('GET', '/api/task/1', get_task)
+        return polls
+
+    def _get_task(self):
+        return _objectify_content(task(self._task_href, 'running'))
+
+    def test_0010_dispatch(self):
+        """Only task completion notifications are recorded."""
+        body = ('<vmext:Notification xmlns:vmext="%s" type="%%s">'
+                '<vmext:EntityLink type="vcloud:task" id="urn:vcloud:task:1"/>'
+                '</vmext:Notification>' % NSMAP['vmext'])
+        self.assertEqual(
+            self._listener.dispatch(
+                (body % 'com/vmware/vcloud/event/task/create').encode()), [])
+        self.assertEqual(
+            self._listener.dispatch(
+                (body % 'com/vmware/vcloud/event/task/fail').encode()), ['1'])
+
+    def test_0020_dispatch_ignores_entities(self):
+        """Notifications are parsed without resolving external entities."""
+        body = ('<!DOCTYPE n [<!ENTITY e SYSTEM "file:///etc/passwd">]>'
+                '<vmext:Notification xmlns:vmext="%s" type="%s">'
+                '<vmext:EntityLink type="vcloud:task" id="urn:vcloud:task:1">'
+                '&e;</vmext:EntityLink></vmext:Notification>' %
+                (NSMAP['vmext'], 'com/vmware/vcloud/event/task/complete'))
+        self.assertEqual(self._listener.dispatch(body.encode()), ['1'])
+
+    def test_0030_early_notification(self):
+        """A notification received during a poll ends the next wait."""
+        polls = self._set_task_statuses(['running', 'success'])
+        start = time.monotonic()
+        result = self._client.get_task_monitor().wait_for_success(
+            self._get_task(), poll_frequency=FixedPolling(5))
+        self.assertEqual(result.get('status'), 'success')
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(len(polls), 2)
+
+    def test_0040_notification_wakes_once(self):
+        """A notification does not end the waits after the one it ended."""
+        # The task fails, but the wait does not fail on any status.
+        polls = self._set_task_statuses(
+            ['running', 'error', 'error', 'error', 'success'])
+        start = time.monotonic()
+        result = self._client.get_task_monitor().wait_for_status(
+            self._get_task(), poll_frequency=0.25, fail_on_statuses=None)
+        self.assertEqual(result.get('status'), 'success')
+        self.assertEqual(len(polls), 5)
+        # Only the wait after the first poll ended early.
+        self.assertGreaterEqual(time.monotonic() - start, 0.7)
+
+    def test_0050_async_wait(self):
+        """Notifications end async waits."""
+        polls = self._set_task_statuses(['running', 'success'], delay=0.2)
+        start = time.monotonic()
+        result = run_coroutine(
+            self._client.get_task_monitor().async_wait_for_success(
+                self._get_task(), poll_frequency=FixedPolling(5)))
+        self.assertEqual(result.get('status'), 'success')
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(len(polls), 2)
+
+    def test_0060_wait_for_tasks(self):
+        """A notification does not end every later poll of batched waits."""
+        queries = []
+
+        def task_query(request):
+            queries.append(request)
+            if len(queries) == 1:
+                self._broker.publish_task_completion('urn:vcloud:task:1')
+            return 200, records('TaskRecord', [{
+                'id': task_id,
+                'href': self._task_href,
+                'status': 'running' if len(queries) == 1 else 'error'
+            } for _, task_id in get_filter(request)]), None
+
+        self._vcd.set_query('task', task_query)
+        future = self._client.get_task_monitor().wait_for_tasks(
+            [self._get_task()],
+            timeout=1,
+            poll_frequency=0.25,
+            fail_on_statuses=None)[0]
+        self.assertIsInstance(future.exception(timeout=5),
+                              TaskTimeoutException)
+        self.assertLessEqual(len(queries), 7)
+
+
+class TestTaskNotificationListener(unittest.TestCase):
+    """Test the markers of TaskNotificationListener."""
+
+    def test_0010_marker(self):
+        listener = TaskNotificationListener()
+        marker = listener.get_marker()
+        listener.notify(['urn:vcloud:task:1'])
+        self.assertTrue(listener.wait(['urn:vcloud:task:1'], 0, marker))
+        self.assertFalse(listener.wait(['urn:vcloud:task:2'], 0, marker))
+        self.assertFalse(listener.wait(['urn:vcloud:task:1'], 0))
+        self.assertFalse(listener.wait(['urn:vcloud:task:1'], 0,
+                                       listener.get_marker()))
+
+    def test_0020_max_remembered(self):
+        listener = TaskNotificationListener(max_remembered=2)
+        marker = listener.get_marker()
+        listener.notify(['1', '2', '3'])
+        self.assertFalse(listener.wait(['1'], 0, marker))
+        self.assertTrue(listener.wait(['3'], 0, marker))
+
+
+class _FakeAmqpConnection(object):
+    """A connection delivering messages, then failing with an error."""
+
+    def __init__(self, bodies, error=None):
+        self.is_open = True
+        self._bodies = bodies
+        self._error = error
+
+    def channel(self):
+        return self
+
+    def queue_declare(self, **kwargs):
+        return _FakeFrame()
+
+    def queue_bind(self, **kwargs):
+        pass
+
+    def consume(self, queue, auto_ack, inactivity_timeout):
+        for body in self._bodies:
+            yield 'method', None, body
+        if self._error is not None:
+            raise self._error
+        while True:
+            time.sleep(0.01)
+            yield None, None, None
+
+    def close(self):
+        self.is_open = False
+
+
+class _FakeFrame(object):
+    class method(object):
+        queue = 'queue'
+
+
+class _FakeAmqpListener(AmqpTaskNotificationListener):
+    """A listener whose connections are made by the given functions."""
+
+    def __init__(self, connects):
+        super(_FakeAmqpListener, self).__init__(
+            'localhost', 5672, 'guest', 'guest', 'vcd', reconnect_delay=0.01)
+        self._connects = connects
+
+    def _connect(self):
+        return self._connects.pop(0)()
+
+    def dispatch(self, body):
+        if body == b'unexpected':
+            raise KeyError('type')
+        return super(_FakeAmqpListener, self).dispatch(body)
+
+
+@unittest.skipIf(pika is None, 'pika is not installed')
+class TestAmqpTaskNotificationListener(unittest.TestCase):
+    """Test the consumer thread of AmqpTaskNotificationListener."""
+
+    def test_0010_recovers_from_errors(self):
+        """Errors are logged, and the listener reconnects after them."""
+        def fail():
+            raise OSError('connection refused')
+
+        listener = _FakeAmqpListener([
+            fail, lambda: _FakeAmqpConnection(
+                [b'unexpected', _notification('urn:vcloud:task:1')],
+                ConnectionResetError()),
+            lambda: _FakeAmqpConnection([_notification('urn:vcloud:task:2')])
+        ])
+        marker = listener.get_marker()
+        with self.assertLogs('pyvcloud.vcd.amqp', 'WARNING') as logs:
+            listener.start()
+            try:
+                self.assertTrue(
+                    listener.wait(['urn:vcloud:task:2'], 5, marker))
+            finally:
+                listener.stop()
+        self.assertTrue(listener.wait(['urn:vcloud:task:1'], 0, marker))
+        self.assertEqual(len(logs.records), 3)
+        self.assertTrue(all(record.exc_info for record in logs.records))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import unittest
+
+from unit_tests.fake_vcd import FakeVcd
+from unit_tests.fake_vcd import NS
+
+ORG = ('<Org xmlns="%s" name="org">%s</Org>' % (NS, ''.join(
+    '<Link rel="down" name="vdc%d" href="https://vcd/api/vdc/%d"/>' % (i, i)
+    for i in range(100)))).encode()
+
+
+class TestTransferStats(unittest.TestCase):
+    """Test response compression and its statistics."""
+
+    def setUp(self):
+        self._vcd = FakeVcd().start()
+        self._encodings = []
+
+        def get_org(request):
+            # Compress like vCD, if the client accepts gzip.
+            encoding = request.headers.get('Accept-Encoding', '')
+            self._encodings.append(encoding)
+            if 'gzip' in encoding:
+                return 200, gzip.compress(ORG), {'Content-Encoding': 'gzip'}
+            return 200, ORG, None
+
+        self._vcd.set_handler('GET', '/api/org/1', get_org)
+
+    def tearDown(self):
+        self._vcd.stop()
+
+    def _get_stats(self, client):
+        client.reset_transfer_stats()
+        org = client.get_resource(self._vcd.href('/api/org/1'))
+        self.assertEqual(len(org.Link), 100)
+        return client.get_transfer_stats()
+
+    def test_0010_compressed(self):
+        """Responses are compressed by default."""
+        stats = self._get_stats(self._vcd.get_client())
+        self.assertIn('gzip', self._encodings[0])
+        self.assertEqual(stats['compressed_responses'], 1)
+        self.assertEqual(stats['content_bytes'], len(ORG))
+        self.assertEqual(stats['wire_bytes'], len(gzip.compress(ORG)))
+        self.assertGreater(stats['compression_ratio'], 5)
+
+    def test_0020_uncompressed(self):
+        """Client(compression=False) asks for uncompressed responses."""
+        stats = self._get_stats(self._vcd.get_client(compression=False))
+        self.assertEqual(self._encodings, ['identity'])
+        self.assertEqual(stats['compressed_responses'], 0)
+        self.assertEqual(stats['wire_bytes'], len(ORG))
+        self.assertEqual(stats['compression_ratio'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
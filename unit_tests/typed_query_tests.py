@@ -0,0 +1,219 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+import urllib.parse
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from unit_tests.fake_vcd import FakeVcd
+from unit_tests.fake_vcd import records
+
+from pyvcloud.vcd.client import QueryResultFormat
+
+
+def _to_tuple(element):
+    return (element.tag, dict(element.attrib), element.text,
+            [_to_tuple(child) for child in element.iterchildren()])
+
+
+class TestTypedQuery(unittest.TestCase):
+    """Test typed queries against a fake vCD."""
+
+    def setUp(self):
+        self._vcd = FakeVcd().start()
+        self._pages = {}
+        self._vcd.set_query('vm', self._get_page)
+        self._client = self._vcd.get_client()
+
+    def tearDown(self):
+        self._vcd.stop()
+
+    def _get_page(self, request):
+        params = urllib.parse.parse_qs(
+            urllib.parse.urlsplit(request.path).query)
+        return 200, self._pages[params['page'][0]], None
+
+    def _set_pages(self, pages):
+        """Serve pages of VMRecords.
+
+        :param list pages: one tuple (attributes, children) per page, as
+            taken by fake_vcd.records().
+        """
+        for number, (attributes, children) in enumerate(pages, 1):
+            next_page_href = None
+            if number < len(pages):
+                next_page_href = self._vcd.href(
+                    '/api/query/vm?format=records&page=%d' % (number + 1))
+            self._pages[str(number)] = records(
+                'VMRecord', attributes, children, next_page_href)
+
+    def _set_prefetch_pages(self, count, page_size=2):
+        """Serve count full pages of VMRecords with their total."""
+        self._set_pages([([{
+            'name': 'vm%d' % (page * page_size + i)
+        } for i in range(page_size)], None) for page in range(count)])
+        for number, page in self._pages.items():
+            self._pages[number] = page.replace(
+                b'<QueryResultRecords ',
+                b'<QueryResultRecords total="%d" pageSize="%d" ' %
+                (count * page_size, page_size), 1)
+
+    def _query(self, **kwargs):
+        return self._client.get_typed_query(
+            'vm', query_result_format=QueryResultFormat.RECORDS, **kwargs)
+
+    def test_0010_streaming_parity(self):
+        """Streamed records are the same as buffered ones."""
+        self._set_pages([
+            ([{'name': 'vm1'}, {'name': 'vm2'}],
+             ['<Metadata><Entry key="k">v</Entry></Metadata>', '']),
+            ([{'name': 'vm3'}, {'name': 'vm4'}], ['text', '5']),
+        ])
+        buffered = list(self._query().execute())
+        # Small chunks split records over several chunks.
+        for chunk_size in [None, 7]:
+            query = self._query(streaming=True)
+            if chunk_size is not None:
+                query._STREAM_CHUNK_SIZE = chunk_size
+            streamed = list(query.execute())
+            self.assertEqual([r.get('name') for r in streamed],
+                             ['vm1', 'vm2', 'vm3', 'vm4'])
+            for buffered_record, streamed_record in zip(buffered, streamed):
+                self.assertIs(type(streamed_record), type(buffered_record))
+                self.assertEqual(_to_tuple(streamed_record),
+                                 _to_tuple(buffered_record))
+            self.assertEqual(streamed[0].Metadata.Entry.get('key'), 'k')
+
+    def _record_page_fetches(self, query):
+        """Record the thread and session each page of query is fetched on.
+
+        :return: one tuple (thread, session) per fetched page.
+
+        :rtype: list
+        """
+        fetches = []
+        get_page = query._get_page
+
+        def record_fetch(page_uri):
+            fetches.append((threading.current_thread(),
+                            self._client._get_session()))
+            return get_page(page_uri)
+
+        query._get_page = record_fetch
+        return fetches
+
+    def test_0015_prefetch(self):
+        """Prefetched pages give records in order on thread sessions."""
+        self._set_prefetch_pages(5)
+        query = self._query(page_size=2, prefetch_workers=3)
+        fetches = self._record_page_fetches(query)
+        self.assertEqual([r.get('name') for r in query.execute()],
+                         ['vm%d' % i for i in range(10)])
+        self.assertEqual(self._vcd.count('GET', '/api/query/vm'), 5)
+        self.assertEqual(len(fetches), 5)
+        self.assertIs(fetches[0][1], self._client._session)
+        for thread, session in fetches[1:]:
+            self.assertIsNot(thread, threading.current_thread())
+            self.assertIsNot(session, self._client._session)
+        self.assertIs(self._client._get_session(), self._client._session)
+
+    def test_0016_prefetch_stopped_early(self):
+        """Stopping a prefetch shuts its workers down."""
+        self._set_prefetch_pages(10)
+        query = self._query(page_size=2, prefetch_workers=2)
+        fetches = self._record_page_fetches(query)
+        results = query.execute()
+        # The third record is on the second page, fetched by a worker.
+        self.assertEqual([next(results).get('name') for _ in range(3)],
+                         ['vm0', 'vm1', 'vm2'])
+        results.close()
+        workers = set(thread for thread, _ in fetches[1:])
+        self.assertGreater(len(workers), 0)
+        for thread in workers:
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+        # Only the first two pages and the pages in flight were fetched.
+        self.assertLessEqual(self._vcd.count('GET', '/api/query/vm'), 4)
+
+    def _set_vm_pages(self):
+        self._set_pages([
+            ([{'name': 'vm1', 'numberOfCpus': '2', 'isDeployed': 'true',
+               'cpuSpeedMhz': '2400.5'},
+              {'name': 'vm2', 'isDeployed': 'false'}], None),
+            ([{'name': 'vm3', 'numberOfCpus': '4', 'cpuSpeedMhz': '1000'}],
+             None),
+        ])
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_0020_to_columns(self):
+        """Columns get default and overridden dtypes."""
+        self._set_vm_pages()
+        columns = self._query().to_columns()
+        self.assertEqual(list(columns),
+                         ['name', 'numberOfCpus', 'isDeployed',
+                          'cpuSpeedMhz'])
+        self.assertEqual(columns['name'].dtype, object)
+        self.assertEqual(list(columns['name']), ['vm1', 'vm2', 'vm3'])
+        # A well-known integer field with a missing value.
+        self.assertEqual(columns['numberOfCpus'].dtype, numpy.float64)
+        self.assertEqual(columns['numberOfCpus'][0], 2)
+        self.assertTrue(numpy.isnan(columns['numberOfCpus'][1]))
+        self.assertEqual(list(columns['isDeployed']),
+                         ['true', 'false', None])
+
+        columns = self._query().to_columns(dtypes={
+            'name': str,
+            'isDeployed': bool,
+            'cpuSpeedMhz': 'float32',
+            'numberOfCpus': object
+        })
+        self.assertEqual(columns['name'].dtype.kind, 'U')
+        self.assertEqual(list(columns['name']), ['vm1', 'vm2', 'vm3'])
+        self.assertEqual(list(columns['isDeployed']), [True, False, False])
+        self.assertEqual(columns['cpuSpeedMhz'].dtype, numpy.float32)
+        self.assertAlmostEqual(columns['cpuSpeedMhz'][0], 2400.5)
+        self.assertTrue(numpy.isnan(columns['cpuSpeedMhz'][1]))
+        self.assertEqual(list(columns['numberOfCpus']), ['2', None, '4'])
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_0030_to_columns_fields(self):
+        """Requested fields missing from every record give full columns."""
+        self._set_vm_pages()
+        columns = self._query(fields='name,numberOfCpus,status').to_columns(
+            dtypes={'status': str})
+        self.assertEqual(list(columns), ['name', 'numberOfCpus', 'status'])
+        self.assertEqual(list(columns['status']), ['', '', ''])
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_0040_to_columns_compact(self):
+        """Compact queries give the same columns as element queries."""
+        self._set_vm_pages()
+        for fields in [None, 'name,numberOfCpus']:
+            columns = self._query(fields=fields).to_columns()
+            compact_columns = self._query(fields=fields,
+                                          compact=True).to_columns()
+            self.assertEqual(list(compact_columns), list(columns))
+            for name, array in columns.items():
+                numpy.testing.assert_array_equal(compact_columns[name],
+                                                 array)
+
+
+if __name__ == '__main__':
+    unittest.main()
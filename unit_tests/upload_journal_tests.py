@@ -0,0 +1,70 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from pyvcloud.vcd.upload_journal import UploadJournal
+
+KEY = 'key'
+URI = 'https://vcd.example.com/transfer/1/disk.vmdk'
+
+
+class TestUploadJournal(unittest.TestCase):
+    """Test the on-disk journal of catalog uploads."""
+
+    def setUp(self):
+        self._dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._dir, 'journal.json')
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def _get_file_confirmed_bytes(self):
+        return UploadJournal(self._path).get_confirmed_bytes(KEY, URI)
+
+    def test_0010_confirmations_batched(self):
+        """Confirmed bytes are written once per flush interval."""
+        journal = UploadJournal(self._path, flush_interval=60)
+        journal.start(KEY, 'https://vcd.example.com/api/media/1')
+        for confirmed_bytes in range(100, 1100, 100):
+            journal.confirm(KEY, URI, confirmed_bytes)
+        self.assertEqual(journal.get_confirmed_bytes(KEY, URI), 1000)
+        self.assertEqual(self._get_file_confirmed_bytes(), 0)
+        journal.flush()
+        self.assertEqual(self._get_file_confirmed_bytes(), 1000)
+
+    def test_0020_confirmations_written(self):
+        """Confirmed bytes are written once the flush interval passed."""
+        journal = UploadJournal(self._path, flush_interval=0)
+        journal.start(KEY, 'https://vcd.example.com/api/media/1')
+        journal.confirm(KEY, URI, 100)
+        self.assertEqual(self._get_file_confirmed_bytes(), 100)
+
+    def test_0030_remove_discards_confirmations(self):
+        """Confirmations of a removed upload are not written."""
+        journal = UploadJournal(self._path, flush_interval=60)
+        journal.start(KEY, 'https://vcd.example.com/api/media/1')
+        journal.confirm(KEY, URI, 100)
+        journal.remove(KEY)
+        journal.flush()
+        self.assertIsNone(UploadJournal(self._path).load(KEY))
+        self.assertEqual(journal.get_confirmed_bytes(KEY, URI), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
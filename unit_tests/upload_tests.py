@@ -0,0 +1,239 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import io
+import os
+import re
+import shutil
+import tarfile
+import tempfile
+import unittest
+
+from unit_tests.fake_vcd import error
+from unit_tests.fake_vcd import FakeVcd
+from unit_tests.fake_vcd import NS
+
+from pyvcloud.vcd.client import EntityType
+from pyvcloud.vcd.client import NSMAP
+from pyvcloud.vcd.exceptions import UploadException
+from pyvcloud.vcd.org import Org
+
+# Neither divides the size of the uploaded files.
+CHUNK_SIZE = 300
+FILE_SIZE = 1000
+PART_SIZE = 700
+
+
+def _get_ovf(references):
+    return ('<Envelope xmlns="{0}" xmlns:ovf="{0}"><References>{1}'
+            '</References></Envelope>').format(NSMAP['ovf'], references)
+
+
+class TestUpload(unittest.TestCase):
+    """Test uploads of catalog items to transfer uris."""
+
+    def setUp(self):
+        self._vcd = FakeVcd().start()
+        self._client = self._vcd.get_client()
+        self._dir = tempfile.mkdtemp()
+        self._vcd.set_response(
+            'GET', '/api/org/1',
+            '<Org xmlns="%s" name="org" href="%s"><Link rel="down" type="%s" '
+            'name="catalog" href="%s"/></Org>' %
+            (NS, self._vcd.href('/api/org/1'), EntityType.CATALOG.value,
+             self._vcd.href('/api/catalog/1')))
+        self._vcd.set_response(
+            'GET', '/api/catalog/1',
+            '<Catalog xmlns="%s" name="catalog" href="%s">'
+            '<Link rel="add" type="%s" href="%s"/>'
+            '<Link rel="add" type="%s" href="%s"/></Catalog>' %
+            (NS, self._vcd.href('/api/catalog/1'), EntityType.MEDIA.value,
+             self._vcd.href('/api/catalog/1/media'),
+             EntityType.UPLOAD_VAPP_TEMPLATE_PARAMS.value,
+             self._vcd.href('/api/catalog/1/templates')))
+        self._org = Org(
+            self._client,
+            resource=self._client.get_resource(self._vcd.href('/api/org/1')))
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+        self._vcd.stop()
+
+    def _set_entity(self, path, tag, file_names):
+        """Serve an entity whose files are uploaded to /transfer/<name>."""
+        entity_href = self._vcd.href('/api/%s/1' % tag.lower())
+        self._vcd.set_response(
+            'POST', path,
+            '<CatalogItem xmlns="%s"><Entity href="%s"/></CatalogItem>' %
+            (NS, entity_href))
+        files = ''.join(
+            '<File name="%s"><Link rel="upload:default" href="%s"/></File>' %
+            (name, self._vcd.href('/transfer/' + name))
+            for name in file_names)
+        self._vcd.set_response(
+            'GET', '/api/%s/1' % tag.lower(),
+            '<%s xmlns="%s" href="%s"><Files>%s</Files></%s>' %
+            (tag, NS, entity_href, files, tag))
+
+    def _record_chunks(self, name):
+        """Record the chunks uploaded to /transfer/<name>.
+
+        :return: a list to which (start, end, total size, body) tuples of
+            uploaded chunks are appended.
+
+        :rtype: list
+        """
+        chunks = []
+
+        def put_chunk(request):
+            start, end, size = map(int, re.match(
+                r'bytes (\d+)-(\d+)/(\d+)$',
+                request.headers['Content-Range']).groups())
+            chunks.append((start, end, size, request.body))
+            return 200, b'', None
+
+        self._vcd.set_handler('PUT', '/transfer/' + name, put_chunk)
+        return chunks
+
+    def _get_chunks(self, contents, part_sizes=None):
+        """Return the chunks contents is expected to be uploaded in.
+
+        Chunks never span two parts of a file stored in parts.
+        """
+        if part_sizes is None:
+            part_sizes = [len(contents)]
+        chunks = []
+        part_start = 0
+        for part_size in part_sizes:
+            part_end = part_start + part_size
+            for start in range(part_start, part_end, CHUNK_SIZE):
+                end = min(start + CHUNK_SIZE, part_end)
+                chunks.append((start, end - 1, len(contents),
+                               contents[start:end]))
+            part_start = part_end
+        return chunks
+
+    def _write_ova(self, mode, members):
+        file_name = os.path.join(self._dir, 'template.ova')
+        with tarfile.open(file_name, mode) as ova:
+            for name, contents in members:
+                member = tarfile.TarInfo(name)
+                member.size = len(contents)
+                ova.addfile(member, io.BytesIO(contents))
+        return file_name
+
+    def test_0010_media(self):
+        """Media files are uploaded in order, in chunks of chunk_size."""
+        contents = os.urandom(FILE_SIZE)
+        file_name = os.path.join(self._dir, 'media.iso')
+        with open(file_name, 'wb') as f:
+            f.write(contents)
+        self._set_entity('/api/catalog/1/media', 'Media', ['file'])
+        chunks = self._record_chunks('file')
+        progress = []
+        self.assertEqual(
+            self._org.upload_media(
+                'catalog', file_name, chunk_size=CHUNK_SIZE,
+                callback=lambda written, size: progress.append(written)),
+            FILE_SIZE)
+        self.assertEqual(chunks, self._get_chunks(contents))
+        self.assertEqual(progress, [300, 600, 900, 1000])
+
+    def test_0020_media_workers(self):
+        """Media files uploaded concurrently are uploaded once, in chunks."""
+        contents = os.urandom(FILE_SIZE)
+        file_name = os.path.join(self._dir, 'media.iso')
+        with open(file_name, 'wb') as f:
+            f.write(contents)
+        self._set_entity('/api/catalog/1/media', 'Media', ['file'])
+        chunks = self._record_chunks('file')
+        progress = []
+        self.assertEqual(
+            self._org.upload_media(
+                'catalog', file_name, chunk_size=CHUNK_SIZE,
+                callback=lambda written, size: progress.append(written),
+                upload_workers=3),
+            FILE_SIZE)
+        self.assertEqual(sorted(chunks), self._get_chunks(contents))
+        self.assertEqual(progress, [300, 600, 900, 1000])
+
+    def test_0030_ova_members(self):
+        """Files are uploaded from the members of the ova holding them."""
+        disk = os.urandom(FILE_SIZE)
+        split_disk = os.urandom(FILE_SIZE)
+        ovf = _get_ovf(
+            '<File ovf:href="disk.vmdk" ovf:id="file1" ovf:size="%d"/>'
+            '<File ovf:href="split.vmdk" ovf:id="file2" ovf:size="%d" '
+            'ovf:chunkSize="%d"/>' % (FILE_SIZE, FILE_SIZE,
+                                      PART_SIZE)).encode()
+        # vCD already lists the referenced files, the descriptor is not
+        # sent again.
+        self._set_entity('/api/catalog/1/templates', 'VAppTemplate',
+                         ['descriptor.ovf', 'disk.vmdk', 'split.vmdk'])
+        for mode in ['w', 'w:gz']:
+            for upload_workers in [1, 3]:
+                file_name = self._write_ova(mode, [
+                    ('descriptor.ovf', ovf), ('disk.vmdk', disk),
+                    ('split.vmdk.000000000', split_disk[:PART_SIZE]),
+                    ('split.vmdk.000000001', split_disk[PART_SIZE:])
+                ])
+                disk_chunks = self._record_chunks('disk.vmdk')
+                split_disk_chunks = self._record_chunks('split.vmdk')
+                self.assertEqual(
+                    self._org.upload_ovf(
+                        'catalog', file_name, chunk_size=CHUNK_SIZE,
+                        upload_workers=upload_workers),
+                    len(ovf) + 2 * FILE_SIZE)
+                self.assertEqual(sorted(disk_chunks), self._get_chunks(disk))
+                self.assertEqual(
+                    sorted(split_disk_chunks),
+                    self._get_chunks(split_disk,
+                                     [PART_SIZE, FILE_SIZE - PART_SIZE]))
+
+    def test_0040_ovf_entities_not_resolved(self):
+        """Entities of the descriptor are sent unresolved."""
+        secret_file_name = os.path.join(self._dir, 'secret')
+        with open(secret_file_name, 'w') as f:
+            f.write('secret')
+        ovf = _get_ovf('<File ovf:href="disk.vmdk" ovf:id="file1" '
+                       'ovf:size="0"/>').replace(
+                           '<References>', '<Info>&secret;</Info>'
+                           '<References>')
+        ovf = '<!DOCTYPE Envelope [<!ENTITY secret SYSTEM "%s">]>%s' % (
+            'file://' + secret_file_name, ovf)
+        file_name = self._write_ova('w', [('descriptor.ovf', ovf.encode()),
+                                          ('disk.vmdk', b'')])
+        self._set_entity('/api/catalog/1/templates', 'VAppTemplate',
+                         ['descriptor.ovf'])
+        descriptors = []
+
+        def put_descriptor(request):
+            descriptors.append(request.body)
+            # Fail the upload rather than wait for vCD to list the disk.
+            return error(400, 'Bad request')
+
+        self._vcd.set_handler('PUT', '/transfer/descriptor.ovf',
+                              put_descriptor)
+        with contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaises(UploadException):
+                self._org.upload_ovf('catalog', file_name)
+        self.assertEqual(len(descriptors), 1)
+        self.assertIn(b'<Info>&secret;</Info>', descriptors[0])
+        self.assertNotIn(b'>secret<', descriptors[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# VMware vCloud Director Python SDK
+# Copyright (c) 2018 VMware, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+from lxml import etree
+from unit_tests.fake_vcd import FakeVcd
+from unit_tests.fake_vcd import run_coroutine
+
+from pyvcloud.vcd.async_client import aiohttp
+from pyvcloud.vcd.async_client import AsyncClient
+from pyvcloud.vcd.client import _objectify_content
+from pyvcloud.vcd.exceptions import InternalServerException
+
+# Deeper than the 256 levels lxml accepts without huge_tree.
+DEEP_DOCUMENT = ('<a>' * 300 + '</a>' * 300).encode()
+
+
+class TestXmlParsing(unittest.TestCase):
+    """Test the shared parsers of vCD responses."""
+
+    def setUp(self):
+        fd, self._secret_path = tempfile.mkstemp()
+        with os.fdopen(fd, 'w') as f:
+            f.write('secret')
+
+    def tearDown(self):
+        os.unlink(self._secret_path)
+
+    def test_0010_external_entities_not_resolved(self):
+        document = ('<!DOCTYPE a [<!ENTITY e SYSTEM "file://%s">]>'
+                    '<a><b>&e;</b></a>' % self._secret_path).encode()
+        for as_object in [True, False]:
+            for huge_tree in [True, False]:
+                root = _objectify_content(document, as_object, huge_tree)
+                self.assertNotIn(b'secret', etree.tostring(root))
+
+    def test_0020_internal_entities_not_expanded(self):
+        document = (b'<!DOCTYPE a [<!ENTITY e "expanded">]>'
+                    b'<a><b>&e;</b></a>')
+        root = _objectify_content(document)
+        self.assertNotIn(b'expanded', etree.tostring(root))
+
+    def test_0030_huge_tree(self):
+        with self.assertRaises(etree.XMLSyntaxError):
+            _objectify_content(DEEP_DOCUMENT)
+        self.assertIsNotNone(_objectify_content(DEEP_DOCUMENT,
+                                                huge_tree=True))
+        self.assertIsNotNone(_objectify_content(DEEP_DOCUMENT, False,
+                                                huge_tree=True))
+
+    def test_0040_client_huge_tree(self):
+        """Client(huge_tree=True) parses responses with huge_tree."""
+        vcd = FakeVcd().start()
+        try:
+            vcd.set_response('GET', '/api/deep', DEEP_DOCUMENT)
+            uri = vcd.href('/api/deep')
+            with self.assertRaises(etree.XMLSyntaxError):
+                vcd.get_client().get_resource(uri)
+            self.assertIsNotNone(
+                vcd.get_client(huge_tree=True).get_resource(uri))
+        finally:
+            vcd.stop()
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_0050_async_client_huge_tree(self):
+        """Async clients parse responses and errors like their Client."""
+        vcd = FakeVcd().start()
+        try:
+            vcd.set_response('GET', '/api/deep', DEEP_DOCUMENT)
+            vcd.set_response('GET', '/api/deep/error', DEEP_DOCUMENT,
+                             status=500)
+
+            async def get(path):
+                async with AsyncClient(
+                        vcd.get_client(huge_tree=True)) as async_client:
+                    return await async_client.get_resource(vcd.href(path))
+
+            self.assertIsNotNone(run_coroutine(get('/api/deep')))
+            with self.assertRaises(InternalServerException) as cm:
+                run_coroutine(get('/api/deep/error'))
+            self.assertIsNotNone(cm.exception.vcd_error)
+        finally:
+            vcd.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()